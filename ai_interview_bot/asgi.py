@@ -3,4 +3,6 @@ from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'ai_interview_bot.settings')
 
+# Async views (e.g. the worker long-poll at tasks/wait/) run on the event loop here
+# instead of tying up a thread per waiting worker.
 application = get_asgi_application()
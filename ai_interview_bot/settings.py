@@ -33,11 +33,33 @@ REST_FRAMEWORK = {
         "django_filters.rest_framework.DjangoFilterBackend"
     ],
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "core.authentication.CachedJWTAuthentication",
     ],
 
 }
-EMAIL_BACKEND = "django.core.mail.backends.console.EmailBackend"
+# Process-local cache of authenticated users (see core.authentication)
+AUTH_USER_CACHE_SIZE = 10000
+AUTH_USER_CACHE_TTL = 60
+# Requests queue mail in the outbox; `manage.py send_queued_emails` delivers it (see core.mail)
+EMAIL_BACKEND = "core.mail.OutboxEmailBackend"
+EMAIL_OUTBOX_DELIVERY_BACKEND = "django.core.mail.backends.console.EmailBackend"
+# Domain used in password-reset links queued outside a request (bulk user imports)
+PASSWORD_RESET_DOMAIN = "localhost:8000"
+# Seconds an idle resumable answer upload is kept (see `manage.py cleanup_answer_uploads`)
+ANSWER_UPLOAD_TTL = 24 * 60 * 60
+# Django's defaults, with uploads too big for memory hashed on their way to disk (see core.uploads)
+FILE_UPLOAD_HANDLERS = [
+    "django.core.files.uploadhandler.MemoryFileUploadHandler",
+    "core.uploads.HashingFileUploadHandler",
+]
+# Transcription/scoring backend used by `manage.py process_audio_tasks`
+AUDIO_PROCESSING_BACKEND = "core.audio_backends.StubAudioBackend"
+# Interview question generation, run in background threads (see core.pregeneration)
+QUESTION_GENERATION_BACKEND = "core.question_backends.StubQuestionBackend"
+AI_QUESTIONS_PER_SESSION = 3
+QUESTION_PREGENERATION_THREADS = 4
+# Failed generations are retried on later polls until this many have failed
+QUESTION_GENERATION_MAX_ATTEMPTS = 3
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -72,6 +94,12 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        'TEST': {
+            # core's migrations don't create CustomUser, so tests build the schema from the models.
+            # A file rather than :memory: so concurrency tests get real cross-connection locking.
+            'NAME': BASE_DIR / 'test_db.sqlite3',
+            'MIGRATE': False,
+        },
     }
 }
 
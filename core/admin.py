@@ -2,9 +2,10 @@ from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as DefaultUserAdmin
 from django.utils.translation import gettext_lazy as _
 from .models import (CustomUser,Job, QuestionBank, Candidate, Resume, CandidateJobMapping,
-    InterviewSession, GeneratedQuestion, CandidateAnswer, AudioProcessingTask,
-    ErrorLog, ActivityLog, AppSettings, Employee)
+    InterviewSession, GeneratedQuestion, CandidateAnswer, AudioProcessingTask, WorkerHeartbeat,
+    ErrorLog, ActivityLog, AppSettings, Employee, Skill, OutboundEmail)
 from django.conf import settings
+from django.utils import timezone
 
 class CustomUserAdmin(DefaultUserAdmin):
     model = CustomUser
@@ -108,7 +109,37 @@ admin.site.register(Employee)
 admin.site.register(InterviewSession)
 admin.site.register(GeneratedQuestion)
 admin.site.register(CandidateAnswer)
-admin.site.register(AudioProcessingTask)
+admin.site.register(WorkerHeartbeat)
 admin.site.register(ErrorLog)
 admin.site.register(ActivityLog)
-admin.site.register(AppSettings)
\ No newline at end of file
+admin.site.register(AppSettings)
+admin.site.register(Skill)
+
+
+@admin.register(AudioProcessingTask)
+class AudioProcessingTaskAdmin(admin.ModelAdmin):
+    list_display = ("id", "interview_session", "task_status", "attempts", "available_at", "worker_id")
+    list_filter = ("task_status",)
+    actions = ["requeue_tasks"]
+
+    @admin.action(description="Re-queue selected tasks with a fresh retry budget")
+    def requeue_tasks(self, request, queryset):
+        updated = queryset.update(
+            task_status="pending", attempts=0, available_at=timezone.now(),
+            worker_id="", lease_expires_at=None, last_error="",
+        )
+        self.message_user(request, f"Re-queued {updated} task(s).")
+
+
+@admin.register(OutboundEmail)
+class OutboundEmailAdmin(admin.ModelAdmin):
+    list_display = ("id", "subject", "status", "attempts", "available_at", "sent_at")
+    list_filter = ("status",)
+    actions = ["requeue_emails"]
+
+    @admin.action(description="Re-queue selected emails with a fresh retry budget")
+    def requeue_emails(self, request, queryset):
+        updated = queryset.update(
+            status="pending", attempts=0, available_at=timezone.now(), lease_expires_at=None, last_error="",
+        )
+        self.message_user(request, f"Re-queued {updated} email(s).")
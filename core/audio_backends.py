@@ -0,0 +1,38 @@
+import hashlib
+from typing import NamedTuple
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+
+class AudioResult(NamedTuple):
+    transcript: str
+    score: float
+    feedback: str
+
+
+class BaseAudioBackend:
+    """
+    Turns one recorded answer into a transcript, a 0-10 score and feedback.
+    Backends run inside worker processes, so they must not touch the DB.
+    """
+
+    def process(self, audio_name, question_text):
+        raise NotImplementedError
+
+
+class StubAudioBackend(BaseAudioBackend):
+    """Deterministic local backend for development and tests; no audio is decoded."""
+
+    def process(self, audio_name, question_text):
+        digest = hashlib.sha256(f"{audio_name}\n{question_text}".encode()).hexdigest()
+        score = int(digest[:4], 16) % 101 / 10
+        return AudioResult(
+            transcript=f"[stub transcript {digest[:12]}] Answer to: {question_text}",
+            score=score,
+            feedback=f"Stub evaluation: scored {score}/10.",
+        )
+
+
+def get_audio_backend(path=None):
+    return import_string(path or settings.AUDIO_PROCESSING_BACKEND)()
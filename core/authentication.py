@@ -0,0 +1,104 @@
+"""
+JWT authentication that usually resolves the token's user without a query.
+
+simplejwt's JWTAuthentication loads the user row on every request.
+CachedJWTAuthentication keeps recently seen users in a bounded, process-local
+LRU cache for `AUTH_USER_CACHE_TTL` seconds. CustomUser saves and deletes in
+this process drop the user's entry (see core.signals), so deactivation, role
+and password changes apply on the next request here. Changes made by other
+processes or through QuerySet.update() are picked up when the entry expires.
+The cache holds field values, not model instances, and every request gets a
+new instance built from them, so nothing set on one request's user (cached
+relations included) is seen by another.
+"""
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+
+class UserCache:
+
+    def __init__(self, max_users=10000, ttl=60):
+        self.max_users = max_users
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        # str(user id) -> (loaded at, entry); token claims and pks may differ in type
+        self._users = OrderedDict()
+        # bumped on every invalidation so a load racing with one isn't cached
+        self._generation = 0
+
+    @property
+    def generation(self):
+        return self._generation
+
+    def get(self, user_id):
+        key, now = str(user_id), time.monotonic()
+        with self._lock:
+            entry = self._users.get(key)
+            if entry is None:
+                return None
+            if now - entry[0] > self.ttl:
+                del self._users[key]
+                return None
+            self._users.move_to_end(key)
+            return entry[1]
+
+    def set(self, user_id, entry, generation):
+        """Cache `entry` unless an invalidation happened since `generation` was read."""
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._users[str(user_id)] = (time.monotonic(), entry)
+            self._users.move_to_end(str(user_id))
+            while len(self._users) > self.max_users:
+                self._users.popitem(last=False)
+
+    def user_changed(self, user_id):
+        with self._lock:
+            self._generation += 1
+            self._users.pop(str(user_id), None)
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._users.clear()
+
+
+user_cache = UserCache(
+    max_users=getattr(settings, "AUTH_USER_CACHE_SIZE", 10000),
+    ttl=getattr(settings, "AUTH_USER_CACHE_TTL", 60),
+)
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as e:
+            raise InvalidToken(_("Token contained no recognizable user identification")) from e
+
+        cached = user_cache.get(user_id)
+        if cached is None:
+            generation = user_cache.generation
+            # Runs the full set of checks, so only valid users are cached
+            user = super().get_user(validated_token)
+            names = [field.attname for field in user._meta.concrete_fields]
+            user_cache.set(user_id, (user._state.db, names, tuple(getattr(user, name) for name in names)), generation)
+        else:
+            db, names, values = cached
+            user = self.user_model.from_db(db, names, values)
+            if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+                raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+            if api_settings.CHECK_REVOKE_TOKEN and (
+                validated_token.get(api_settings.REVOKE_TOKEN_CLAIM) != get_md5_hash_password(user.password)
+            ):
+                raise AuthenticationFailed(_("The user's password has been changed."), code="password_changed")
+        return user
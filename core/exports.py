@@ -0,0 +1,145 @@
+"""
+Streaming CSV/NDJSON exports of candidates, applications and interview results.
+
+Each export is one `values_list()` query with its related columns joined in
+SQL, read through `.iterator()` (a server-side cursor where the backend has
+them) and encoded a chunk of rows at a time, so memory stays flat whatever
+the table size.
+"""
+import csv
+import datetime
+import io
+import json
+
+from django.utils import timezone
+
+from .models import Candidate, CandidateJobMapping, InterviewSession
+
+FORMATS = {"csv": "text/csv", "ndjson": "application/x-ndjson"}
+# Rows fetched per cursor round trip and encoded per response chunk
+CHUNK_SIZE = 2000
+
+
+class Export:
+    """A named export: base queryset, (header, lookup) columns and exact-match filters."""
+
+    def __init__(self, queryset, columns, filters=()):
+        self.queryset = queryset
+        self.columns = columns
+        # query param -> lookup
+        self.filters = dict(filters)
+
+    @property
+    def headers(self):
+        return [header for header, _ in self.columns]
+
+    def rows(self, params=None):
+        params = params or {}
+        conditions = {
+            lookup: params[name] for name, lookup in self.filters.items() if params.get(name) not in (None, "")
+        }
+        return (
+            self.queryset.filter(**conditions)
+            .values_list(*(lookup for _, lookup in self.columns))
+            .iterator(chunk_size=CHUNK_SIZE)
+        )
+
+
+EXPORTS = {
+    "candidates": Export(
+        Candidate.objects.order_by("id"),
+        [
+            ("id", "id"),
+            ("full_name", "full_name"),
+            ("email", "email"),
+            ("phone", "phone"),
+            ("experience_years", "experience_years"),
+            ("status", "status"),
+            ("created_at", "created_at"),
+        ],
+        filters=[("status", "status"), ("experience_years", "experience_years")],
+    ),
+    "applications": Export(
+        CandidateJobMapping.objects.order_by("id"),
+        [
+            ("id", "id"),
+            ("candidate_id", "candidate_id"),
+            ("candidate_name", "candidate__full_name"),
+            ("candidate_email", "candidate__email"),
+            ("job_id", "job_id"),
+            ("job_code", "job__job_code"),
+            ("job_title", "job__job_title"),
+            ("status", "status"),
+            ("applied_at", "applied_at"),
+        ],
+        filters=[("status", "status"), ("job", "job_id"), ("candidate", "candidate_id")],
+    ),
+    "sessions": Export(
+        InterviewSession.objects.order_by("id"),
+        [
+            ("id", "id"),
+            ("candidate_id", "candidate_id"),
+            ("candidate_name", "candidate__full_name"),
+            ("candidate_email", "candidate__email"),
+            ("job_id", "job_id"),
+            ("job_code", "job__job_code"),
+            ("job_title", "job__job_title"),
+            ("session_status", "session_status"),
+            ("started_at", "started_at"),
+            ("ended_at", "ended_at"),
+            ("total_score", "total_score"),
+        ],
+        filters=[("session_status", "session_status"), ("job", "job_id"), ("candidate", "candidate_id")],
+    ),
+}
+
+
+
+def _cell(value):
+    # Same timestamp format as DRF's DateTimeField in the JSON APIs
+    if isinstance(value, datetime.datetime):
+        if timezone.is_aware(value):
+            value = timezone.localtime(value)
+        value = value.isoformat()
+        return value[:-6] + "Z" if value.endswith("+00:00") else value
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    return value
+
+
+def _chunks(rows, encode_chunk):
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= CHUNK_SIZE:
+            yield encode_chunk(chunk)
+            chunk = []
+    if chunk:
+        yield encode_chunk(chunk)
+
+
+def csv_stream(headers, rows):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def encode(chunk):
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows([_cell(value) for value in row] for row in chunk)
+        return buffer.getvalue().encode()
+
+    yield encode([headers])
+    yield from _chunks(rows, encode)
+
+
+def ndjson_stream(headers, rows):
+    def encode(chunk):
+        return "".join(json.dumps(dict(zip(headers, row)), default=_cell) + "\n" for row in chunk).encode()
+
+    yield from _chunks(rows, encode)
+
+
+def stream(export, file_format, params=None):
+    """Encoded chunks of `export` in `file_format`, for a StreamingHttpResponse."""
+    writer = csv_stream if file_format == "csv" else ndjson_stream
+    return writer(export.headers, export.rows(params))
@@ -0,0 +1,177 @@
+"""
+Fast read-only path for list endpoints.
+
+A ModelSerializer spends most of a large list walking its fields per object:
+attribute lookups on model instances, `to_representation` for values that are
+already JSON-ready, SkipField checks. `ValuesProjection` compiles a
+serializer class once into (output name, `.values()` lookup, converter)
+columns and renders plain `.values()` rows with them. Converters are chosen
+per column up front: none for fields DRF passes through unchanged, the DRF
+field's own `to_representation` where it formats (decimals, UUIDs), an
+equivalent with the timezone looked up once per response for datetimes, and
+a storage URL builder for files, so the JSON is the same as the serializer's.
+
+Serializers using anything else (method fields, nested or dotted sources,
+custom `to_representation`) don't compile, and `FastListMixin` falls back to
+the regular serializer for them.
+"""
+import functools
+
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import fields as drf_fields
+from rest_framework import relations, serializers
+from rest_framework.response import Response
+from rest_framework.settings import ISO_8601, api_settings
+
+# DRF fields whose to_representation returns database values unchanged
+PASSTHROUGH_FIELDS = (
+    drf_fields.BooleanField,
+    drf_fields.CharField,
+    drf_fields.ChoiceField,
+    drf_fields.EmailField,
+    drf_fields.FloatField,
+    drf_fields.IntegerField,
+    drf_fields.JSONField,
+    drf_fields.SlugField,
+    drf_fields.URLField,
+)
+# DRF fields whose own to_representation is applied to the database value
+FORMATTED_FIELDS = (
+    drf_fields.DateField,
+    drf_fields.DateTimeField,
+    drf_fields.DecimalField,
+    drf_fields.DurationField,
+    drf_fields.TimeField,
+    drf_fields.UUIDField,
+)
+# BigAutoField pks; DRF >= 3.16 maps them to a field that may render as a string
+BIG_INTEGER_FIELD = getattr(drf_fields, "BigIntegerField", None)
+
+
+def _static(convert):
+    return lambda request: convert
+
+
+def _file_url(storage, use_url):
+    def bind(request):
+        def convert(name):
+            if not name:
+                return None
+            if not use_url:
+                return name
+            url = storage.url(name)
+            return request.build_absolute_uri(url) if request is not None else url
+        return convert
+    return bind
+
+
+def _datetime(field):
+    """DateTimeField.to_representation with the format and timezone resolved once per render."""
+    def bind(request):
+        output_format = getattr(field, "format", api_settings.DATETIME_FORMAT)
+        field_timezone = field.timezone if hasattr(field, "timezone") else field.default_timezone()
+        if output_format is None or output_format.lower() != ISO_8601 or field_timezone is None:
+            return field.to_representation
+
+        def convert(value):
+            if isinstance(value, str) or value.tzinfo is None:
+                return field.to_representation(value)
+            value = value.astimezone(field_timezone).isoformat()
+            return value[:-6] + "Z" if value.endswith("+00:00") else value
+        return convert
+    return bind
+
+
+def _column(field, model):
+    """(name, lookup, converter factory taking the request or None) for one field, or None if unsupported."""
+    if "." in field.source or field.source == "*":
+        return None
+    try:
+        model_field = model._meta.get_field(field.source)
+    except FieldDoesNotExist:
+        return None
+    if not model_field.concrete or model_field.many_to_many:
+        return None
+
+    name, lookup, field_class = field.field_name, model_field.attname, type(field)
+    if field_class is BIG_INTEGER_FIELD and not model_field.is_relation:
+        if getattr(field, "coerce_to_string", api_settings.COERCE_BIGINT_TO_STRING):
+            return name, lookup, _static(field.to_representation)
+        return name, lookup, None
+    if field_class in PASSTHROUGH_FIELDS and not model_field.is_relation:
+        return name, lookup, None
+    if field_class is drf_fields.DateTimeField and not model_field.is_relation:
+        return name, lookup, _datetime(field)
+    if field_class in FORMATTED_FIELDS and not model_field.is_relation:
+        return name, lookup, _static(field.to_representation)
+    if field_class is relations.PrimaryKeyRelatedField and model_field.many_to_one and field.pk_field is None:
+        # `<fk>_id` is the related pk itself
+        return name, lookup, None
+    if field_class in (drf_fields.FileField, drf_fields.ImageField):
+        return name, lookup, _file_url(model_field.storage, getattr(field, "use_url", True))
+    return None
+
+
+class ValuesProjection:
+
+    def __init__(self, columns):
+        self.columns = columns
+
+    @property
+    def lookups(self):
+        return [lookup for _, lookup, _ in self.columns]
+
+    def render(self, rows, request=None):
+        """Serializer-identical dicts for `rows`, an iterable of `.values(*self.lookups)` dicts."""
+        converters = [(name, lookup, bind and bind(request)) for name, lookup, bind in self.columns]
+        data = []
+        for row in rows:
+            item = {}
+            for name, lookup, convert in converters:
+                value = row[lookup]
+                item[name] = value if convert is None or value is None else convert(value)
+            data.append(item)
+        return data
+
+
+@functools.lru_cache(maxsize=None)
+def compile_projection(serializer_class):
+    """ValuesProjection for a ModelSerializer class, or None when it needs the regular path."""
+    if not issubclass(serializer_class, serializers.ModelSerializer):
+        return None
+    if serializer_class.to_representation is not serializers.Serializer.to_representation:
+        return None
+    serializer = serializer_class()
+    model = serializer.Meta.model
+    columns = []
+    for field in serializer._readable_fields:
+        column = _column(field, model)
+        if column is None:
+            return None
+        columns.append(column)
+    return ValuesProjection(columns)
+
+
+class FastListMixin:
+    """
+    list() through a compiled `.values()` projection of the view's serializer,
+    with the same filtering, pagination and JSON as ListModelMixin.list().
+    """
+
+    def list(self, request, *args, **kwargs):
+        projection = compile_projection(self.get_serializer_class())
+        if projection is None:
+            return super().list(request, *args, **kwargs)
+        queryset = self.filter_queryset(self.get_queryset())
+        lookups = projection.lookups
+        if self.paginator is not None and hasattr(self.paginator, "get_ordering"):
+            # Cursor pagination reads its position from the ordering columns of the rows
+            for ordering in self.paginator.get_ordering(request, queryset, self):
+                if ordering.lstrip("-") not in lookups:
+                    lookups = lookups + [ordering.lstrip("-")]
+        rows = queryset.values(*lookups)
+
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(projection.render(page, request))
+        return Response(projection.render(rows, request))
@@ -0,0 +1,90 @@
+import operator
+from functools import reduce
+
+import django_filters
+from django.db.models import Count, FloatField, Q, Value
+from django.db.models.functions import Coalesce
+from rest_framework.filters import SearchFilter
+
+from .models import Job, Resume
+from .search import resume_text_search
+from .skills import normalize_skills
+
+
+class ResumeSearchFilter(SearchFilter):
+    """
+    ?search= for resumes. The view's search_fields (candidate name/email)
+    keep their icontains lookups; parsed_text goes through the full-text
+    index instead of a LIKE scan. Results are annotated with `search_rank`
+    (lower is better) so the paginator can order by relevance.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        query = request.query_params.get(self.search_param, "")
+        terms = self.get_search_terms(request)
+        if not terms:
+            return queryset
+
+        field_match = reduce(operator.and_, [
+            reduce(operator.or_, [
+                Q(**{f"{field}__icontains": term}) for field in self.get_search_fields(view, request)
+            ], Q(pk__in=[]))
+            for term in terms
+        ])
+        text_match, rank = resume_text_search(query)
+        return queryset.filter(field_match | text_match).annotate(
+            search_rank=Coalesce(rank, Value(0.0), output_field=FloatField())
+        )
+
+
+class JobSearchFilter(SearchFilter):
+    """
+    ?search= for jobs. Each term goes through the view's search_fields as
+    usual, where skills match exactly ("=skills__name", so "java" never
+    finds "javascript"). On top of that the whole query, split on commas,
+    is matched exactly against skill names like ?skills=, so a multi-word
+    skill such as "machine learning" is found as one.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        if not self.get_search_terms(request):
+            return queryset
+        term_match = super().filter_queryset(request, queryset, view)
+        skill_match = filter_by_skills(queryset, "skills", request.query_params.get(self.search_param, ""))
+        return queryset.filter(Q(pk__in=term_match.values("pk")) | Q(pk__in=skill_match.values("pk")))
+
+
+def filter_by_skills(queryset, name, value):
+    """
+    ?skills=python,django keeps rows linked to *all* listed skills. Runs as
+    an indexed join on the skills many-to-many table, not a JSON text scan.
+    """
+    skills = normalize_skills(value.split(","))
+    if not skills:
+        return queryset
+    through = queryset.model.skills.through
+    owner = f"{queryset.model._meta.model_name}_id"
+    owners_with_all = (
+        through.objects.filter(skill__name__in=skills)
+        .values(owner)
+        .annotate(matched=Count("skill_id"))
+        .filter(matched=len(skills))
+        .values(owner)
+    )
+    return queryset.filter(pk__in=owners_with_all)
+
+
+class JobFilter(django_filters.FilterSet):
+    skills = django_filters.CharFilter(method=filter_by_skills)
+
+    class Meta:
+        model = Job
+        fields = ["experience_level", "skills"]
+
+
+class ResumeFilter(django_filters.FilterSet):
+    skills = django_filters.CharFilter(method=filter_by_skills)
+
+    class Meta:
+        model = Resume
+        fields = ["candidate", "skills"]
@@ -0,0 +1,318 @@
+"""
+Bulk import of Job, QuestionBank and user records from CSV or NDJSON.
+
+Input is read one line at a time and validated row by row with the API
+serializers. Valid rows are written in batches, one transaction and one
+bulk INSERT per batch. Jobs upsert on job_code. Invalid rows are reported
+by line number and never stop the import.
+"""
+import codecs
+import csv
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import django
+from django import db
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db import DatabaseError, transaction
+from rest_framework.exceptions import ValidationError
+from rest_framework.serializers import as_serializer_error
+
+from .mail import queue_password_reset_emails
+from .matching import skill_matcher
+from .models import Candidate, Job, QuestionBank
+from .near_duplicates import duplicate_questions
+from .question_pools import question_pools
+from .question_ranking import question_ranker
+from .serializers import JobImportSerializer, QuestionBankSerializer, UserImportSerializer
+from .skills import sync_skill_links
+
+User = get_user_model()
+
+FORMATS = ("csv", "ndjson")
+# Per-line errors kept in the report; the total is always counted
+MAX_REPORTED_ERRORS = 1000
+
+
+def guess_format(name="", content_type=""):
+    extension = os.path.splitext(name or "")[1].lower()
+    if extension == ".csv" or "csv" in content_type:
+        return "csv"
+    if extension in (".ndjson", ".jsonl") or "ndjson" in content_type or "jsonl" in content_type:
+        return "ndjson"
+    return None
+
+
+def _lines(stream):
+    decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+    for raw in iter(stream.readline, b""):
+        yield decoder.decode(raw)
+
+
+def read_records(stream, file_format):
+    """Yield (line number, row, error) from a binary stream; row is None when the line is unreadable."""
+    if file_format == "csv":
+        reader = csv.DictReader(_lines(stream))
+        try:
+            for row in reader:
+                if None in row:
+                    yield reader.line_num, None, "More values than header columns."
+                    continue
+                # Empty cells mean "not given", so model defaults apply
+                yield reader.line_num, {key: value for key, value in row.items() if value not in ("", None)}, None
+        except csv.Error as exc:
+            yield reader.line_num, None, f"Malformed CSV: {exc}"
+    elif file_format == "ndjson":
+        for line_no, line in enumerate(_lines(stream), start=1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError as exc:
+                yield line_no, None, f"Invalid JSON: {exc}"
+                continue
+            if not isinstance(row, dict):
+                yield line_no, None, "Expected a JSON object."
+                continue
+            yield line_no, row, None
+    else:
+        raise ValueError(f"Unknown format {file_format!r}; expected one of {', '.join(FORMATS)}.")
+
+
+class RecordImporter:
+    model = None
+    serializer_class = None
+    # CSV cells holding lists, written as JSON ("[...]") or separated by ";"
+    list_fields = ()
+
+    def __init__(self, user=None, batch_size=500):
+        self.user = user
+        self.batch_size = batch_size
+        self.report = {"created": 0, "updated": 0, "error_count": 0, "errors": []}
+        # Lines write() rejected in the batch being written
+        self._rejected = []
+
+    def run(self, records):
+        # One serializer validates every row, so its fields are built once
+        serializer = self.serializer_class()
+        batch = []
+        rows, started = 0, time.perf_counter()
+        for line_no, row, error in records:
+            rows += 1
+            if error is None:
+                try:
+                    validated_data = serializer.run_validation(self.prepare(row))
+                except ValidationError as exc:
+                    error = as_serializer_error(exc)
+                except ValueError as exc:
+                    error = f"Invalid list value: {exc}"
+                else:
+                    batch.append((line_no, self.build(validated_data)))
+                    if len(batch) >= self.batch_size:
+                        self._flush(batch)
+                        batch = []
+                    continue
+            self._error(line_no, error)
+        self._flush(batch)
+        if self.report["created"] or self.report["updated"]:
+            self.written()
+        elapsed = time.perf_counter() - started
+        self.report["rows"] = rows
+        self.report["elapsed_seconds"] = round(elapsed, 3)
+        self.report["rows_per_second"] = round(rows / elapsed, 1) if elapsed else None
+        return self.report
+
+    def prepare(self, row):
+        for field in self.list_fields:
+            value = row.get(field)
+            if isinstance(value, str):
+                value = value.strip()
+                row[field] = json.loads(value) if value.startswith("[") else [v.strip() for v in value.split(";") if v.strip()]
+        return row
+
+    def build(self, validated_data):
+        return self.model(**validated_data)
+
+    def _flush(self, batch):
+        if not batch:
+            return
+        self._rejected = []
+        try:
+            with transaction.atomic():
+                created, updated = self.write(batch)
+        except DatabaseError as exc:
+            # Every line of the batch gets this one error, rejected ones included
+            for line_no, _ in batch:
+                self._error(line_no, f"Batch not written: {exc}")
+            return
+        finally:
+            rejected, self._rejected = self._rejected, []
+        for line_no, error in rejected:
+            self._error(line_no, error)
+        self.report["created"] += created
+        self.report["updated"] += updated
+
+    def _error(self, line_no, error):
+        self.report["error_count"] += 1
+        if len(self.report["errors"]) < MAX_REPORTED_ERRORS:
+            self.report["errors"].append({"line": line_no, "errors": error})
+
+    def _reject(self, line_no, error):
+        """From write(): skip this line; reported once the batch commits."""
+        self._rejected.append((line_no, error))
+
+    def write(self, batch):
+        """Store one batch of (line number, built row); returns (created, updated)."""
+        raise NotImplementedError
+
+    def written(self):
+        """Called once after an import that changed rows."""
+
+
+class JobImporter(RecordImporter):
+    model = Job
+    serializer_class = JobImportSerializer
+    list_fields = ("skills_required",)
+    update_fields = ["job_title", "description", "skills_required", "experience_level", "updated_at"]
+
+    def prepare(self, row):
+        row = super().prepare(row)
+        # Attribution comes from the importing user, not the file
+        row.pop("created_by", None)
+        return row
+
+    def build(self, validated_data):
+        return Job(**validated_data, created_by=self.user)
+
+    def write(self, batch):
+        # Last row wins when a file repeats a job_code within one batch
+        by_code = {job.job_code: job for _, job in batch}
+        existing = set(Job.objects.filter(job_code__in=by_code).values_list("job_code", flat=True))
+        Job.objects.bulk_create(
+            list(by_code.values()),
+            update_conflicts=True,
+            unique_fields=["job_code"],
+            update_fields=self.update_fields,
+        )
+        # Upserted rows don't get their pks back on every backend
+        jobs = list(Job.objects.filter(job_code__in=by_code).only("id", "job_code", "skills_required"))
+        sync_skill_links(Job, jobs, "skills_required")
+        return len(by_code) - len(existing), len(existing)
+
+    def written(self):
+        skill_matcher.invalidate_all_processes()
+
+
+class QuestionImporter(RecordImporter):
+    model = QuestionBank
+    serializer_class = QuestionBankSerializer
+
+    def write(self, batch):
+        QuestionBank.objects.bulk_create([question for _, question in batch])
+        return len(batch), 0
+
+    def written(self):
+        question_pools.clear()
+        question_ranker.invalidate()
+        duplicate_questions.invalidate()
+
+
+def _init_hash_worker():
+    django.setup()
+
+
+class UserImporter(RecordImporter):
+    """
+    Creates CustomUser rows, plus a Candidate profile for candidate rows that
+    carry one. Existing emails are rejected, never overwritten. Given
+    passwords are hashed before the batch's transaction opens, in a pool of
+    ``processes`` worker processes when more than one is asked for; only the
+    import_records command does, since forking a web worker mid-request is
+    not safe. Rows without a password get an unusable one and a queued
+    password-reset email.
+    """
+    model = User
+    serializer_class = UserImportSerializer
+
+    def __init__(self, user=None, batch_size=500, processes=1, domain=None, use_https=False):
+        super().__init__(user=user, batch_size=batch_size)
+        self.processes = processes
+        self.domain = domain or settings.PASSWORD_RESET_DOMAIN
+        self.use_https = use_https
+        self.report["candidates"] = 0
+        self.report["reset_emails"] = 0
+        self._pool = None
+
+    def run(self, records):
+        if self.processes > 1:
+            # Forked children must not share the parent's DB sockets.
+            db.connections.close_all()
+            self._pool = ProcessPoolExecutor(max_workers=self.processes, initializer=_init_hash_worker)
+        try:
+            return super().run(records)
+        finally:
+            if self._pool is not None:
+                self._pool.shutdown()
+                self._pool = None
+
+    def build(self, validated_data):
+        profile = {
+            field: validated_data.pop(field) for field in UserImportSerializer.CANDIDATE_FIELDS if field in validated_data
+        }
+        password = validated_data.pop("password", None)
+        return User(**validated_data, password=password), profile
+
+    def _flush(self, batch):
+        pending = [user for _, (user, _) in batch if user.password]
+        if pending:
+            raw = [user.password for user in pending]
+            if self._pool is not None:
+                hashed = self._pool.map(make_password, raw, chunksize=max(1, len(raw) // (4 * self.processes)))
+            else:
+                hashed = map(make_password, raw)
+            for user, encoded in zip(pending, hashed):
+                user.password = encoded
+        super()._flush(batch)
+
+    def write(self, batch):
+        by_email = {}
+        for line_no, (user, profile) in batch:
+            if user.email in by_email:
+                self._reject(line_no, {"email": ["Repeated earlier in the file."]})
+            else:
+                by_email[user.email] = (line_no, user, profile)
+        for email in User.objects.filter(email__in=by_email).values_list("email", flat=True):
+            line_no = by_email.pop(email)[0]
+            self._reject(line_no, {"email": ["A user with this email already exists."]})
+        if not by_email:
+            return 0, 0
+
+        needs_reset = []
+        for _, user, _ in by_email.values():
+            if not user.password:
+                user.set_unusable_password()
+                needs_reset.append(user)
+        User.objects.bulk_create([user for _, user, _ in by_email.values()])
+        # Not every backend returns pks from bulk_create
+        ids = dict(User.objects.filter(email__in=by_email).values_list("email", "id"))
+        candidates = []
+        for email, (_, user, profile) in by_email.items():
+            user.pk = ids[email]
+            if profile:
+                candidates.append(Candidate(candidate_user_id=user.pk, email=email, **profile))
+        Candidate.objects.bulk_create(candidates)
+        queued = queue_password_reset_emails(needs_reset, self.domain, self.use_https)
+        self.report["candidates"] += len(candidates)
+        self.report["reset_emails"] += queued
+        return len(by_email), 0
+
+    def written(self):
+        if self.report["candidates"]:
+            skill_matcher.invalidate_all_processes()
+
+
+IMPORTERS = {"jobs": JobImporter, "questions": QuestionImporter, "users": UserImporter}
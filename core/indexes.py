@@ -0,0 +1,76 @@
+import threading
+import time
+
+from django.apps import apps
+from django.db import models
+
+
+class ProcessLocalIndex:
+    """
+    In-memory index built from the database on first use and then kept
+    current by model signals raised in this process. Every process holds its
+    own copy, so writes made elsewhere (other workers, management commands)
+    are only picked up by the full reload that happens once the index is
+    older than `max_age` seconds, or after `invalidate()`.
+
+    An index with a `shared_name` also reloads when its IndexVersion stamp
+    changes, checked at most every `version_check_interval` seconds. Code
+    that writes without sending signals (bulk_create, bulk_update) calls
+    `invalidate_all_processes()` afterwards to bump that stamp.
+
+    Subclasses implement `_load()` and guard their incremental update hooks
+    with `is_loaded`: there is nothing to update before the first load.
+    """
+
+    max_age = 300
+    # IndexVersion.name shared by every process's copy; None keeps the index purely local
+    shared_name = None
+    version_check_interval = 5
+
+    def __init__(self, max_age=None):
+        if max_age is not None:
+            self.max_age = max_age
+        self._lock = threading.RLock()
+        self._loaded_at = None
+        self._version = None
+        self._version_checked_at = None
+
+    def _load(self):
+        raise NotImplementedError
+
+    @property
+    def is_loaded(self):
+        return self._loaded_at is not None
+
+    def ensure_loaded(self):
+        with self._lock:
+            now = time.monotonic()
+            if self._loaded_at is not None and now - self._loaded_at <= self.max_age:
+                if self.shared_name is None or now - self._version_checked_at <= self.version_check_interval:
+                    return
+                self._version_checked_at = now
+                if self._shared_version() == self._version:
+                    return
+            # Read before loading, so a bump made during the load triggers another one
+            self._version = self._shared_version()
+            self._load()
+            self._loaded_at = self._version_checked_at = time.monotonic()
+
+    def invalidate(self):
+        """Drop the in-memory copy; the next query reloads from the database."""
+        with self._lock:
+            self._loaded_at = None
+
+    def invalidate_all_processes(self):
+        """invalidate() here and make every other process reload its copy on its next version check."""
+        if self.shared_name is not None:
+            IndexVersion = apps.get_model("core", "IndexVersion")
+            if not IndexVersion.objects.filter(name=self.shared_name).update(version=models.F("version") + 1):
+                IndexVersion.objects.get_or_create(name=self.shared_name, defaults={"version": 1})
+        self.invalidate()
+
+    def _shared_version(self):
+        if self.shared_name is None:
+            return None
+        IndexVersion = apps.get_model("core", "IndexVersion")
+        return IndexVersion.objects.filter(name=self.shared_name).values_list("version", flat=True).first()
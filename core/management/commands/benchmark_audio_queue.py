@@ -0,0 +1,109 @@
+import random
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from core.models import (
+    AudioProcessingTask, Candidate, CustomUser, GeneratedQuestion,
+    InterviewSession, Job,
+)
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    if not ordered:
+        return 0
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+class Command(BaseCommand):
+    help = (
+        "Simulate a skewed audio-queue load (one bursty session, many light ones, "
+        "a backfill batch) and report pickup latency for FIFO vs. fair claiming. "
+        "Runs inside a transaction that is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--burst", type=int, default=40, help="Answers submitted at once by the bursty session.")
+        parser.add_argument("--sessions", type=int, default=30, help="Number of light live sessions.")
+        parser.add_argument("--answers", type=int, default=3, help="Answers per light session.")
+        parser.add_argument("--backfill", type=int, default=100, help="Backfill tasks queued up front.")
+        parser.add_argument("--throughput", type=int, default=4, help="Tasks the worker pool finishes per tick.")
+        parser.add_argument("--seed", type=int, default=7)
+
+    def handle(self, *args, **options):
+        self.stdout.write("Pickup latency in ticks for live tasks")
+        self.stdout.write(f"{'policy':<8}{'light p50':>11}{'light p95':>11}{'light max':>11}{'burst p95':>11}")
+        for policy in ("fifo", "fair"):
+            light, burst = self._simulate(policy, options)
+            self.stdout.write(
+                f"{policy:<8}{percentile(light, 50):>11}{percentile(light, 95):>11}"
+                f"{max(light, default=0):>11}{percentile(burst, 95):>11}"
+            )
+
+    def _simulate(self, policy, options):
+        rng = random.Random(options["seed"])
+        with transaction.atomic():
+            sessions = self._make_sessions(options["sessions"] + 2)
+            bursty, backfill_session, light = sessions[0], sessions[1], sessions[2:]
+
+            # (arrival tick, session, priority)
+            arrivals = [(0, bursty, AudioProcessingTask.PRIORITY_LIVE)] * options["burst"]
+            arrivals += [(0, backfill_session, AudioProcessingTask.PRIORITY_BACKFILL)] * options["backfill"]
+            for session in light:
+                arrivals += [
+                    (rng.randint(0, 10), session, AudioProcessingTask.PRIORITY_LIVE)
+                    for _ in range(options["answers"])
+                ]
+            arrivals.sort(key=lambda arrival: arrival[0])
+
+            base = timezone.now() - timedelta(days=1)
+            arrived_at, light_latencies, burst_latencies = {}, [], []
+            tick, cursor, live_left = 0, 0, sum(1 for a in arrivals if a[2] == AudioProcessingTask.PRIORITY_LIVE)
+            while live_left:
+                batch = []
+                while cursor < len(arrivals) and arrivals[cursor][0] <= tick:
+                    _, (session, question), priority = arrivals[cursor]
+                    batch.append(AudioProcessingTask(
+                        interview_session=session, question=question, audio_file="bench.wav",
+                        priority=priority, available_at=base + timedelta(seconds=tick),
+                    ))
+                    cursor += 1
+                for task in AudioProcessingTask.objects.bulk_create(batch):
+                    arrived_at[task.id] = tick
+
+                claimed = self._claim(policy, options["throughput"])
+                AudioProcessingTask.objects.filter(id__in=[t.id for t in claimed]).update(task_status="done")
+                for task in claimed:
+                    if task.priority == AudioProcessingTask.PRIORITY_LIVE:
+                        latencies = burst_latencies if task.interview_session_id == bursty[0].id else light_latencies
+                        latencies.append(tick - arrived_at[task.id])
+                        live_left -= 1
+                tick += 1
+            transaction.set_rollback(True)
+        return light_latencies, burst_latencies
+
+    def _claim(self, policy, limit):
+        if policy == "fair":
+            return AudioProcessingTask.objects.claim("bench", limit=limit)
+        # Baseline: plain oldest-first, which is what the queue did before
+        # priorities and per-session round-robin.
+        tasks = list(AudioProcessingTask.objects.claimable().order_by("available_at", "id")[:limit])
+        AudioProcessingTask.objects.filter(id__in=[t.id for t in tasks]).update(task_status="processing")
+        return tasks
+
+    def _make_sessions(self, count):
+        user = CustomUser.objects.create(email="queue-benchmark@example.com")
+        candidate = Candidate.objects.create(
+            candidate_user=user, full_name="Benchmark", email=user.email, phone="0", experience_years=0,
+        )
+        job = Job.objects.create(job_title="Benchmark", job_code="queue-benchmark", experience_level=0)
+        sessions = InterviewSession.objects.bulk_create(
+            [InterviewSession(candidate=candidate, job=job) for _ in range(count)]
+        )
+        questions = GeneratedQuestion.objects.bulk_create(
+            [GeneratedQuestion(interview_session=session, question_text="benchmark") for session in sessions]
+        )
+        return list(zip(sessions, questions))
@@ -0,0 +1,85 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from core.fast_serializers import compile_projection
+from core.models import Candidate, CustomUser, GeneratedQuestion, InterviewSession, Job
+from core.serializers import CandidateSerializer, GeneratedQuestionSerializer
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare list serialization through the ModelSerializers with the compiled "
+        ".values() projections (core.fast_serializers), query included. "
+        "Runs inside a transaction that is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--sizes", default="1000,10000,100000", help="Comma-separated row counts.")
+        parser.add_argument("--repeat", type=int, default=3, help="Best of this many runs.")
+
+    def handle(self, *args, **options):
+        sizes = sorted(int(size) for size in options["sizes"].split(","))
+        self.stdout.write(f"{'serializer':<30}{'rows':>8}{'regular ms':>12}{'values ms':>11}{'speedup':>9}")
+        with transaction.atomic():
+            session, owner = self._fixtures()
+            made = 0
+            for size in sizes:
+                self._grow(session, owner, made, size)
+                made = size
+                cases = (
+                    (CandidateSerializer, Candidate.objects.order_by("id")),
+                    (GeneratedQuestionSerializer, GeneratedQuestion.objects.filter(interview_session=session).order_by("id")),
+                )
+                for serializer_class, queryset in cases:
+                    self._compare(serializer_class, queryset, size, options["repeat"])
+            transaction.set_rollback(True)
+
+    def _fixtures(self):
+        owner = CustomUser.objects.create_user(email="benchmark-serializers@example.com", password=None)
+        candidate = Candidate.objects.create(
+            candidate_user=owner, full_name="Benchmark", email=owner.email, phone="0", experience_years=1,
+        )
+        job = Job.objects.create(job_title="Benchmark", job_code="benchmark-serializers", experience_level=1)
+        return InterviewSession.objects.create(candidate=candidate, job=job), owner
+
+    def _grow(self, session, owner, start, size):
+        # The fixture candidate counts as the first row
+        Candidate.objects.bulk_create(
+            [
+                Candidate(
+                    candidate_user=owner, full_name=f"Candidate {i}", email=f"c{i}@example.com",
+                    phone="555-0100", experience_years=i % 15,
+                )
+                for i in range(max(start, 1), size)
+            ],
+            batch_size=5000,
+        )
+        GeneratedQuestion.objects.bulk_create(
+            [
+                GeneratedQuestion(interview_session=session, question_text=f"Question {i}?", expected_answer="...")
+                for i in range(start, size)
+            ],
+            batch_size=5000,
+        )
+
+    def _compare(self, serializer_class, queryset, size, repeat):
+        projection = compile_projection(serializer_class)
+        regular_ms, regular = self._best(lambda: serializer_class(list(queryset), many=True).data, repeat)
+        values_ms, fast = self._best(lambda: projection.render(queryset.values(*projection.lookups)), repeat)
+        if [dict(item) for item in regular] != fast:
+            self.stderr.write(f"{serializer_class.__name__}: outputs differ at {size} rows")
+        self.stdout.write(
+            f"{serializer_class.__name__:<30}{size:>8}{regular_ms:>12.1f}{values_ms:>11.1f}"
+            f"{regular_ms / values_ms:>8.1f}x"
+        )
+
+    def _best(self, run, repeat):
+        best, result = None, None
+        for _ in range(repeat):
+            started = time.perf_counter()
+            result = run()
+            elapsed = (time.perf_counter() - started) * 1000
+            best = elapsed if best is None else min(best, elapsed)
+        return best, result
@@ -0,0 +1,123 @@
+import os
+import random
+import re
+import string
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from django.core.management.base import BaseCommand
+
+from core.skill_extraction import SkillAutomaton, extract_batch, init_extraction_worker
+from core.skills import normalize_skill
+
+
+def _word(rng, low=3, high=9):
+    return "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(low, high)))
+
+
+def make_taxonomy(rng, size, aliases):
+    """Unique synthetic skills: single words, two-word phrases and symbol suffixes like "xy++"."""
+    taxonomy, seen = [], set()
+    while len(taxonomy) < size:
+        shape = rng.random()
+        if shape < 0.2:
+            name = f"{_word(rng)} {_word(rng)}"
+        elif shape < 0.3:
+            name = _word(rng, 1, 4) + rng.choice(["++", "#", ".js", ".net"])
+        else:
+            name = _word(rng)
+        names = [name] + [_word(rng, 2, 5) + name[:3] for _ in range(aliases)]
+        if seen.isdisjoint(names):
+            seen.update(names)
+            taxonomy.append((name, names[1:]))
+    return taxonomy
+
+
+def make_corpus(rng, taxonomy, count, words, skills_per_resume):
+    vocabulary = [_word(rng) for _ in range(5000)]
+    patterns = [pattern for name, aliases in taxonomy for pattern in (name, *aliases)]
+    corpus = []
+    for _ in range(count):
+        tokens = rng.choices(vocabulary, k=words)
+        for pattern in rng.sample(patterns, skills_per_resume):
+            tokens.insert(rng.randrange(len(tokens) + 1), pattern.upper() if rng.random() < 0.3 else pattern)
+        corpus.append(" ".join(tokens))
+    return corpus
+
+
+def regex_extractor(taxonomy):
+    """The one-regex-per-pattern baseline, with the same boundary rules as the automaton."""
+    compiled = []
+    for name, aliases in taxonomy:
+        for pattern in {normalize_skill(name), *map(normalize_skill, aliases)}:
+            left = r"(?<!\w)" if re.match(r"\w", pattern[0]) else ""
+            right = r"(?!\w)" if re.match(r"\w", pattern[-1]) else ""
+            compiled.append((normalize_skill(name), re.compile(left + re.escape(pattern) + right)))
+
+    def find(text):
+        text = " ".join(text.split()).lower()
+        return {skill for skill, regex in compiled if regex.search(text)}
+
+    return find
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark resume skill extraction on a synthetic taxonomy and corpus: "
+        "regex-per-skill baseline vs. the Aho-Corasick automaton, single process "
+        "and process pool. Does not touch the database."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--skills", type=int, default=3000, help="Skills in the taxonomy.")
+        parser.add_argument("--aliases", type=int, default=2, help="Aliases per skill.")
+        parser.add_argument("--resumes", type=int, default=2000)
+        parser.add_argument("--words", type=int, default=800, help="Filler words per resume.")
+        parser.add_argument("--skills-per-resume", type=int, default=15)
+        parser.add_argument("--regex-sample", type=int, default=50, help="Resumes timed with the regex baseline.")
+        parser.add_argument("--processes", type=int, default=os.cpu_count() or 1)
+        parser.add_argument("--batch-size", type=int, default=100)
+        parser.add_argument("--seed", type=int, default=7)
+
+    def handle(self, *args, **options):
+        rng = random.Random(options["seed"])
+        taxonomy = make_taxonomy(rng, options["skills"], options["aliases"])
+        corpus = make_corpus(rng, taxonomy, options["resumes"], options["words"], options["skills_per_resume"])
+        self.stdout.write(
+            f"{len(taxonomy)} skills x {options['aliases'] + 1} patterns, {len(corpus)} resumes, "
+            f"{sum(map(len, corpus)) / len(corpus) / 1024:.1f} KiB avg"
+        )
+
+        started = time.perf_counter()
+        automaton = SkillAutomaton(taxonomy)
+        self.stdout.write(f"automaton: {len(automaton)} states built in {time.perf_counter() - started:.2f}s")
+
+        sample = corpus[: options["regex_sample"]]
+        find_regex = regex_extractor(taxonomy)
+        started = time.perf_counter()
+        expected = [find_regex(text) for text in sample]
+        self._report("regex per skill", len(sample), time.perf_counter() - started)
+
+        started = time.perf_counter()
+        found = [automaton.find(text) for text in corpus]
+        self._report("automaton", len(corpus), time.perf_counter() - started)
+        agree = all(set(got) == want for got, want in zip(found, expected))
+        self.stdout.write(f"  matches regex baseline on sample: {'yes' if agree else 'NO'}")
+
+        batches = [
+            list(enumerate(corpus[i:i + options["batch_size"]], start=i))
+            for i in range(0, len(corpus), options["batch_size"])
+        ]
+        started = time.perf_counter()
+        with ProcessPoolExecutor(
+            max_workers=options["processes"],
+            initializer=init_extraction_worker,
+            initargs=(taxonomy,),
+        ) as pool:
+            pooled = [skills for batch in pool.map(extract_batch, batches) for _, skills in batch]
+        self._report(f"automaton, {options['processes']} processes", len(corpus), time.perf_counter() - started)
+        if pooled != found:
+            self.stdout.write("  process pool results differ from single-process run!")
+
+    def _report(self, label, count, elapsed):
+        self.stdout.write(f"{label:<28}{count / elapsed:>10.0f} resumes/s")
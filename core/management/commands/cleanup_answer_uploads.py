@@ -0,0 +1,65 @@
+import os
+import time
+import uuid
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from core.models import AnswerUpload, answer_upload_dir
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete resumable answer uploads idle for longer than ANSWER_UPLOAD_TTL seconds, "
+        "with their part files, and part files no upload row refers to."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--interval", type=int, default=0,
+            help="Keep running and clean up every N seconds (default: run once).",
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            rows, files = self.cleanup()
+            self.stdout.write(f"Deleted {rows} stale answer upload(s) and {files} part file(s).")
+            if not options["interval"]:
+                break
+            time.sleep(options["interval"])
+
+    def cleanup(self):
+        stale = AnswerUpload.objects.stale()
+        stale_ids = list(stale.values_list("id", flat=True))
+        rows, _ = AnswerUpload.objects.filter(id__in=stale_ids).delete()
+        files = sum(self._remove(AnswerUpload(id=upload_id).part_path) for upload_id in stale_ids)
+
+        # Old part files of rows deleted some other way (e.g. with their interview session)
+        directory = answer_upload_dir()
+        cutoff = time.time() - settings.ANSWER_UPLOAD_TTL
+        old = {}
+        if os.path.isdir(directory):
+            for name in os.listdir(directory):
+                path = os.path.join(directory, name)
+                try:
+                    if name.endswith(".part") and os.path.getmtime(path) < cutoff:
+                        old[name[:-len(".part")]] = path
+                except FileNotFoundError:
+                    continue
+        if old:
+            valid = []
+            for upload_id in old:
+                try:
+                    valid.append(uuid.UUID(upload_id))
+                except ValueError:
+                    continue
+            known = {str(upload_id) for upload_id in AnswerUpload.objects.filter(id__in=valid).values_list("id", flat=True)}
+            files += sum(self._remove(path) for upload_id, path in old.items() if upload_id not in known)
+        return rows, files
+
+    def _remove(self, path):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            return 0
+        return 1
@@ -0,0 +1,79 @@
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from django import db
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from core.matching import skill_matcher
+from core.models import Resume
+from core.skill_extraction import extract_batch, init_extraction_worker, load_taxonomy
+from core.skills import sync_skill_links
+
+
+class Command(BaseCommand):
+    help = (
+        "Fill Resume.parsed_skills from parsed_text by matching the Skill taxonomy "
+        "(names and aliases) in a process pool. Only resumes without skills are "
+        "processed unless --all is given."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--processes", type=int, default=os.cpu_count() or 1)
+        parser.add_argument("--batch-size", type=int, default=200, help="Resumes per worker batch.")
+        parser.add_argument("--all", action="store_true", help="Re-extract resumes that already have skills.")
+
+    def handle(self, *args, **options):
+        taxonomy = load_taxonomy()
+        if not taxonomy:
+            self.stdout.write("No skills in the taxonomy; nothing to extract.")
+            return
+        resumes = Resume.objects.exclude(parsed_text__isnull=True).exclude(parsed_text="")
+        if not options["all"]:
+            resumes = resumes.filter(parsed_skills=[])
+
+        started = time.perf_counter()
+        done = 0
+        # Forked children must not share the parent's DB sockets.
+        db.connections.close_all()
+        with ProcessPoolExecutor(
+            max_workers=options["processes"],
+            initializer=init_extraction_worker,
+            initargs=(taxonomy,),
+        ) as pool:
+            # Keep a couple of batches per process in flight rather than
+            # reading the whole table up front.
+            in_flight = deque()
+            for batch in self._batches(resumes, options["batch_size"]):
+                in_flight.append(pool.submit(extract_batch, batch))
+                if len(in_flight) >= 2 * options["processes"]:
+                    done += self._save(in_flight.popleft().result())
+            while in_flight:
+                done += self._save(in_flight.popleft().result())
+
+        elapsed = time.perf_counter() - started
+        rate = done / elapsed if elapsed else 0
+        self.stdout.write(f"Extracted skills for {done} resume(s) in {elapsed:.1f}s ({rate:.0f} resumes/s).")
+
+    def _batches(self, resumes, batch_size):
+        # Keyset over ids so writes to already-seen rows don't shift the pages.
+        last_id = 0
+        while True:
+            batch = list(
+                resumes.filter(id__gt=last_id).order_by("id").values_list("id", "parsed_text")[:batch_size]
+            )
+            if not batch:
+                return
+            last_id = batch[-1][0]
+            yield batch
+
+    def _save(self, results):
+        resumes = [Resume(id=resume_id, parsed_skills=skills) for resume_id, skills in results]
+        with transaction.atomic():
+            Resume.objects.bulk_update(resumes, ["parsed_skills"])
+            sync_skill_links(Resume, resumes, "parsed_skills")
+        # bulk_update() sends no post_save, so no process's matcher saw these resumes
+        skill_matcher.invalidate_all_processes()
+        return len(resumes)
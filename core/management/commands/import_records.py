@@ -0,0 +1,37 @@
+import json
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.imports import FORMATS, IMPORTERS, guess_format, read_records
+
+
+class Command(BaseCommand):
+    help = "Bulk import jobs (upserting on job_code), bank questions or users from a CSV or NDJSON file."
+
+    def add_arguments(self, parser):
+        parser.add_argument("kind", choices=sorted(IMPORTERS))
+        parser.add_argument("path")
+        parser.add_argument("--format", choices=FORMATS, help="Defaults to the file extension.")
+        parser.add_argument("--batch-size", type=int, default=500)
+        parser.add_argument(
+            "--processes", type=int, default=os.cpu_count() or 1, help="Password hashing processes (users only).",
+        )
+        parser.add_argument("--domain", help="Password-reset link domain (users only; default PASSWORD_RESET_DOMAIN).")
+
+    def handle(self, *args, **options):
+        file_format = options["format"] or guess_format(options["path"])
+        if file_format is None:
+            raise CommandError("Cannot tell the format from the file name; pass --format.")
+        importer_options = {}
+        if options["kind"] == "users":
+            importer_options = {"processes": options["processes"], "domain": options["domain"]}
+        importer = IMPORTERS[options["kind"]](batch_size=options["batch_size"], **importer_options)
+        with open(options["path"], "rb") as stream:
+            report = importer.run(read_records(stream, file_format))
+        for error in report["errors"]:
+            self.stderr.write(f"line {error['line']}: {json.dumps(error['errors'])}")
+        self.stdout.write(
+            f"{report['created']} created, {report['updated']} updated, {report['error_count']} line(s) rejected "
+            f"({report['rows']} rows in {report['elapsed_seconds']}s, {report['rows_per_second']} rows/s)."
+        )
@@ -0,0 +1,102 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import django
+from django import db
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from core.matching import skill_matcher
+from core.models import Resume
+from core.skill_extraction import SkillAutomaton, load_taxonomy
+from core.skills import sync_skill_links
+from core.text_extraction import extract_text
+
+_automaton = None
+
+
+def _init_worker(taxonomy):
+    global _automaton
+    django.setup()
+    _automaton = SkillAutomaton(taxonomy)
+
+
+def _parse(payload):
+    resume_id, name = payload
+    try:
+        with default_storage.open(name, "rb") as file:
+            text = extract_text(file, name)
+    except Exception as exc:  # recorded on the resume as parse_error
+        return resume_id, None, None, f"{type(exc).__name__}: {exc}"
+    return resume_id, text, _automaton.find(text), ""
+
+
+class Command(BaseCommand):
+    help = (
+        "Extract parsed_text (and parsed_skills, if empty) for uploaded resumes in a "
+        "process pool. Resumes whose file was already parsed are filled from that result."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--processes", type=int, default=os.cpu_count() or 1)
+        parser.add_argument("--batch-size", type=int, default=0, help="Resumes per claim (default: 2 x processes).")
+        parser.add_argument("--lease-seconds", type=int, default=300)
+        parser.add_argument("--poll-interval", type=float, default=2.0, help="Sleep when nothing is pending.")
+        parser.add_argument("--once", action="store_true", help="Exit as soon as nothing is pending.")
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"] or 2 * options["processes"]
+        taxonomy = load_taxonomy()
+        # Forked children must not share the parent's DB sockets.
+        db.connections.close_all()
+        with ProcessPoolExecutor(
+            max_workers=options["processes"],
+            initializer=_init_worker,
+            initargs=(taxonomy,),
+        ) as pool:
+            parsed = 0
+            while True:
+                resumes = Resume.objects.claim_for_parsing(batch_size, options["lease_seconds"])
+                if not resumes:
+                    if options["once"]:
+                        break
+                    time.sleep(options["poll_interval"])
+                    continue
+                parsed += self._run_batch(pool, resumes)
+        self.stdout.write(f"Parsed {parsed} resume(s).")
+
+    def _run_batch(self, pool, resumes):
+        results = self._known_results(resumes)
+        to_parse = [(r.id, r.resume_file.name) for r in resumes if r.id not in results]
+        for resume_id, text, skills, error in pool.map(_parse, to_parse):
+            results[resume_id] = (text, skills, error)
+
+        for resume in resumes:
+            text, skills, error = results[resume.id]
+            resume.parse_status = "failed" if error else "done"
+            resume.parse_error = error
+            resume.parse_lease_expires_at = None
+            if not error:
+                resume.parsed_text = text
+                resume.parsed_skills = resume.parsed_skills or skills
+        with transaction.atomic():
+            Resume.objects.bulk_update(
+                resumes, ["parsed_text", "parsed_skills", "parse_status", "parse_error", "parse_lease_expires_at"],
+            )
+            sync_skill_links(Resume, resumes, "parsed_skills")
+        # bulk_update() sends no post_save, so no process's matcher saw these resumes
+        skill_matcher.invalidate_all_processes()
+        return sum(1 for resume in resumes if resume.parse_status == "done")
+
+    def _known_results(self, resumes):
+        """Reuse the parse of any earlier upload with the same content hash."""
+        hashes = {r.content_hash for r in resumes if r.content_hash}
+        known = {}
+        for content_hash, text, skills in (
+            Resume.objects.filter(content_hash__in=hashes, parse_status="done")
+            .order_by("upload_date", "id").values_list("content_hash", "parsed_text", "parsed_skills")
+        ):
+            known[content_hash] = (text, skills, "")
+        return {r.id: known[r.content_hash] for r in resumes if r.content_hash in known}
@@ -0,0 +1,160 @@
+import logging
+import os
+import socket
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
+
+import django
+from django import db
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from core.audio_backends import get_audio_backend
+from core.models import AudioProcessingTask, CandidateAnswer, GeneratedQuestion
+
+logger = logging.getLogger(__name__)
+
+_backend = None
+
+
+def _init_worker(backend_path):
+    global _backend
+    django.setup()
+    _backend = get_audio_backend(backend_path)
+
+
+def _process(payload):
+    task_id, audio_name, question_text = payload
+    try:
+        return task_id, _backend.process(audio_name, question_text), ""
+    except Exception as exc:  # reported back to the queue as a failed attempt
+        return task_id, None, f"{type(exc).__name__}: {exc}"
+
+
+class Command(BaseCommand):
+    help = "Claim audio tasks from the DB queue and transcribe/score them in a process pool."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--worker-id", default=f"{socket.gethostname()}-{os.getpid()}")
+        parser.add_argument("--processes", type=int, default=os.cpu_count() or 1)
+        parser.add_argument("--batch-size", type=int, default=0, help="Tasks per claim (default: 2 x processes).")
+        parser.add_argument("--lease-seconds", type=int, default=300)
+        parser.add_argument(
+            "--heartbeat-interval", type=float, default=30.0,
+            help="Seconds between heartbeats while a batch runs; keep well under the reaper's timeout.",
+        )
+        parser.add_argument("--poll-interval", type=float, default=2.0, help="Sleep when the queue is empty.")
+        parser.add_argument("--backend", default=None, help="Dotted path overriding AUDIO_PROCESSING_BACKEND.")
+        parser.add_argument("--once", action="store_true", help="Exit as soon as the queue is empty.")
+
+    def handle(self, *args, **options):
+        worker_id = options["worker_id"]
+        batch_size = options["batch_size"] or 2 * options["processes"]
+        # Forked children must not share the parent's DB sockets.
+        db.connections.close_all()
+        with ProcessPoolExecutor(
+            max_workers=options["processes"],
+            initializer=_init_worker,
+            initargs=(options["backend"],),
+        ) as pool:
+            processed = 0
+            while True:
+                AudioProcessingTask.objects.heartbeat(worker_id, options["lease_seconds"])
+                tasks = AudioProcessingTask.objects.claim(worker_id, batch_size, options["lease_seconds"])
+                if not tasks:
+                    if options["once"]:
+                        break
+                    time.sleep(options["poll_interval"])
+                    continue
+                with self._heartbeats(worker_id, options["lease_seconds"], options["heartbeat_interval"]):
+                    outcomes = self._process_batch(pool, tasks)
+                processed += self._save_batch(tasks, outcomes, worker_id)
+        self.stdout.write(f"Processed {processed} audio task(s).")
+
+    @contextmanager
+    def _heartbeats(self, worker_id, lease_seconds, interval):
+        """Keep our leases alive from a side thread while the pool works on a batch."""
+        stop = threading.Event()
+
+        def beat():
+            try:
+                while not stop.wait(interval):
+                    try:
+                        AudioProcessingTask.objects.heartbeat(worker_id, lease_seconds)
+                    except db.DatabaseError:
+                        # e.g. SQLite busy while the batch commits; the next beat retries
+                        logger.warning("Heartbeat for %s failed", worker_id, exc_info=True)
+            finally:
+                # The thread holds its own connection
+                db.connection.close()
+
+        thread = threading.Thread(target=beat, name="audio-heartbeat", daemon=True)
+        thread.start()
+        try:
+            yield
+        finally:
+            stop.set()
+            thread.join()
+
+    def _process_batch(self, pool, tasks):
+        questions = dict(
+            GeneratedQuestion.objects.filter(id__in={t.question_id for t in tasks})
+            .values_list("id", "question_text")
+        )
+        payloads = [(t.id, t.audio_file.name, questions[t.question_id]) for t in tasks]
+        return {task_id: (result, error) for task_id, result, error in pool.map(_process, payloads)}
+
+    def _save_batch(self, tasks, outcomes, worker_id):
+        answer_ids = self._answer_ids(tasks)
+        answers, done, failed = [], [], defaultdict(list)
+        for task in tasks:
+            result, error = outcomes[task.id]
+            answer_id = answer_ids.get(task.id)
+            if result is None or answer_id is None:
+                failed[error or "No CandidateAnswer found for task"].append(task.id)
+                continue
+            answers.append((task.id, CandidateAnswer(
+                id=answer_id, transcript=result.transcript, score=result.score, ai_feedback=result.feedback,
+            )))
+            done.append(task.id)
+
+        now = timezone.now()
+        with transaction.atomic():
+            # A task whose lease ran out may have been re-claimed by another
+            # worker meanwhile; its result and status are no longer ours to write.
+            held = set(
+                AudioProcessingTask.objects.select_for_update()
+                .filter(id__in=[t.id for t in tasks], worker_id=worker_id, task_status="processing")
+                .values_list("id", flat=True)
+            )
+            answers = [answer for task_id, answer in answers if task_id in held]
+            done = [task_id for task_id in done if task_id in held]
+            CandidateAnswer.objects.bulk_update(answers, ["transcript", "score", "ai_feedback"])
+            still_ours = AudioProcessingTask.objects.filter(worker_id=worker_id, task_status="processing")
+            still_ours.filter(id__in=done).update(
+                task_status="done", worker_id="", lease_expires_at=None, updated_at=now,
+            )
+            for error, task_ids in failed.items():
+                still_ours.filter(id__in=task_ids).retry_or_dead_letter(error, now=now)
+        return len(done)
+
+    def _answer_ids(self, tasks):
+        """Map task id -> answer id; tasks queued before the answer link existed fall back to (session, question)."""
+        answer_ids = {t.id: t.answer_id for t in tasks if t.answer_id}
+        legacy = [t for t in tasks if not t.answer_id]
+        if legacy:
+            latest = {}
+            for answer_id, session_id, question_id in (
+                CandidateAnswer.objects.filter(
+                    interview_session_id__in={t.interview_session_id for t in legacy},
+                    question_id__in={t.question_id for t in legacy},
+                ).order_by("created_at", "id").values_list("id", "interview_session_id", "question_id")
+            ):
+                latest[session_id, question_id] = answer_id
+            for task in legacy:
+                answer_ids[task.id] = latest.get((task.interview_session_id, task.question_id))
+        return {task_id: answer_id for task_id, answer_id in answer_ids.items() if answer_id}
@@ -0,0 +1,27 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from core.models import AudioProcessingTask
+
+
+class Command(BaseCommand):
+    help = "Re-queue audio tasks whose worker lease expired or whose worker stopped heartbeating."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--heartbeat-timeout", type=int, default=120,
+            help="Seconds without a heartbeat before a worker is considered dead.",
+        )
+        parser.add_argument(
+            "--interval", type=int, default=0,
+            help="Keep running and reap every N seconds (default: run once).",
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            requeued = AudioProcessingTask.objects.requeue_stale(options["heartbeat_timeout"])
+            self.stdout.write(f"Re-queued {requeued} stale audio task(s).")
+            if not options["interval"]:
+                break
+            time.sleep(options["interval"])
@@ -0,0 +1,28 @@
+import json
+
+from django.core.management.base import BaseCommand
+
+from core.models import QuestionBank
+from core.near_duplicates import DUPLICATE_THRESHOLD, DuplicateQuestionIndex
+
+
+class Command(BaseCommand):
+    help = "List groups of near-duplicate QuestionBank questions (MinHash/LSH), largest first."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--threshold", type=float, default=DUPLICATE_THRESHOLD, help="Minimum estimated Jaccard similarity.")
+        parser.add_argument("--json", action="store_true", help="Print one JSON object per group.")
+
+    def handle(self, *args, **options):
+        # A fresh index: this process has no signal-maintained copy to reuse
+        clusters = DuplicateQuestionIndex().clusters(options["threshold"])
+        texts = dict(QuestionBank.objects.values_list("id", "question_text").iterator(chunk_size=5000))
+        for group in clusters:
+            if options["json"]:
+                self.stdout.write(json.dumps([{"id": i, "question_text": texts.get(i, "")} for i in group]))
+                continue
+            self.stdout.write(f"{len(group)} questions:")
+            for question_id in group:
+                self.stdout.write(f"  #{question_id}: {texts.get(question_id, '')[:100]}")
+        duplicates = sum(len(group) - 1 for group in clusters)
+        self.stderr.write(f"{len(clusters)} group(s); {duplicates} question(s) could be removed.")
@@ -0,0 +1,69 @@
+import time
+from collections import defaultdict
+from contextlib import suppress
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from core.mail import get_delivery_connection, to_message
+from core.models import OutboundEmail
+
+
+class Command(BaseCommand):
+    help = (
+        "Send emails queued in the outbox in batches, reusing one connection to "
+        "EMAIL_OUTBOX_DELIVERY_BACKEND. Failed sends are retried with backoff."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=100, help="Emails per claim.")
+        parser.add_argument("--lease-seconds", type=int, default=300)
+        parser.add_argument("--poll-interval", type=float, default=2.0, help="Sleep when the outbox is empty.")
+        parser.add_argument("--once", action="store_true", help="Exit as soon as the outbox is empty.")
+
+    def handle(self, *args, **options):
+        connection = get_delivery_connection(fail_silently=False)
+        sent = failed = 0
+        try:
+            while True:
+                emails = OutboundEmail.objects.claim(options["batch_size"], options["lease_seconds"])
+                if not emails:
+                    # Don't hold an idle SMTP session open between polls
+                    connection.close()
+                    if options["once"]:
+                        break
+                    time.sleep(options["poll_interval"])
+                    continue
+                batch_sent, batch_failed = self._send_batch(connection, emails)
+                sent += batch_sent
+                failed += batch_failed
+        finally:
+            connection.close()
+        self.stdout.write(f"Sent {sent} email(s); {failed} failed send(s) left for retry.")
+
+    def _send_batch(self, connection, emails):
+        done, errors = [], defaultdict(list)
+        for email in emails:
+            try:
+                # Backends open lazily and keep the connection open across send_messages calls
+                connection.open()
+                delivered = connection.send_messages([to_message(email, connection)])
+            except Exception as exc:  # recorded on the email; the rest of the batch still goes out
+                errors[f"{type(exc).__name__}: {exc}"].append(email.id)
+                # The failure may have dropped the connection; the next send opens a fresh one
+                with suppress(Exception):
+                    connection.close()
+                continue
+            if delivered:
+                done.append(email.id)
+            else:
+                errors["Delivery backend accepted no messages"].append(email.id)
+
+        with transaction.atomic():
+            OutboundEmail.objects.filter(id__in=done).update(
+                status="sent", sent_at=timezone.now(), lease_expires_at=None, last_error="",
+            )
+            for error, email_ids in errors.items():
+                OutboundEmail.objects.filter(id__in=email_ids).retry_or_fail(error)
+        return len(done), sum(len(email_ids) for email_ids in errors.values())
@@ -1,4 +1,17 @@
+from datetime import timedelta
+
+from django.apps import apps
+from django.conf import settings
 from django.contrib.auth.models import BaseUserManager
+from django.db import connections, models, transaction
+from django.db.models import Window
+from django.db.models.functions import RowNumber
+from django.utils import timezone
+
+from .notifier import task_notifier
+
+# claim() ranks this many tasks per requested task for round-robin fairness
+FAIR_WINDOW_FACTOR = 20
 
 class CustomUserManager(BaseUserManager):
 
@@ -26,3 +39,304 @@ class CustomUserManager(BaseUserManager):
             raise ValueError("Superuser must have is_superuser=True.")
 
         return self.create_user(email, password, **extra_fields)
+
+
+class ResumeQuerySet(models.QuerySet):
+
+    def parseable(self, now=None):
+        """Resumes waiting for text extraction plus ones whose parse lease has run out."""
+        now = now or timezone.now()
+        return self.filter(
+            models.Q(parse_status="pending")
+            | models.Q(parse_status="processing", parse_lease_expires_at__lt=now)
+        )
+
+    def claim_for_parsing(self, limit=20, lease_seconds=300):
+        """
+        Atomically move up to ``limit`` parseable resumes to "processing" and
+        return them, oldest first. Same locking approach as
+        AudioProcessingTaskQuerySet.claim().
+        """
+        now = timezone.now()
+        lease_expires_at = now + timedelta(seconds=lease_seconds)
+        claim_fields = {"parse_status": "processing", "parse_lease_expires_at": lease_expires_at}
+        candidates = self.parseable(now).order_by("id")
+
+        with transaction.atomic(using=self.db):
+            if connections[self.db].features.has_select_for_update_skip_locked:
+                ids = list(candidates.select_for_update(skip_locked=True).values_list("id", flat=True)[:limit])
+                self.filter(id__in=ids).update(**claim_fields)
+            else:
+                self.filter(id__in=candidates.values("id")[:limit]).update(**claim_fields)
+                ids = list(
+                    self.filter(parse_status="processing", parse_lease_expires_at=lease_expires_at)
+                    .values_list("id", flat=True)
+                )
+            return list(self.filter(id__in=ids).order_by("id"))
+
+
+class AnswerUploadQuerySet(models.QuerySet):
+
+    def for_user(self, user):
+        """Uploads into the interview sessions of ``user``'s candidate profiles."""
+        return self.filter(interview_session__candidate__candidate_user=user)
+
+    def stale(self, now=None):
+        """Uploads untouched for ANSWER_UPLOAD_TTL seconds, finalized or not."""
+        now = now or timezone.now()
+        return self.filter(updated_at__lt=now - timedelta(seconds=settings.ANSWER_UPLOAD_TTL))
+
+
+class AudioProcessingTaskQuerySet(models.QuerySet):
+
+    def enqueue_answers(self, answers, priority=None):
+        """
+        Queue one task per saved CandidateAnswer with a single INSERT and wake
+        long-polling workers once the surrounding transaction commits.
+        """
+        priority = self.model.PRIORITY_LIVE if priority is None else priority
+        tasks = self.bulk_create([
+            self.model(
+                interview_session_id=answer.interview_session_id,
+                question_id=answer.question_id,
+                answer=answer,
+                audio_file=answer.audio_file.name or "",
+                priority=priority,
+            )
+            for answer in answers
+        ])
+        transaction.on_commit(task_notifier.notify, using=self.db)
+        return tasks
+
+    def claimable(self, now=None):
+        """
+        Pending tasks that are due and have attempts left. Expired leases are
+        not claimable as such: claim() and requeue_stale() first fail them
+        through retry_or_dead_letter(), so a crash costs an attempt, backs off
+        and ends in "dead" like any other failure.
+        """
+        now = now or timezone.now()
+        return self.filter(task_status="pending", available_at__lte=now, attempts__lt=self.model.MAX_ATTEMPTS)
+
+    def fair_order(self):
+        """
+        Highest priority first; within a priority, round-robin across
+        interview sessions (every session's oldest task, then every session's
+        second-oldest, ...) so one bursty session cannot starve the others.
+        """
+        return self.annotate(
+            session_turn=Window(
+                RowNumber(),
+                partition_by=[models.F("priority"), models.F("interview_session_id")],
+                order_by=[models.F("available_at").asc(), models.F("id").asc()],
+            )
+        ).order_by("-priority", "session_turn", "available_at", "id")
+
+    def claim_window(self, size, now=None):
+        """
+        The tasks claim() ranks with fair_order(): the first ``size``
+        claimable tasks, highest priority then oldest first, plus the oldest
+        claimable task of up to ``size`` other sessions, so a burst filling
+        the head of the queue still shares it. Each part is a LIMITed read off
+        an index rather than a ranking of the whole backlog, and the result is
+        a single query, usable as a subselect.
+        """
+        now = now or timezone.now()
+        due = self.claimable(now)
+        head = due.order_by("-priority", "available_at", "id")[:size]
+        others = (
+            due.exclude(interview_session_id__in=head.values("interview_session_id"))
+            .order_by("interview_session_id")
+            .values("interview_session_id")
+            .annotate(first_id=models.Min("id"))
+            .values("first_id")[:size]
+        )
+        return due.filter(models.Q(id__in=head.values("id")) | models.Q(id__in=others))
+
+    def claim(self, worker_id, limit=10, lease_seconds=300):
+        """
+        Atomically move up to ``limit`` claimable tasks to "processing" for
+        ``worker_id`` and return them in fair_order(). Only the claim_window()
+        of FAIR_WINDOW_FACTOR x ``limit`` tasks is ranked.
+
+        Backends with SKIP LOCKED let concurrent workers grab disjoint rows.
+        SQLite has no row locks: every statement here writes before it reads,
+        so the transaction holds the database write lock from its first
+        statement, and the window, the ranking and the status change are one
+        UPDATE. No two callers can claim the same row, and none fails on a
+        read-to-write lock upgrade.
+        """
+        now = timezone.now()
+        lease_expires_at = now + timedelta(seconds=lease_seconds)
+        claim_fields = {
+            "task_status": "processing",
+            "worker_id": worker_id,
+            "lease_expires_at": lease_expires_at,
+            "attempts": models.F("attempts") + 1,
+            "updated_at": now,
+        }
+
+        with transaction.atomic(using=self.db):
+            self.filter(task_status="processing", lease_expires_at__lt=now).retry_or_dead_letter(
+                "Worker lease expired", now=now,
+            )
+            candidates = self.claim_window(limit * FAIR_WINDOW_FACTOR, now).fair_order()
+            if connections[self.db].features.has_select_for_update_skip_locked:
+                # Row locks can't be combined with window functions, so rank
+                # first, then lock whichever of the ranked tasks are still
+                # free, a slice at a time until there are enough.
+                ranked = list(candidates.values_list("id", flat=True))
+                ids = []
+                for start in range(0, len(ranked), limit * 4):
+                    chunk = ranked[start:start + limit * 4]
+                    locked = set(
+                        self.claimable(now).filter(id__in=chunk)
+                        .select_for_update(skip_locked=True)
+                        .values_list("id", flat=True)
+                    )
+                    ids += [task_id for task_id in chunk if task_id in locked][:limit - len(ids)]
+                    if len(ids) >= limit:
+                        break
+                if len(ids) < limit:
+                    # Other workers hold the whole window; take any other free work in plain order
+                    ids += list(
+                        self.claimable(now).exclude(id__in=ranked)
+                        .order_by("-priority", "available_at", "id")
+                        .select_for_update(skip_locked=True)
+                        .values_list("id", flat=True)[:limit - len(ids)]
+                    )
+                self.filter(id__in=ids).update(**claim_fields)
+            else:
+                self.filter(id__in=candidates.values("id")[:limit]).update(**claim_fields)
+                # Nobody else can write until we commit, so the rows carrying
+                # our worker id and lease stamp are exactly the ones we just took.
+                ids = self.filter(
+                    task_status="processing",
+                    worker_id=worker_id,
+                    lease_expires_at=lease_expires_at,
+                ).values("id")
+            return list(self.filter(id__in=ids).fair_order())
+
+    def heartbeat(self, worker_id, lease_seconds=300):
+        """
+        Record that ``worker_id`` is alive and push out the lease on every
+        task it holds, in one UPDATE. Returns the number of leases extended.
+        """
+        now = timezone.now()
+        WorkerHeartbeat = apps.get_model("core", "WorkerHeartbeat")
+        WorkerHeartbeat.objects.update_or_create(worker_id=worker_id, defaults={"last_seen": now})
+        return self.filter(task_status="processing", worker_id=worker_id).update(
+            lease_expires_at=now + timedelta(seconds=lease_seconds),
+            updated_at=now,
+        )
+
+    def requeue_stale(self, heartbeat_timeout=120):
+        """
+        Put "processing" tasks back in the queue when their lease expired or
+        their worker stopped heartbeating, then drop the dead workers'
+        heartbeat rows. A crash counts as a failed attempt, so a task that
+        keeps killing workers ends up dead-lettered.
+        Returns the number of tasks re-queued or dead-lettered.
+        """
+        now = timezone.now()
+        WorkerHeartbeat = apps.get_model("core", "WorkerHeartbeat")
+        dead_workers = WorkerHeartbeat.objects.filter(
+            last_seen__lt=now - timedelta(seconds=heartbeat_timeout)
+        )
+        with transaction.atomic(using=self.db):
+            retried, dead = self.filter(task_status="processing").filter(
+                models.Q(lease_expires_at__lt=now)
+                | models.Q(worker_id__in=dead_workers.values("worker_id"))
+            ).retry_or_dead_letter("Worker lease expired", now=now)
+            dead_workers.delete()
+        return retried + dead
+
+    def retry_or_dead_letter(self, error="", now=None):
+        """
+        Fail every task in this queryset: those with attempts left go back to
+        "pending" with exponential backoff on available_at, the rest move to
+        "dead". Two bulk UPDATEs; returns (retried, dead_lettered).
+        """
+        now = now or timezone.now()
+        model = self.model
+        released = {
+            "worker_id": "",
+            "lease_expires_at": None,
+            "last_error": error,
+            "updated_at": now,
+        }
+        backoff = models.Case(
+            *[
+                models.When(attempts=n, then=models.Value(now + model.retry_delay(n)))
+                for n in range(model.MAX_ATTEMPTS)
+            ],
+            default=models.Value(now),
+            output_field=models.DateTimeField(),
+        )
+        with transaction.atomic(using=self.db):
+            dead = self.filter(attempts__gte=model.MAX_ATTEMPTS).update(task_status="dead", **released)
+            retried = self.filter(attempts__lt=model.MAX_ATTEMPTS).update(
+                task_status="pending", available_at=backoff, **released
+            )
+        return retried, dead
+
+
+class OutboundEmailQuerySet(models.QuerySet):
+
+    def sendable(self, now=None):
+        """Pending emails that are due plus ones whose sender's lease has run out."""
+        now = now or timezone.now()
+        return self.filter(
+            models.Q(status="pending", available_at__lte=now)
+            | models.Q(status="sending", lease_expires_at__lt=now)
+        )
+
+    def claim(self, limit=100, lease_seconds=300):
+        """
+        Atomically move up to ``limit`` sendable emails to "sending" and return
+        them, oldest first. Same locking approach as
+        AudioProcessingTaskQuerySet.claim().
+        """
+        now = timezone.now()
+        lease_expires_at = now + timedelta(seconds=lease_seconds)
+        claim_fields = {
+            "status": "sending",
+            "lease_expires_at": lease_expires_at,
+            "attempts": models.F("attempts") + 1,
+        }
+        candidates = self.sendable(now).order_by("available_at", "id")
+
+        with transaction.atomic(using=self.db):
+            if connections[self.db].features.has_select_for_update_skip_locked:
+                ids = list(candidates.select_for_update(skip_locked=True).values_list("id", flat=True)[:limit])
+                self.filter(id__in=ids).update(**claim_fields)
+            else:
+                self.filter(id__in=candidates.values("id")[:limit]).update(**claim_fields)
+                ids = list(
+                    self.filter(status="sending", lease_expires_at=lease_expires_at).values_list("id", flat=True)
+                )
+            return list(self.filter(id__in=ids).order_by("available_at", "id"))
+
+    def retry_or_fail(self, error="", now=None):
+        """
+        Fail every email in this queryset: those with attempts left go back to
+        "pending" with exponential backoff on available_at, the rest move to
+        "failed". Returns (retried, failed).
+        """
+        now = now or timezone.now()
+        model = self.model
+        released = {"lease_expires_at": None, "last_error": error}
+        backoff = models.Case(
+            *[
+                models.When(attempts=n, then=models.Value(now + model.retry_delay(n)))
+                for n in range(model.MAX_ATTEMPTS)
+            ],
+            default=models.Value(now),
+            output_field=models.DateTimeField(),
+        )
+        with transaction.atomic(using=self.db):
+            failed = self.filter(attempts__gte=model.MAX_ATTEMPTS).update(status="failed", **released)
+            retried = self.filter(attempts__lt=model.MAX_ATTEMPTS).update(
+                status="pending", available_at=backoff, **released
+            )
+        return retried, failed
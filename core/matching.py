@@ -0,0 +1,338 @@
+"""
+Candidate <-> job matching on the normalized skill tables.
+
+Jobs and candidates are rows of two sparse 0/1 matrices over the skill
+dictionary (a candidate is represented by their most recent resume). A
+match score combines
+
+* skill overlap: the IDF-weighted share of the job's skills the candidate
+  has, IDF taken over candidates so rare skills count for more than
+  ubiquitous ones, and
+* experience fit: `experience_years / experience_level`, capped at 1.
+
+Scoring one job against every candidate (or the reverse) is a single
+sparse matrix-vector product, and the top K come from `argpartition`.
+"""
+from collections import defaultdict
+
+import numpy as np
+from scipy import sparse
+
+from .indexes import ProcessLocalIndex
+from .models import Candidate, Job, Resume
+
+# Share of the final score given to skill overlap; the rest is experience fit.
+SKILL_WEIGHT = 0.8
+
+
+class SparseRows:
+    """
+    Keyed 0/1 rows with a per-row scalar, stored as a compacted CSR block
+    plus a short list of recently written rows. Writing a row appends it and
+    tombstones the previous version, so an update costs O(row); the pending
+    rows are folded into the CSR block once there are `compact_at` of them.
+    """
+
+    def __init__(self, compact_at=1024):
+        self.compact_at = compact_at
+        self._base = sparse.csr_matrix((0, 0), dtype=np.float64)
+        self._pending = []
+        self._keys = []
+        self._values = []
+        self._row_of = {}
+        self._arrays = None
+
+    @classmethod
+    def build(cls, rows, **kwargs):
+        """Bulk-load (key, cols, value) rows straight into the CSR block."""
+        self = cls(**kwargs)
+        for key, cols, value in rows:
+            self._row_of[key] = len(self._keys)
+            self._keys.append(key)
+            self._values.append(value)
+            self._pending.append(np.unique(np.asarray(cols, dtype=np.int32)))
+        self.compact()
+        return self
+
+    def __len__(self):
+        return len(self._row_of)
+
+    def __contains__(self, key):
+        return key in self._row_of
+
+    def _row_cols(self, row):
+        if row < self._base.shape[0]:
+            start, end = self._base.indptr[row], self._base.indptr[row + 1]
+            return self._base.indices[start:end]
+        return self._pending[row - self._base.shape[0]]
+
+    def get(self, key):
+        """(column indices, value) of `key`'s row, or None."""
+        row = self._row_of.get(key)
+        if row is None:
+            return None
+        return self._row_cols(row), self._values[row]
+
+    def set(self, key, cols, value):
+        self.remove(key)
+        self._row_of[key] = len(self._keys)
+        self._keys.append(key)
+        self._values.append(value)
+        self._pending.append(np.unique(np.asarray(cols, dtype=np.int32)))
+        self._arrays = None
+        if len(self._pending) >= self.compact_at:
+            self.compact()
+
+    def remove(self, key):
+        row = self._row_of.pop(key, None)
+        if row is not None:
+            self._keys[row] = None
+            self._arrays = None
+
+    def compact(self):
+        """Rebuild the CSR block from the live rows, dropping tombstones."""
+        live = [row for row, key in enumerate(self._keys) if key is not None]
+        cols = [self._row_cols(row) for row in live]
+        lengths = np.fromiter((len(c) for c in cols), dtype=np.int64, count=len(cols))
+        indptr = np.concatenate(([0], np.cumsum(lengths)))
+        indices = np.concatenate(cols) if cols else np.zeros(0, dtype=np.int32)
+        n_cols = int(indices.max()) + 1 if len(indices) else 0
+        self._base = sparse.csr_matrix(
+            (np.ones(len(indices)), indices, indptr), shape=(len(live), n_cols)
+        )
+        self._keys = [self._keys[row] for row in live]
+        self._values = [self._values[row] for row in live]
+        self._row_of = {key: row for row, key in enumerate(self._keys)}
+        self._pending = []
+        self._arrays = None
+
+    def column_counts(self, n_cols):
+        """Number of live rows containing each column."""
+        self.compact()
+        return np.bincount(self._base.indices, minlength=n_cols)[:n_cols]
+
+    def arrays(self):
+        """(keys, values, alive mask) aligned with the rows `dot` returns."""
+        if self._arrays is None:
+            self._arrays = (
+                np.array([-1 if key is None else key for key in self._keys], dtype=np.int64),
+                np.array(self._values, dtype=np.float64),
+                np.array([key is not None for key in self._keys], dtype=bool),
+            )
+        return self._arrays
+
+    def dot(self, weights):
+        """Row sums of `weights` over each row's columns, for every row incl. tombstones."""
+        base = self._base
+        out = base @ weights[: base.shape[1]] if base.shape[1] else np.zeros(base.shape[0])
+        if not self._pending:
+            return out
+        tail = np.fromiter(
+            (weights[cols].sum() for cols in self._pending), dtype=np.float64, count=len(self._pending)
+        )
+        return np.concatenate((out, tail))
+
+
+def experience_fit(years, level):
+    """Share of the required experience covered, 1.0 when none is required."""
+    years = np.maximum(np.asarray(years, dtype=np.float64), 0)
+    level = np.asarray(level, dtype=np.float64)
+    safe_level = np.where(level > 0, level, 1)
+    return np.where(level > 0, np.minimum(years / safe_level, 1.0), 1.0)
+
+
+def top_k(scores, k):
+    """Indices of the `k` highest finite scores, best first."""
+    candidates = np.flatnonzero(np.isfinite(scores))
+    if len(candidates) > k:
+        part = np.argpartition(-scores[candidates], k - 1)[:k]
+        candidates = candidates[part]
+    return candidates[np.argsort(-scores[candidates], kind="stable")]
+
+
+class SkillMatcher(ProcessLocalIndex):
+    """
+    Process-local matching index. Loaded from the skill through tables on
+    first use; core.signals feeds it job, candidate and resume changes, and
+    bulk writers (resume parsing, skill extraction, imports) make every
+    process reload it through invalidate_all_processes().
+    """
+    shared_name = "skill_matcher"
+
+    def _load(self):
+        self._columns = {}
+        self._df = np.zeros(0, dtype=np.float64)
+        # candidate id -> (upload_date, resume id) of the resume they are matched on
+        self._current_resume = {}
+
+        job_skills = defaultdict(list)
+        for job_id, skill_id in Job.skills.through.objects.values_list("job_id", "skill_id"):
+            job_skills[job_id].append(skill_id)
+        self._jobs = SparseRows.build(
+            (job_id, self._cols(job_skills[job_id]), level)
+            for job_id, level in Job.objects.values_list("id", "experience_level")
+        )
+
+        for resume_id, candidate_id, uploaded in Resume.objects.values_list("id", "candidate_id", "upload_date"):
+            self._newer_resume(candidate_id, resume_id, uploaded)
+        current = {resume_id: cid for cid, (_, resume_id) in self._current_resume.items()}
+        resume_skills = defaultdict(list)
+        for resume_id, skill_id in Resume.skills.through.objects.values_list("resume_id", "skill_id"):
+            if resume_id in current:
+                resume_skills[resume_id].append(skill_id)
+        years = dict(Candidate.objects.values_list("id", "experience_years"))
+        self._candidates = SparseRows.build(
+            (candidate_id, self._cols(resume_skills[resume_id]), years.get(candidate_id, 0))
+            for resume_id, candidate_id in current.items()
+        )
+        self._cols([])
+        self._df[: len(self._columns)] = self._candidates.column_counts(len(self._columns))
+
+    # -- internal bookkeeping -------------------------------------------------
+
+    def _cols(self, skill_ids):
+        for skill_id in skill_ids:
+            if skill_id not in self._columns:
+                self._columns[skill_id] = len(self._columns)
+        if len(self._columns) > len(self._df):
+            self._df = np.concatenate((self._df, np.zeros(len(self._columns) - len(self._df) + 64)))
+        return [self._columns[skill_id] for skill_id in skill_ids]
+
+    def _newer_resume(self, candidate_id, resume_id, uploaded):
+        current = self._current_resume.get(candidate_id)
+        if current is None or current[1] == resume_id or (uploaded, resume_id) > current:
+            self._current_resume[candidate_id] = (uploaded, resume_id)
+            return True
+        return False
+
+    def _set_candidate(self, candidate_id, skill_ids, years):
+        self._drop_candidate(candidate_id)
+        cols = self._cols(skill_ids)
+        self._candidates.set(candidate_id, cols, years)
+        self._df[np.unique(np.asarray(cols, dtype=np.int64))] += 1
+
+    def _experience_years(self, candidate_id):
+        # Already indexed for a candidate with a resume; one column lookup otherwise
+        row = self._candidates.get(candidate_id)
+        if row is not None:
+            return row[1]
+        years = Candidate.objects.filter(pk=candidate_id).values_list("experience_years", flat=True).first()
+        return years or 0
+
+    def _drop_candidate(self, candidate_id):
+        row = self._candidates.get(candidate_id)
+        if row is not None:
+            self._df[row[0]] -= 1
+            self._candidates.remove(candidate_id)
+
+    def _idf(self):
+        n = len(self._candidates)
+        return np.log((n + 1) / (self._df + 1)) + 1
+
+    # -- incremental updates (only while loaded) ------------------------------
+
+    def job_changed(self, job, skill_ids):
+        with self._lock:
+            if self.is_loaded:
+                self._jobs.set(job.pk, self._cols(skill_ids), job.experience_level)
+
+    def job_deleted(self, job_id):
+        with self._lock:
+            if self.is_loaded:
+                self._jobs.remove(job_id)
+
+    def resume_changed(self, resume, skill_ids):
+        with self._lock:
+            if not self.is_loaded:
+                return
+            if self._newer_resume(resume.candidate_id, resume.pk, resume.upload_date):
+                self._set_candidate(resume.candidate_id, skill_ids, self._experience_years(resume.candidate_id))
+
+    def resume_deleted(self, resume_id, candidate_id):
+        with self._lock:
+            if not self.is_loaded:
+                return
+            current = self._current_resume.get(candidate_id)
+            if current is None or current[1] != resume_id:
+                return
+            # Fall back to the candidate's previous resume, if any
+            del self._current_resume[candidate_id]
+            self._drop_candidate(candidate_id)
+            previous = (
+                Resume.objects.filter(candidate_id=candidate_id)
+                .exclude(pk=resume_id)
+                .order_by("-upload_date", "-id")
+                .first()
+            )
+            if previous is not None:
+                skill_ids = list(previous.skills.values_list("id", flat=True))
+                self.resume_changed(previous, skill_ids)
+
+    def candidate_changed(self, candidate):
+        with self._lock:
+            if not self.is_loaded:
+                return
+            row = self._candidates.get(candidate.pk)
+            if row is not None and row[1] != candidate.experience_years:
+                self._candidates.set(candidate.pk, row[0], candidate.experience_years)
+
+    def candidate_deleted(self, candidate_id):
+        with self._lock:
+            if self.is_loaded:
+                self._current_resume.pop(candidate_id, None)
+                self._drop_candidate(candidate_id)
+
+    # -- queries ----------------------------------------------------------------
+
+    def _results(self, keys, scores, overlap, fit, k):
+        best = top_k(scores, k)
+        return [
+            {
+                "id": int(keys[i]),
+                "score": round(float(scores[i]), 4),
+                "skill_score": round(float(overlap[i]), 4),
+                "experience_fit": round(float(fit[i]), 4),
+            }
+            for i in best
+        ]
+
+    def candidates_for_job(self, job_id, k=20):
+        """Top `k` candidates for a job as dicts of id and score components."""
+        self.ensure_loaded()
+        with self._lock:
+            row = self._jobs.get(job_id)
+            if row is None or not len(row[0]):
+                return []
+            cols, level = row
+            idf = self._idf()
+            weights = np.zeros(len(idf))
+            weights[cols] = idf[cols]
+            overlap = self._candidates.dot(weights) / weights.sum()
+            keys, years, alive = self._candidates.arrays()
+            fit = experience_fit(years, level)
+            scores = SKILL_WEIGHT * overlap + (1 - SKILL_WEIGHT) * fit
+            scores[~alive | (overlap <= 0)] = -np.inf
+            return self._results(keys, scores, overlap, fit, k)
+
+    def jobs_for_candidate(self, candidate_id, k=20):
+        """Top `k` jobs for a candidate as dicts of id and score components."""
+        self.ensure_loaded()
+        with self._lock:
+            row = self._candidates.get(candidate_id)
+            if row is None or not len(row[0]):
+                return []
+            cols, years = row
+            idf = self._idf()
+            has = np.zeros(len(idf))
+            has[cols] = 1
+            matched = self._jobs.dot(has * idf)
+            required = self._jobs.dot(idf)
+            overlap = np.divide(matched, required, out=np.zeros_like(matched), where=required > 0)
+            keys, levels, alive = self._jobs.arrays()
+            fit = experience_fit(years, levels)
+            scores = SKILL_WEIGHT * overlap + (1 - SKILL_WEIGHT) * fit
+            scores[~alive | (overlap <= 0)] = -np.inf
+            return self._results(keys, scores, overlap, fit, k)
+
+
+skill_matcher = SkillMatcher()
@@ -0,0 +1,30 @@
+# Generated by Django 4.2.30 on 2026-10-18 04:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="audioprocessingtask",
+            name="lease_expires_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="audioprocessingtask",
+            name="worker_id",
+            field=models.CharField(blank=True, default="", max_length=255),
+        ),
+        migrations.AddIndex(
+            model_name="audioprocessingtask",
+            index=models.Index(
+                fields=["task_status", "created_at"],
+                name="audio_task_status_created_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 4.2.30 on 2026-10-18 04:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0002_audioprocessingtask_lease"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="WorkerHeartbeat",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("worker_id", models.CharField(max_length=255, unique=True)),
+                ("last_seen", models.DateTimeField(db_index=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,62 @@
+# Generated by Django 4.2.30 on 2026-10-18 04:24
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0003_workerheartbeat"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="audioprocessingtask",
+            name="audio_task_status_created_idx",
+        ),
+        migrations.AddField(
+            model_name="audioprocessingtask",
+            name="attempts",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="audioprocessingtask",
+            name="available_at",
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.AddField(
+            model_name="audioprocessingtask",
+            name="last_error",
+            field=models.TextField(blank=True, default=""),
+        ),
+        migrations.AlterField(
+            model_name="audioprocessingtask",
+            name="task_status",
+            field=models.CharField(
+                choices=[
+                    ("pending", "Pending"),
+                    ("processing", "Processing"),
+                    ("done", "Done"),
+                    ("failed", "Failed"),
+                    ("dead", "Dead Letter"),
+                ],
+                default="pending",
+                max_length=20,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="audioprocessingtask",
+            index=models.Index(
+                fields=["task_status", "available_at"],
+                name="audio_task_status_avail_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="audioprocessingtask",
+            index=models.Index(
+                fields=["task_status", "lease_expires_at"],
+                name="audio_task_status_lease_idx",
+            ),
+        ),
+    ]
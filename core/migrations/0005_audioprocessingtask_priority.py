@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-10-18 04:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0004_audioprocessingtask_retries"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="audioprocessingtask",
+            name="priority",
+            field=models.PositiveSmallIntegerField(
+                choices=[(0, "Backfill"), (5, "Normal"), (10, "Live Interview")],
+                default=5,
+            ),
+        ),
+    ]
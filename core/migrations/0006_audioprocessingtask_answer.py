@@ -0,0 +1,24 @@
+# Generated by Django 4.2.30 on 2026-10-18 04:26
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0005_audioprocessingtask_priority"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="audioprocessingtask",
+            name="answer",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                to="core.candidateanswer",
+            ),
+        ),
+    ]
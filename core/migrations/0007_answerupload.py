@@ -0,0 +1,57 @@
+# Generated by Django 4.2.30 on 2026-10-18 04:28
+
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0006_audioprocessingtask_answer"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AnswerUpload",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("filename", models.CharField(blank=True, max_length=255)),
+                ("total_size", models.PositiveBigIntegerField(blank=True, null=True)),
+                ("received_bytes", models.PositiveBigIntegerField(default=0)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "answer",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        to="core.candidateanswer",
+                    ),
+                ),
+                (
+                    "interview_session",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="core.interviewsession",
+                    ),
+                ),
+                (
+                    "question",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="core.generatedquestion",
+                    ),
+                ),
+            ],
+        ),
+    ]
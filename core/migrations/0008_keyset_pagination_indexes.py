@@ -0,0 +1,35 @@
+# Generated by Django 4.2.30 on 2026-10-18 04:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0007_answerupload"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="candidate",
+            name="created_at",
+            field=models.DateTimeField(auto_now_add=True, db_index=True),
+        ),
+        migrations.AlterField(
+            model_name="job",
+            name="created_at",
+            field=models.DateTimeField(auto_now_add=True, db_index=True),
+        ),
+        migrations.AlterField(
+            model_name="resume",
+            name="upload_date",
+            field=models.DateTimeField(auto_now_add=True, db_index=True),
+        ),
+        migrations.AddIndex(
+            model_name="generatedquestion",
+            index=models.Index(
+                fields=["interview_session", "created_at"],
+                name="genq_session_created_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,70 @@
+from django.db import migrations
+
+SQLITE_FORWARD = [
+    """
+    CREATE VIRTUAL TABLE core_resume_fts USING fts5(
+        parsed_text, content='core_resume', content_rowid='id', tokenize='porter unicode61'
+    )
+    """,
+    """
+    CREATE TRIGGER core_resume_fts_ai AFTER INSERT ON core_resume BEGIN
+        INSERT INTO core_resume_fts(rowid, parsed_text) VALUES (new.id, new.parsed_text);
+    END
+    """,
+    """
+    CREATE TRIGGER core_resume_fts_ad AFTER DELETE ON core_resume BEGIN
+        INSERT INTO core_resume_fts(core_resume_fts, rowid, parsed_text)
+        VALUES ('delete', old.id, old.parsed_text);
+    END
+    """,
+    """
+    CREATE TRIGGER core_resume_fts_au AFTER UPDATE OF parsed_text ON core_resume BEGIN
+        INSERT INTO core_resume_fts(core_resume_fts, rowid, parsed_text)
+        VALUES ('delete', old.id, old.parsed_text);
+        INSERT INTO core_resume_fts(rowid, parsed_text) VALUES (new.id, new.parsed_text);
+    END
+    """,
+    "INSERT INTO core_resume_fts(core_resume_fts) VALUES ('rebuild')",
+]
+
+SQLITE_REVERSE = [
+    "DROP TRIGGER IF EXISTS core_resume_fts_ai",
+    "DROP TRIGGER IF EXISTS core_resume_fts_ad",
+    "DROP TRIGGER IF EXISTS core_resume_fts_au",
+    "DROP TABLE IF EXISTS core_resume_fts",
+]
+
+POSTGRESQL_FORWARD = [
+    "CREATE INDEX core_resume_parsed_text_fts ON core_resume "
+    "USING GIN (to_tsvector('english', COALESCE(parsed_text, '')))",
+]
+
+POSTGRESQL_REVERSE = [
+    "DROP INDEX IF EXISTS core_resume_parsed_text_fts",
+]
+
+
+def _run(statements_by_vendor):
+    def run(apps, schema_editor):
+        for statement in statements_by_vendor.get(schema_editor.connection.vendor, []):
+            schema_editor.execute(statement)
+    return run
+
+
+class Migration(migrations.Migration):
+    """
+    Full-text index over Resume.parsed_text: an FTS5 table kept in sync by
+    triggers on SQLite, a GIN expression index on PostgreSQL. Other backends
+    fall back to icontains (see core.search).
+    """
+
+    dependencies = [
+        ("core", "0008_keyset_pagination_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            _run({"sqlite": SQLITE_FORWARD, "postgresql": POSTGRESQL_FORWARD}),
+            _run({"sqlite": SQLITE_REVERSE, "postgresql": POSTGRESQL_REVERSE}),
+        ),
+    ]
@@ -0,0 +1,66 @@
+# Generated by Django 4.2.30 on 2026-10-18 04:31
+
+from django.db import migrations, models
+
+
+def backfill_skill_links(apps, schema_editor):
+    Skill = apps.get_model("core", "Skill")
+    for model_name, json_field in (
+        ("Job", "skills_required"),
+        ("Resume", "parsed_skills"),
+    ):
+        model = apps.get_model("core", model_name)
+        through = model.skills.through
+        owner = f"{model._meta.model_name}_id"
+        links = []
+        for pk, names in model.objects.values_list("pk", json_field).iterator():
+            if not isinstance(names, list):
+                continue
+            for name in {
+                " ".join(str(n).split()).lower()[:100]
+                for n in names
+                if isinstance(n, str)
+            } - {""}:
+                skill, _ = Skill.objects.get_or_create(name=name)
+                links.append(through(**{owner: pk, "skill_id": skill.id}))
+        through.objects.bulk_create(links, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0009_resume_fulltext_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Skill",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("name", models.CharField(max_length=100, unique=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name="job",
+            name="skills",
+            field=models.ManyToManyField(
+                blank=True, related_name="jobs", to="core.skill"
+            ),
+        ),
+        migrations.AddField(
+            model_name="resume",
+            name="skills",
+            field=models.ManyToManyField(
+                blank=True, related_name="resumes", to="core.skill"
+            ),
+        ),
+        migrations.RunPython(backfill_skill_links, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-18 04:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0010_skill_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="skill",
+            name="aliases",
+            field=models.JSONField(blank=True, default=list),
+        ),
+    ]
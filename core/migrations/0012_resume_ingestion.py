@@ -0,0 +1,43 @@
+# Generated by Django 4.2.30 on 2026-10-18 04:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0011_skill_aliases"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="resume",
+            name="content_hash",
+            field=models.CharField(blank=True, db_index=True, max_length=64),
+        ),
+        migrations.AddField(
+            model_name="resume",
+            name="parse_error",
+            field=models.TextField(blank=True),
+        ),
+        migrations.AddField(
+            model_name="resume",
+            name="parse_lease_expires_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="resume",
+            name="parse_status",
+            field=models.CharField(
+                choices=[
+                    ("pending", "Pending"),
+                    ("processing", "Processing"),
+                    ("done", "Done"),
+                    ("failed", "Failed"),
+                ],
+                db_index=True,
+                default="pending",
+                max_length=20,
+            ),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 4.2.30 on 2026-10-18 04:42
+
+from django.db import migrations, models
+
+
+def mark_existing_question_sets_ready(apps, schema_editor):
+    InterviewSession = apps.get_model("core", "InterviewSession")
+    GeneratedQuestion = apps.get_model("core", "GeneratedQuestion")
+    InterviewSession.objects.filter(
+        id__in=GeneratedQuestion.objects.values("interview_session_id")
+    ).update(questions_status="ready")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0012_resume_ingestion"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="interviewsession",
+            name="questions_status",
+            field=models.CharField(
+                choices=[
+                    ("pending", "Pending"),
+                    ("ready", "Ready"),
+                    ("failed", "Failed"),
+                ],
+                default="pending",
+                max_length=20,
+            ),
+        ),
+        migrations.RunPython(
+            mark_existing_question_sets_ready, migrations.RunPython.noop
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 4.2.30 on 2026-10-18 05:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0014_outbound_email"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="audioprocessingtask",
+            index=models.Index(
+                fields=["task_status", "-priority", "available_at", "id"],
+                name="audio_task_claim_order_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="audioprocessingtask",
+            index=models.Index(
+                fields=["task_status", "interview_session", "id"],
+                name="audio_task_status_session_idx",
+            ),
+        ),
+    ]
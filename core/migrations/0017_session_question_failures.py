@@ -0,0 +1,23 @@
+# Generated by Django 4.2.30 on 2026-10-18 05:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0016_index_version"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="interviewsession",
+            name="questions_failures",
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="interviewsession",
+            name="questions_last_error",
+            field=models.TextField(blank=True, default=""),
+        ),
+    ]
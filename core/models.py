@@ -1,8 +1,15 @@
+import os
+import tempfile
+import uuid
+from datetime import timedelta
+
 from django.db import models
 from django.conf import settings
 from django.utils import timezone
 from django.contrib.auth.models import AbstractUser
-from .managers import CustomUserManager
+from .managers import (
+    AnswerUploadQuerySet, AudioProcessingTaskQuerySet, CustomUserManager, OutboundEmailQuerySet, ResumeQuerySet,
+)
 
 
 User = settings.AUTH_USER_MODEL  # Custom user model
@@ -18,13 +25,28 @@ class Job(models.Model):
     skills_required = models.JSONField(default=list)
     experience_level = models.IntegerField()
     created_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True)
-    created_at = models.DateTimeField(auto_now_add=True)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
     updated_at = models.DateTimeField(auto_now=True)
+    # Normalized copy of skills_required, kept in sync by core.signals
+    skills = models.ManyToManyField("Skill", blank=True, related_name="jobs")
 
     def __str__(self):
         return self.job_title
 
 
+# ============================================================
+# 1b. SKILL DICTIONARY
+# ============================================================
+class Skill(models.Model):
+    """Canonical (lower-cased, whitespace-collapsed) skill shared by jobs and resumes."""
+    name = models.CharField(max_length=100, unique=True)
+    # Other spellings matched in resume text, e.g. ["k8s"] for "kubernetes"
+    aliases = models.JSONField(default=list, blank=True)
+
+    def __str__(self):
+        return self.name
+
+
 # ============================================================
 # 2. CANDIDATE TABLE
 # ============================================================
@@ -43,7 +65,7 @@ class Candidate(models.Model):
         ("selected", "Selected"),
     ]
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="new")
-    created_at = models.DateTimeField(auto_now_add=True)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
 
     def __str__(self):
         return self.full_name
@@ -76,7 +98,25 @@ class Resume(models.Model):
     resume_file = models.FileField(upload_to="resumes/")
     parsed_text = models.TextField(blank=True, null=True)
     parsed_skills = models.JSONField(default=list)
-    upload_date = models.DateTimeField(auto_now_add=True)
+    upload_date = models.DateTimeField(auto_now_add=True, db_index=True)
+    # Normalized copy of parsed_skills, kept in sync by core.signals
+    skills = models.ManyToManyField(Skill, blank=True, related_name="resumes")
+
+    # SHA-256 of the uploaded file; identical uploads share one stored blob and one parse
+    content_hash = models.CharField(max_length=64, blank=True, db_index=True)
+
+    # Text extraction happens off the request path (manage.py parse_resumes)
+    PARSE_STATUS_CHOICES = [
+        ("pending", "Pending"),
+        ("processing", "Processing"),
+        ("done", "Done"),
+        ("failed", "Failed"),
+    ]
+    parse_status = models.CharField(max_length=20, choices=PARSE_STATUS_CHOICES, default="pending", db_index=True)
+    parse_error = models.TextField(blank=True)
+    parse_lease_expires_at = models.DateTimeField(null=True, blank=True)
+
+    objects = ResumeQuerySet.as_manager()
 
     def __str__(self):
         return f"Resume of {self.candidate.full_name}"
@@ -101,6 +141,24 @@ class InterviewSession(models.Model):
     total_score = models.FloatField(null=True, blank=True)
     feedback = models.TextField(blank=True, null=True)
 
+    # GeneratedQuestion set is prepared in the background (core.pregeneration)
+    QUESTIONS_STATUS_CHOICES = [
+        ("pending", "Pending"),
+        ("ready", "Ready"),
+        ("failed", "Failed"),
+    ]
+    questions_status = models.CharField(max_length=20, choices=QUESTIONS_STATUS_CHOICES, default="pending")
+    questions_failures = models.PositiveSmallIntegerField(default=0)
+    questions_last_error = models.TextField(blank=True, default="")
+
+    @property
+    def questions_exhausted(self):
+        """Generation failed too often to be retried automatically."""
+        return (
+            self.questions_status == "failed"
+            and self.questions_failures >= settings.QUESTION_GENERATION_MAX_ATTEMPTS
+        )
+
     def __str__(self):
         return f"Interview Session: {self.id} - {self.candidate.full_name}"
 
@@ -135,6 +193,11 @@ class GeneratedQuestion(models.Model):
     weightage = models.FloatField(default=1.0)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["interview_session", "created_at"], name="genq_session_created_idx"),
+        ]
+
     def __str__(self):
         return f"Generated Question for Session {self.interview_session.id}"
 
@@ -152,6 +215,40 @@ class CandidateAnswer(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
 
 
+class AnswerUpload(models.Model):
+    """
+    A resumable, chunked upload of one answer's audio. Chunks are appended to
+    a part file on disk; finalizing creates the CandidateAnswer. Uploads left
+    untouched for ANSWER_UPLOAD_TTL seconds expire and are deleted, with
+    their part files, by `manage.py cleanup_answer_uploads`.
+    """
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    interview_session = models.ForeignKey(InterviewSession, on_delete=models.CASCADE)
+    question = models.ForeignKey(GeneratedQuestion, on_delete=models.CASCADE)
+    filename = models.CharField(max_length=255, blank=True)
+    total_size = models.PositiveBigIntegerField(null=True, blank=True)
+    received_bytes = models.PositiveBigIntegerField(default=0)
+    answer = models.ForeignKey(CandidateAnswer, on_delete=models.SET_NULL, null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = AnswerUploadQuerySet.as_manager()
+
+    @property
+    def part_path(self):
+        return os.path.join(answer_upload_dir(), f"{self.id}.part")
+
+    @property
+    def is_expired(self):
+        """Unfinalized and idle for longer than ANSWER_UPLOAD_TTL."""
+        idle = timezone.now() - self.updated_at
+        return self.answer_id is None and idle > timedelta(seconds=settings.ANSWER_UPLOAD_TTL)
+
+
+def answer_upload_dir():
+    return os.path.join(settings.FILE_UPLOAD_TEMP_DIR or tempfile.gettempdir(), "answer_uploads")
+
+
 # ============================================================
 # 9. AUDIO PROCESSING QUEUE
 # (Internal queue instead of Redis/RabbitMQ)
@@ -159,6 +256,7 @@ class CandidateAnswer(models.Model):
 class AudioProcessingTask(models.Model):
     interview_session = models.ForeignKey(InterviewSession, on_delete=models.CASCADE)
     question = models.ForeignKey(GeneratedQuestion, on_delete=models.CASCADE)
+    answer = models.ForeignKey(CandidateAnswer, on_delete=models.CASCADE, null=True, blank=True)
     audio_file = models.FileField(upload_to="processing/audio/")
     
     STATUS_CHOICES = [
@@ -166,11 +264,62 @@ class AudioProcessingTask(models.Model):
         ("processing", "Processing"),
         ("done", "Done"),
         ("failed", "Failed"),
+        ("dead", "Dead Letter"),
     ]
     task_status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="pending")
+    # Lease held by the worker that claimed the task; an expired lease makes
+    # the task claimable again.
+    worker_id = models.CharField(max_length=255, blank=True, default="")
+    lease_expires_at = models.DateTimeField(null=True, blank=True)
+    # Retry bookkeeping: a failed task goes back to "pending" with an
+    # exponentially later available_at until MAX_ATTEMPTS, then to "dead".
+    attempts = models.PositiveIntegerField(default=0)
+    available_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True, default="")
+
+    PRIORITY_BACKFILL = 0
+    PRIORITY_NORMAL = 5
+    PRIORITY_LIVE = 10
+    PRIORITY_CHOICES = [
+        (PRIORITY_BACKFILL, "Backfill"),
+        (PRIORITY_NORMAL, "Normal"),
+        (PRIORITY_LIVE, "Live Interview"),
+    ]
+    priority = models.PositiveSmallIntegerField(choices=PRIORITY_CHOICES, default=PRIORITY_NORMAL)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    MAX_ATTEMPTS = 5
+    RETRY_BACKOFF_SECONDS = 30
+    RETRY_BACKOFF_MAX_SECONDS = 3600
+
+    objects = AudioProcessingTaskQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["task_status", "available_at"], name="audio_task_status_avail_idx"),
+            # claim_window(): the head of the queue, and each session's oldest task
+            models.Index(fields=["task_status", "-priority", "available_at", "id"], name="audio_task_claim_order_idx"),
+            models.Index(fields=["task_status", "interview_session", "id"], name="audio_task_status_session_idx"),
+            models.Index(fields=["task_status", "lease_expires_at"], name="audio_task_status_lease_idx"),
+        ]
+
+    @classmethod
+    def retry_delay(cls, attempts):
+        """Backoff before the next try after `attempts` failed tries."""
+        return timedelta(
+            seconds=min(cls.RETRY_BACKOFF_SECONDS * 2 ** max(attempts - 1, 0), cls.RETRY_BACKOFF_MAX_SECONDS)
+        )
+
+
+class WorkerHeartbeat(models.Model):
+    """Last time each audio worker checked in; used to reap its tasks if it dies."""
+    worker_id = models.CharField(max_length=255, unique=True)
+    last_seen = models.DateTimeField(db_index=True)
+
+    def __str__(self):
+        return self.worker_id
+
 
 # ============================================================
 # 10. ERROR LOGS
@@ -258,3 +407,80 @@ class QuestionBank(models.Model):
 
     def __str__(self):
         return self.question_text
+
+
+# ============================================================
+# 14. EMAIL OUTBOX
+# ============================================================
+class OutboundEmail(models.Model):
+    """
+    A rendered email waiting for `manage.py send_queued_emails`. Queued by
+    core.mail.OutboxEmailBackend, so sending mail from a request is one INSERT.
+    """
+    STATUS_CHOICES = [
+        ("pending", "Pending"),
+        ("sending", "Sending"),
+        ("sent", "Sent"),
+        ("failed", "Failed"),
+    ]
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="pending")
+
+    subject = models.TextField(blank=True, default="")
+    body = models.TextField(blank=True, default="")
+    from_email = models.CharField(max_length=255, blank=True, default="")
+    to = models.JSONField(default=list)
+    cc = models.JSONField(default=list)
+    bcc = models.JSONField(default=list)
+    reply_to = models.JSONField(default=list)
+    headers = models.JSONField(default=dict)
+    # [[content, mimetype], ...], e.g. the HTML part of a multipart message
+    alternatives = models.JSONField(default=list)
+    # [{"filename", "content", "mimetype", "base64"}, ...]
+    attachments = models.JSONField(default=list)
+
+    # Same retry scheme as AudioProcessingTask: a failed send goes back to
+    # "pending" with an exponentially later available_at until MAX_ATTEMPTS.
+    attempts = models.PositiveIntegerField(default=0)
+    available_at = models.DateTimeField(default=timezone.now)
+    lease_expires_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True, default="")
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    MAX_ATTEMPTS = 5
+    RETRY_BACKOFF_SECONDS = 60
+    RETRY_BACKOFF_MAX_SECONDS = 3600
+
+    objects = OutboundEmailQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["status", "available_at"], name="outbound_email_status_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.subject} -> {', '.join(self.to)}"
+
+    @classmethod
+    def retry_delay(cls, attempts):
+        """Backoff before the next try after `attempts` failed tries."""
+        return timedelta(
+            seconds=min(cls.RETRY_BACKOFF_SECONDS * 2 ** max(attempts - 1, 0), cls.RETRY_BACKOFF_MAX_SECONDS)
+        )
+
+
+# ============================================================
+# 15. PROCESS-LOCAL INDEX VERSIONS
+# ============================================================
+class IndexVersion(models.Model):
+    """
+    Version stamp shared by every process's copy of one core.indexes
+    ProcessLocalIndex. Writers that bypass model signals bump it; each
+    process reloads its copy when it sees the stamp change.
+    """
+    name = models.CharField(max_length=100, unique=True)
+    version = models.PositiveBigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.name} v{self.version}"
@@ -0,0 +1,169 @@
+"""
+Near-duplicate detection for QuestionBank questions with MinHash + LSH.
+
+Each question is reduced to a MinHash signature over its word unigrams and
+bigrams; the share of equal signature slots estimates the Jaccard
+similarity of two questions. Signatures are split into bands and every
+band is hashed into a bucket, so a lookup only compares against questions
+sharing at least one bucket instead of the whole bank. With 32 bands of 4
+rows, a pair at the default 0.7 similarity shares a bucket with
+probability above 99.9%, while pairs below 0.2 rarely do; candidates are
+then checked against the threshold on the full signature.
+"""
+import zlib
+from collections import defaultdict
+from itertools import combinations
+
+import numpy as np
+
+from .indexes import ProcessLocalIndex
+from .models import QuestionBank
+from .question_ranking import tokenize
+
+NUM_PERM = 128
+BANDS = 32
+ROWS = NUM_PERM // BANDS
+# Estimated Jaccard similarity at which two questions count as near-duplicates
+DUPLICATE_THRESHOLD = 0.7
+# Buckets bigger than this are compared against one representative, not pairwise
+MAX_PAIRWISE_BUCKET = 200
+
+_PRIME = (1 << 31) - 1
+# Fixed seed: signatures must agree across processes and restarts
+_rng = np.random.RandomState(0x5EED)
+_A = _rng.randint(1, _PRIME, NUM_PERM).astype(np.uint64)
+_B = _rng.randint(0, _PRIME, NUM_PERM).astype(np.uint64)
+
+
+def shingles(text):
+    tokens = tokenize(text)
+    return set(tokens) | {f"{a} {b}" for a, b in zip(tokens, tokens[1:])}
+
+
+def signature(text):
+    """MinHash signature of `text`, or None when it has no words."""
+    found = shingles(text)
+    if not found:
+        return None
+    hashes = np.fromiter((zlib.crc32(s.encode()) for s in found), dtype=np.uint64, count=len(found))
+    return ((_A[:, None] * hashes[None, :] + _B[:, None]) % _PRIME).min(axis=1)
+
+
+def similarity(a, b):
+    return float(np.mean(a == b))
+
+
+class MinHashLSH:
+    """Keyed MinHash signatures with banded LSH buckets."""
+
+    def __init__(self):
+        self._signatures = {}
+        self._buckets = [defaultdict(set) for _ in range(BANDS)]
+
+    def __len__(self):
+        return len(self._signatures)
+
+    def _bands(self, sig):
+        return [sig[band * ROWS:(band + 1) * ROWS].tobytes() for band in range(BANDS)]
+
+    def add(self, key, sig):
+        self.remove(key)
+        if sig is None:
+            return
+        self._signatures[key] = sig
+        for buckets, band in zip(self._buckets, self._bands(sig)):
+            buckets[band].add(key)
+
+    def remove(self, key):
+        sig = self._signatures.pop(key, None)
+        if sig is None:
+            return
+        for buckets, band in zip(self._buckets, self._bands(sig)):
+            bucket = buckets[band]
+            bucket.discard(key)
+            if not bucket:
+                del buckets[band]
+
+    def query(self, sig, threshold=DUPLICATE_THRESHOLD, exclude=None):
+        """[(key, similarity)] of stored signatures similar to `sig`, most similar first."""
+        if sig is None:
+            return []
+        candidates = set()
+        for buckets, band in zip(self._buckets, self._bands(sig)):
+            candidates |= buckets.get(band, set())
+        candidates.discard(exclude)
+        found = [(key, similarity(sig, self._signatures[key])) for key in candidates]
+        return sorted((match for match in found if match[1] >= threshold), key=lambda m: (-m[1], m[0]))
+
+    def clusters(self, threshold=DUPLICATE_THRESHOLD):
+        """Groups of keys linked by similarity >= threshold, from colliding buckets only."""
+        parent = {}
+
+        def find(key):
+            parent.setdefault(key, key)
+            while parent[key] != key:
+                parent[key] = parent[parent[key]]
+                key = parent[key]
+            return key
+
+        def union(a, b):
+            parent[find(a)] = find(b)
+
+        seen = set()
+        for buckets in self._buckets:
+            for bucket in buckets.values():
+                if len(bucket) < 2:
+                    continue
+                members = sorted(bucket)
+                if len(members) > MAX_PAIRWISE_BUCKET:
+                    pairs = ((members[0], other) for other in members[1:])
+                else:
+                    pairs = combinations(members, 2)
+                for a, b in pairs:
+                    if (a, b) in seen:
+                        continue
+                    seen.add((a, b))
+                    if similarity(self._signatures[a], self._signatures[b]) >= threshold:
+                        union(a, b)
+
+        groups = defaultdict(list)
+        for key in parent:
+            groups[find(key)].append(key)
+        return sorted(
+            (sorted(group) for group in groups.values() if len(group) > 1),
+            key=lambda group: (-len(group), group[0]),
+        )
+
+
+class DuplicateQuestionIndex(ProcessLocalIndex):
+    """Process-local LSH index over QuestionBank.question_text."""
+
+    def _load(self):
+        self._lsh = MinHashLSH()
+        for question_id, text in QuestionBank.objects.order_by("id").values_list("id", "question_text").iterator(chunk_size=5000):
+            self._lsh.add(question_id, signature(text))
+
+    def question_changed(self, question):
+        with self._lock:
+            if self.is_loaded:
+                self._lsh.add(question.pk, signature(question.question_text))
+
+    def question_deleted(self, question_id):
+        with self._lock:
+            if self.is_loaded:
+                self._lsh.remove(question_id)
+
+    def find(self, text, exclude=None, threshold=DUPLICATE_THRESHOLD):
+        """[(question id, similarity)] of bank questions near-duplicating `text`."""
+        self.ensure_loaded()
+        sig = signature(text)
+        with self._lock:
+            return self._lsh.query(sig, threshold, exclude)
+
+    def clusters(self, threshold=DUPLICATE_THRESHOLD):
+        self.ensure_loaded()
+        with self._lock:
+            return self._lsh.clusters(threshold)
+
+
+duplicate_questions = DuplicateQuestionIndex()
@@ -0,0 +1,79 @@
+import asyncio
+import threading
+import time
+
+
+class TaskNotifier:
+    """
+    In-process wake-up signal for workers long-polling the audio queue.
+
+    Every notify() bumps a version counter. Sync waiters block on a condition
+    variable (WSGI threads); async waiters park a future on their own event
+    loop (ASGI), so an idle long-poll costs neither a thread nor a query.
+    Only waiters in the same process are woken; the others still return when
+    their timeout runs out.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._version = 0
+        self._async_waiters = set()
+
+    @property
+    def version(self):
+        return self._version
+
+    def notify(self):
+        with self._cond:
+            self._version += 1
+            self._cond.notify_all()
+            waiters, self._async_waiters = self._async_waiters, set()
+        for loop, future in waiters:
+            loop.call_soon_threadsafe(_resolve, future)
+
+    def wait(self, since, timeout):
+        """Block until the version moves past `since`; False on timeout."""
+        with self._cond:
+            return self._cond.wait_for(lambda: self._version != since, timeout)
+
+    async def async_wait(self, since, timeout):
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        waiter = (loop, future)
+        with self._cond:
+            if self._version != since:
+                return True
+            self._async_waiters.add(waiter)
+        try:
+            await asyncio.wait_for(future, timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            with self._cond:
+                self._async_waiters.discard(waiter)
+
+
+def _resolve(future):
+    if not future.done():
+        future.set_result(None)
+
+
+def long_poll(fetch, timeout, notifier=None):
+    """
+    Call `fetch` until it returns something truthy or `timeout` seconds pass.
+    `fetch` runs once up front and again only after a wake-up (or once more at
+    the deadline, to pick up work enqueued by other processes).
+    """
+    notifier = notifier or task_notifier
+    deadline = time.monotonic() + timeout
+    while True:
+        since = notifier.version
+        result = fetch()
+        remaining = deadline - time.monotonic()
+        if result or remaining <= 0:
+            return result
+        notifier.wait(since, remaining)
+
+
+task_notifier = TaskNotifier()
@@ -0,0 +1,38 @@
+from rest_framework.pagination import CursorPagination
+
+
+class KeysetPagination(CursorPagination):
+    """
+    Cursor (keyset) pagination: each page is a WHERE on the indexed ordering
+    column instead of an OFFSET, so deep pages cost the same as the first.
+    The trailing id keeps the order stable when timestamps tie.
+    """
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 500
+
+
+class NewestFirstPagination(KeysetPagination):
+    ordering = ("-created_at", "-id")
+
+
+class OldestFirstPagination(KeysetPagination):
+    ordering = ("created_at", "id")
+
+
+class ResumePagination(KeysetPagination):
+    ordering = ("-upload_date", "-id")
+
+    def get_ordering(self, request, queryset, view):
+        # Full-text searches page through results by relevance instead.
+        if "search_rank" in queryset.query.annotations:
+            return ("search_rank", "-upload_date", "-id")
+        return super().get_ordering(request, queryset, view)
+
+
+class QuestionBankPagination(KeysetPagination):
+    ordering = ("-id",)
+
+
+class TaskQueuePagination(KeysetPagination):
+    ordering = ("available_at", "id")
@@ -0,0 +1,96 @@
+"""
+Background preparation of an interview session's questions.
+
+Session creation schedules `generate_session_questions` on a small thread
+pool once its transaction commits, so the session's question set (bank
+questions from the cached pools plus questions from the configured
+generation backend) is usually in place before the candidate asks for it.
+The questions endpoint schedules it again for any session still pending or
+failed, which also covers sessions whose process went away mid-generation.
+Each failure is counted on the session with its error; once
+QUESTION_GENERATION_MAX_ATTEMPTS have failed the session is left alone and
+the endpoint reports it as failed.
+"""
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django import db
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+
+from .models import GeneratedQuestion, InterviewSession
+from .question_backends import get_question_backend
+from .question_pools import select_questions
+from .skills import normalize_skills
+
+logger = logging.getLogger(__name__)
+
+_executor = ThreadPoolExecutor(
+    max_workers=settings.QUESTION_PREGENERATION_THREADS,
+    thread_name_prefix="question-pregen",
+)
+_lock = threading.Lock()
+_in_flight = set()
+
+
+def schedule_question_generation(session_id):
+    """Queue generation for a session unless this process is already on it."""
+    with _lock:
+        if session_id in _in_flight:
+            return
+        _in_flight.add(session_id)
+    _executor.submit(_run, session_id)
+
+
+def _run(session_id):
+    try:
+        generate_session_questions(session_id)
+    except Exception as exc:
+        logger.exception("Question generation failed for interview session %s", session_id)
+        InterviewSession.objects.exclude(questions_status="ready").filter(pk=session_id).update(
+            questions_status="failed",
+            questions_failures=F("questions_failures") + 1,
+            questions_last_error=f"{type(exc).__name__}: {exc}",
+        )
+    finally:
+        with _lock:
+            _in_flight.discard(session_id)
+        # Worker threads hold their own connections
+        db.connections.close_all()
+
+
+def generate_session_questions(session_id):
+    """
+    Build and store the question set of one session. Safe to call more than
+    once or from several processes: only the call that flips the session to
+    "ready" inserts its questions. Returns True if this call did.
+    """
+    session = InterviewSession.objects.select_related("job").get(pk=session_id)
+    if session.questions_status == "ready":
+        return False
+    job = session.job
+    drafts = get_question_backend().generate(
+        job.job_title, normalize_skills(job.skills_required), settings.AI_QUESTIONS_PER_SESSION,
+    )
+    questions = [
+        GeneratedQuestion(interview_session_id=session_id, question_text=text)
+        for text in select_questions(job)
+    ]
+    questions += [
+        GeneratedQuestion(
+            interview_session_id=session_id,
+            question_text=draft.question_text,
+            expected_answer=draft.expected_answer,
+            weightage=draft.weightage,
+        )
+        for draft in drafts
+    ]
+    with transaction.atomic():
+        claimed = InterviewSession.objects.filter(
+            pk=session_id, questions_status__in=["pending", "failed"],
+        ).update(questions_status="ready")
+        if claimed:
+            GeneratedQuestion.objects.bulk_create(questions)
+    return bool(claimed)
@@ -0,0 +1,49 @@
+import hashlib
+from typing import NamedTuple
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+
+class QuestionDraft(NamedTuple):
+    question_text: str
+    expected_answer: str
+    weightage: float
+
+
+class BaseQuestionBackend:
+    """
+    Writes `count` interview questions tailored to a job. Called from the
+    background pre-generation threads, never on a request, so it may be slow.
+    """
+
+    def generate(self, job_title, skills, count):
+        raise NotImplementedError
+
+
+class StubQuestionBackend(BaseQuestionBackend):
+    """Deterministic local backend for development and tests; no model is called."""
+
+    TEMPLATES = (
+        "Describe a project where you relied on {skill}. What would you do differently?",
+        "How would you explain the trade-offs of {skill} to a new {job} team member?",
+        "Walk through debugging a production issue involving {skill}.",
+    )
+
+    def generate(self, job_title, skills, count):
+        topics = list(skills) or [job_title]
+        drafts = []
+        for i in range(count):
+            skill = topics[i % len(topics)]
+            digest = hashlib.sha256(f"{job_title}\n{skill}\n{i}".encode()).digest()
+            template = self.TEMPLATES[digest[0] % len(self.TEMPLATES)]
+            drafts.append(QuestionDraft(
+                question_text=template.format(skill=skill, job=job_title),
+                expected_answer=f"[stub] A concrete example using {skill}, with the reasoning behind it.",
+                weightage=1.5,
+            ))
+        return drafts
+
+
+def get_question_backend(path=None):
+    return import_string(path or settings.QUESTION_GENERATION_BACKEND)()
@@ -0,0 +1,138 @@
+"""
+Question selection for new interview sessions.
+
+QuestionBank rows are cached per (job id, category, difficulty) pool so a
+burst of new sessions for the same job does not re-query the bank each
+time. Pools are evicted least-recently-used beyond `max_pools`, expire
+after `ttl` seconds (to pick up writes from other processes), and are
+dropped immediately when core.signals sees a question saved or deleted.
+"""
+import random
+import threading
+import time
+from collections import OrderedDict
+
+from django.db import models
+
+from .models import QuestionBank
+
+# (category, number of questions) drawn for every new session
+DEFAULT_QUESTION_PLAN = (
+    (QuestionBank.TECH, 5),
+    (QuestionBank.BEHAVIORAL, 2),
+)
+
+
+MAX_DIFFICULTY = 5
+
+
+def target_difficulty(job):
+    """Question difficulty for a job: one level per two years of required experience."""
+    return min(1 + max(job.experience_level, 0) // 2, MAX_DIFFICULTY)
+
+
+class QuestionPoolCache:
+
+    def __init__(self, max_pools=1024, ttl=300):
+        self.max_pools = max_pools
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        # key -> (loaded at, ((question id, question text), ...))
+        self._pools = OrderedDict()
+        # question id -> key of the pool it was loaded into
+        self._key_of = {}
+        # bumped on every invalidation so a load racing with one isn't cached
+        self._generation = 0
+
+    def get_many(self, keys):
+        """{key: pool} for `keys`, loading every missing or expired pool in one query."""
+        now = time.monotonic()
+        found, missing = {}, []
+        with self._lock:
+            generation = self._generation
+            for key in dict.fromkeys(keys):
+                entry = self._pools.get(key)
+                if entry is not None and now - entry[0] <= self.ttl:
+                    self._pools.move_to_end(key)
+                    found[key] = entry[1]
+                else:
+                    missing.append(key)
+        if missing:
+            loaded = {key: [] for key in missing}
+            condition = models.Q()
+            for job_id, category, difficulty in missing:
+                condition |= models.Q(job_id=job_id, category=category, difficulty_level=difficulty)
+            for question_id, job_id, category, difficulty, text in (
+                QuestionBank.objects.filter(condition).order_by("id")
+                .values_list("id", "job_id", "category", "difficulty_level", "question_text")
+            ):
+                loaded[job_id, category, difficulty].append((question_id, text))
+            with self._lock:
+                if generation == self._generation:
+                    for key, pool in loaded.items():
+                        self._store(key, tuple(pool), now)
+            found.update((key, tuple(pool)) for key, pool in loaded.items())
+        return found
+
+    def _store(self, key, pool, now):
+        self._discard(key)
+        self._pools[key] = (now, pool)
+        for question_id, _ in pool:
+            self._key_of[question_id] = key
+        while len(self._pools) > self.max_pools:
+            self._discard(next(iter(self._pools)))
+
+    def _discard(self, key):
+        entry = self._pools.pop(key, None)
+        if entry is not None:
+            for question_id, _ in entry[1]:
+                if self._key_of.get(question_id) == key:
+                    del self._key_of[question_id]
+
+    def question_changed(self, question_id, key):
+        """Drop the pool a question was cached in and the pool it belongs to now."""
+        with self._lock:
+            self._generation += 1
+            self._discard(self._key_of.get(question_id))
+            self._discard(key)
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._pools.clear()
+            self._key_of.clear()
+
+
+question_pools = QuestionPoolCache()
+
+
+def pool_key(question):
+    return (question.job_id, question.category, question.difficulty_level)
+
+
+def select_questions(job, plan=DEFAULT_QUESTION_PLAN):
+    """
+    Draw question texts for an interview on `job`: for each (category,
+    count) in `plan`, sample from the job's own pool at the target
+    difficulty, then the generic (job-less) pool, then the same two pools
+    one difficulty level down, and so on.
+    """
+    sources = [
+        (owner, difficulty)
+        for difficulty in range(target_difficulty(job), 0, -1)
+        for owner in (job.pk, None)
+    ]
+    pools = question_pools.get_many(
+        (owner, category, difficulty) for category, _ in plan for owner, difficulty in sources
+    )
+    selected = []
+    for category, count in plan:
+        for owner, difficulty in sources:
+            if count <= 0:
+                break
+            pool = pools[owner, category, difficulty]
+            taken = random.sample(pool, min(count, len(pool)))
+            selected.extend(text for _, text in taken)
+            count -= len(taken)
+    return selected
+
@@ -0,0 +1,248 @@
+"""
+BM25 ranking of QuestionBank questions against a candidate's resume.
+
+The bank is held in a process-local inverted index: per term, the rows
+containing it and the term frequencies, as NumPy arrays. A query only
+touches the postings of its own terms, so ranking cost follows the number
+and rarity of query terms rather than the size of the bank. Saved and
+deleted questions are applied incrementally (a changed question is
+tombstoned and re-added); once tombstones pile up the index is compacted
+in memory, without going back to the database.
+"""
+import math
+import re
+from collections import Counter, defaultdict
+
+import numpy as np
+
+from .indexes import ProcessLocalIndex
+from .matching import top_k
+from .models import QuestionBank
+from .skills import normalize_skills
+
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#.]*")
+STOP_WORDS = frozenset(
+    "a an and are as at be by can did do does for from how i in is it of on or that the this "
+    "to was what when where which who why will with you your".split()
+)
+
+# Query weight of resume skills relative to terms from the resume text
+SKILL_TERM_WEIGHT = 2.0
+# Highest-IDF terms of parsed_text used in a query
+MAX_TEXT_TERMS = 32
+
+
+def tokenize(text):
+    tokens = (token.rstrip(".") for token in _TOKEN_RE.findall((text or "").lower()))
+    return [token for token in tokens if token and token not in STOP_WORDS]
+
+
+class BM25Index:
+    """Okapi BM25 over keyed documents, with add/remove in O(document length)."""
+
+    def __init__(self, k1=1.2, b=0.75):
+        self.k1 = k1
+        self.b = b
+        self._postings = defaultdict(lambda: ([], []))
+        self._arrays = {}
+        self._df = Counter()
+        self._keys = []
+        self._terms = []
+        self._lengths = []
+        self._row_of = {}
+        self._total_length = 0
+        self._row_arrays = None
+
+    def __len__(self):
+        return len(self._row_of)
+
+    @property
+    def tombstones(self):
+        return len(self._keys) - len(self._row_of)
+
+    def add(self, key, text):
+        self.remove(key)
+        counts = Counter(tokenize(text))
+        row = len(self._keys)
+        for term, tf in counts.items():
+            rows, tfs = self._postings[term]
+            rows.append(row)
+            tfs.append(tf)
+            self._arrays.pop(term, None)
+            self._df[term] += 1
+        length = sum(counts.values())
+        self._row_of[key] = row
+        self._keys.append(key)
+        self._terms.append(tuple(counts))
+        self._lengths.append(length)
+        self._total_length += length
+        self._row_arrays = None
+        return row
+
+    def remove(self, key):
+        row = self._row_of.pop(key, None)
+        if row is None:
+            return
+        for term in self._terms[row]:
+            self._df[term] -= 1
+        self._total_length -= self._lengths[row]
+        self._keys[row] = None
+        self._terms[row] = ()
+        self._row_arrays = None
+
+    def compact(self):
+        """Drop tombstoned rows and renumber the live ones, keeping their postings."""
+        if not self.tombstones:
+            return
+        new_row = {}
+        for row, key in enumerate(self._keys):
+            if key is not None:
+                new_row[row] = len(new_row)
+        postings = defaultdict(lambda: ([], []))
+        for term, (rows, tfs) in self._postings.items():
+            kept_rows, kept_tfs = [], []
+            for row, tf in zip(rows, tfs):
+                if row in new_row:
+                    kept_rows.append(new_row[row])
+                    kept_tfs.append(tf)
+            if kept_rows:
+                postings[term] = (kept_rows, kept_tfs)
+        self._postings = postings
+        self._arrays = {}
+        self._df = Counter({term: count for term, count in self._df.items() if count})
+        self._keys = [self._keys[row] for row in new_row]
+        self._terms = [self._terms[row] for row in new_row]
+        self._lengths = [self._lengths[row] for row in new_row]
+        self._row_of = {key: row for row, key in enumerate(self._keys)}
+        self._row_arrays = None
+
+    def df(self, term):
+        return self._df.get(term, 0)
+
+    def idf(self, term):
+        df = self.df(term)
+        return math.log(1 + (len(self) - df + 0.5) / (df + 0.5))
+
+    def _postings_arrays(self, term):
+        arrays = self._arrays.get(term)
+        if arrays is None:
+            rows, tfs = self._postings.get(term, ((), ()))
+            arrays = self._arrays[term] = (np.array(rows, dtype=np.int64), np.array(tfs, dtype=np.float64))
+        return arrays
+
+    def rows(self):
+        """(keys, alive mask, length normalisation) for every row, tombstones included."""
+        if self._row_arrays is None:
+            lengths = np.array(self._lengths, dtype=np.float64)
+            average = self._total_length / len(self) if len(self) else 1.0
+            self._row_arrays = (
+                np.array([-1 if key is None else key for key in self._keys], dtype=np.int64),
+                np.array([key is not None for key in self._keys], dtype=bool),
+                self.k1 * (1 - self.b + self.b * lengths / (average or 1.0)),
+            )
+        return self._row_arrays
+
+    def scores(self, query):
+        """BM25 score of every row for `query`, a {term: weight} mapping."""
+        keys, alive, norm = self.rows()
+        scores = np.zeros(len(keys))
+        for term, weight in query.items():
+            if not self.df(term):
+                continue
+            rows, tfs = self._postings_arrays(term)
+            scores[rows] += weight * self.idf(term) * tfs * (self.k1 + 1) / (tfs + norm[rows])
+        scores[~alive] = 0
+        return scores
+
+
+class QuestionRanker(ProcessLocalIndex):
+    """Process-local BM25 index over QuestionBank.question_text."""
+
+    # Compact the index once this share of rows are tombstones
+    max_tombstone_ratio = 0.25
+
+    def _load(self):
+        self._index = BM25Index()
+        self._filters = {}
+        self._filter_arrays = None
+        for question_id, text, job_id, category, difficulty in (
+            QuestionBank.objects.order_by("id")
+            .values_list("id", "question_text", "job_id", "category", "difficulty_level")
+            .iterator(chunk_size=5000)
+        ):
+            self._add(question_id, text, job_id, category, difficulty)
+
+    def _add(self, question_id, text, job_id, category, difficulty):
+        self._index.add(question_id, text)
+        self._filters[question_id] = (job_id, category, difficulty)
+        self._filter_arrays = None
+
+    def question_changed(self, question):
+        with self._lock:
+            if self.is_loaded:
+                self._add(question.pk, question.question_text, question.job_id, question.category, question.difficulty_level)
+                self._compact_if_needed()
+
+    def question_deleted(self, question_id):
+        with self._lock:
+            if self.is_loaded:
+                self._index.remove(question_id)
+                self._filters.pop(question_id, None)
+                self._filter_arrays = None
+                self._compact_if_needed()
+
+    def _compact_if_needed(self):
+        if self._index.tombstones > max(1000, self.max_tombstone_ratio * len(self._index)):
+            self._index.compact()
+            self._filter_arrays = None
+
+    def query_for_resume(self, resume, text=""):
+        """{term: weight} from a resume's skills, its most distinctive text terms, and `text`."""
+        self.ensure_loaded()
+        query = Counter()
+        for skill in normalize_skills(resume.parsed_skills if resume else []):
+            for term in tokenize(skill):
+                query[term] = SKILL_TERM_WEIGHT
+        with self._lock:
+            text_terms = [
+                term for term in set(tokenize(resume.parsed_text if resume else "")) - set(query)
+                if self._index.df(term)
+            ]
+            text_terms.sort(key=self._index.idf, reverse=True)
+        for term in text_terms[:MAX_TEXT_TERMS]:
+            query[term] = 1.0
+        for term in tokenize(text):
+            query[term] += 1.0
+        return dict(query)
+
+    def rank(self, query, k=20, job=None, category=None, difficulty=None):
+        """Top `k` {"id", "score"} for `query`, optionally filtered like the pools are keyed."""
+        self.ensure_loaded()
+        with self._lock:
+            scores = self._index.scores(query)
+            keys = self._index.rows()[0]
+            # Filter only the rows that matched at all, usually a small share of the bank
+            hits = np.flatnonzero(scores > 0)
+            if job is not None or category is not None or difficulty is not None:
+                jobs, categories, difficulties = self._filter_columns()
+                if job is not None:
+                    hits = hits[jobs[hits] == int(job)]
+                if category is not None:
+                    hits = hits[categories[hits] == category]
+                if difficulty is not None:
+                    hits = hits[difficulties[hits] == int(difficulty)]
+            best = hits[top_k(scores[hits], k)]
+            return [{"id": int(keys[i]), "score": round(float(scores[i]), 4)} for i in best]
+
+    def _filter_columns(self):
+        if self._filter_arrays is None:
+            rows = [self._filters.get(key) for key in self._index.rows()[0].tolist()]
+            self._filter_arrays = (
+                np.array([row[0] if row and row[0] is not None else -1 for row in rows], dtype=np.int64),
+                np.array([row[1] if row else "" for row in rows], dtype=object),
+                np.array([row[2] if row else -1 for row in rows], dtype=np.int64),
+            )
+        return self._filter_arrays
+
+
+question_ranker = QuestionRanker()
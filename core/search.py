@@ -0,0 +1,65 @@
+import re
+
+from django.db import connection
+from django.db.models import FloatField, Q, Value
+from django.db.models.expressions import RawSQL
+
+# "quoted phrase" or a bare word
+_TOKEN_RE = re.compile(r'"([^"]*)"|(\S+)')
+
+
+def parse_search_query(query):
+    """Split a user query into words and "quoted phrases", dropping empties."""
+    parts = []
+    for phrase, word in _TOKEN_RE.findall(query or ""):
+        text = " ".join((phrase or word).split())
+        if text:
+            parts.append(text)
+    return parts
+
+
+def fts5_query(query):
+    """
+    Build an FTS5 MATCH expression from user input: every word/phrase is
+    quoted (so operators and punctuation in the input can't cause syntax
+    errors) and all of them must match.
+    """
+    return " ".join('"{}"'.format(part.replace('"', '""')) for part in parse_search_query(query))
+
+
+def resume_text_search(query):
+    """
+    Full-text match on Resume.parsed_text using the backend's native index
+    (see migration 0009). Returns ``(condition, rank)``: a Q selecting the
+    matching resumes and an expression where a lower value means a better
+    match (NULL for resumes that don't match).
+    """
+    vendor = connection.vendor
+    if vendor == "sqlite":
+        match = fts5_query(query)
+        condition = Q(pk__in=RawSQL(
+            "SELECT rowid FROM core_resume_fts WHERE core_resume_fts MATCH %s", (match,)
+        ))
+        # FTS5's built-in rank is bm25(): more negative is more relevant.
+        rank = RawSQL(
+            "SELECT rank FROM core_resume_fts WHERE core_resume_fts MATCH %s AND rowid = core_resume.id",
+            (match,),
+            output_field=FloatField(),
+        )
+    elif vendor == "postgresql":
+        document = "to_tsvector('english', COALESCE(core_resume.parsed_text, ''))"
+        condition = Q(pk__in=RawSQL(
+            f"SELECT core_resume.id FROM core_resume WHERE {document} @@ websearch_to_tsquery('english', %s)",
+            (query,),
+        ))
+        rank = RawSQL(
+            f"-ts_rank({document}, websearch_to_tsquery('english', %s))",
+            (query,),
+            output_field=FloatField(),
+        )
+    else:
+        condition = Q()
+        for part in parse_search_query(query):
+            condition &= Q(parsed_text__icontains=part)
+        rank = Value(0.0, output_field=FloatField())
+    return condition, rank
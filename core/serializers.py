@@ -13,7 +13,7 @@ class UserSerializer(serializers.ModelSerializer):
 
 from .models import (
     Job, Candidate, CandidateJobMapping, Resume,
-    InterviewSession, GeneratedQuestion, CandidateAnswer,
+    InterviewSession, GeneratedQuestion, CandidateAnswer, AnswerUpload,
     AudioProcessingTask,QuestionBank, Job
 )
 
@@ -22,7 +22,13 @@ from .models import (
 class JobSerializer(serializers.ModelSerializer):
     class Meta:
         model = Job
-        fields = "__all__"
+        exclude = ("skills",)  # derived from skills_required
+
+
+class JobImportSerializer(JobSerializer):
+    """Bulk import upserts on job_code, so an existing code is not a validation error."""
+    class Meta(JobSerializer.Meta):
+        extra_kwargs = {"job_code": {"validators": []}}
 
 
 # 2. Candidate Serializer
@@ -43,8 +49,8 @@ class CandidateJobMappingSerializer(serializers.ModelSerializer):
 class ResumeSerializer(serializers.ModelSerializer):
     class Meta:
         model = Resume
-        fields = "__all__"
-        extra_kwargs = {"resume_file": {"read_only": True}}
+        exclude = ("skills", "parse_lease_expires_at")  # derived from parsed_skills / worker bookkeeping
+        read_only_fields = ("resume_file", "content_hash", "parse_status", "parse_error")
 
 
 # 5. Interview Session
@@ -52,6 +58,7 @@ class InterviewSessionSerializer (serializers.ModelSerializer):
     class Meta:
         model = InterviewSession
         fields = "__all__"
+        read_only_fields = ("questions_status", "questions_failures", "questions_last_error")
 
 
 # 6. Generated Question
@@ -73,11 +80,55 @@ class CandidateAnswerSerializer(serializers.ModelSerializer):
         }
 
 
+# 7b. One item of a batch answer submission. Relations are plain ids here and
+# are checked in bulk by the view instead of one query per item.
+class CandidateAnswerBatchItemSerializer(serializers.ModelSerializer):
+    interview_session = serializers.IntegerField()
+    question = serializers.IntegerField()
+
+    class Meta:
+        model = CandidateAnswer
+        fields = ("interview_session", "question", "audio_file")
+        extra_kwargs = {"audio_file": {"required": False}}
+
+
+# 7c. Resumable chunked answer upload
+class AnswerUploadSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = AnswerUpload
+        fields = ("id", "interview_session", "question", "filename", "total_size", "received_bytes", "answer", "created_at")
+        read_only_fields = ("received_bytes", "answer", "created_at")
+
+    def validate(self, data):
+        request = self.context.get("request")
+        if request is not None and data["interview_session"].candidate.candidate_user_id != request.user.id:
+            raise serializers.ValidationError({"interview_session": "Not one of your interview sessions."})
+        if data["question"].interview_session_id != data["interview_session"].id:
+            raise serializers.ValidationError({"question": "Question does not belong to this interview session."})
+        return data
+
+
 # 8. Audio Processing Queue Task
 class AudioProcessingTaskSerializer(serializers.ModelSerializer):
     class Meta:
         model = AudioProcessingTask
         fields = "__all__"
+        read_only_fields = ("worker_id", "lease_expires_at", "attempts", "available_at")
+
+
+# 9. Worker claim request for the audio queue
+class TaskClaimSerializer(serializers.Serializer):
+    worker_id = serializers.CharField(max_length=255)
+    limit = serializers.IntegerField(min_value=1, max_value=100, default=10)
+    lease_seconds = serializers.IntegerField(min_value=10, max_value=3600, default=300)
+    # Long-poll: hold the request up to this many seconds when nothing is claimable.
+    wait = serializers.FloatField(min_value=0, max_value=30, default=0)
+
+
+# 10. Worker heartbeat for the audio queue
+class WorkerHeartbeatSerializer(serializers.Serializer):
+    worker_id = serializers.CharField(max_length=255)
+    lease_seconds = serializers.IntegerField(min_value=10, max_value=3600, default=300)
 
 # Candidate signup (public)
 class CandidateSignupSerializer(serializers.ModelSerializer):
@@ -111,6 +162,30 @@ class AdminCreateUserSerializer(serializers.ModelSerializer):
         if value not in [User.ROLE_RECRUITER, User.ROLE_ADMIN]:
             raise serializers.ValidationError("Only admin or recruiter roles allowed here.")
         return value
+# Bulk provisioning row (see core.imports.UserImporter); email uniqueness is checked per batch
+class UserImportSerializer(serializers.Serializer):
+    CANDIDATE_FIELDS = ("full_name", "phone", "experience_years")
+
+    email = serializers.EmailField()
+    role = serializers.ChoiceField(choices=User.ROLE_CHOICES, default=User.ROLE_CANDIDATE)
+    username = serializers.CharField(max_length=150, required=False, allow_blank=True)
+    # Rows without a password get an unusable one and a password-reset email
+    password = serializers.CharField(write_only=True, required=False, validators=[validate_password])
+    full_name = serializers.CharField(max_length=255, required=False)
+    phone = serializers.CharField(max_length=20, required=False)
+    experience_years = serializers.IntegerField(min_value=0, required=False)
+
+    def validate_email(self, value):
+        return User.objects.normalize_email(value)
+
+    def validate(self, data):
+        given = [field for field in self.CANDIDATE_FIELDS if field in data]
+        if given and data["role"] != User.ROLE_CANDIDATE:
+            raise serializers.ValidationError("Candidate profile fields are only allowed for the candidate role.")
+        if given and len(given) != len(self.CANDIDATE_FIELDS):
+            missing = [field for field in self.CANDIDATE_FIELDS if field not in data]
+            raise serializers.ValidationError({field: "Required for a candidate profile." for field in missing})
+        return data
 # Login serializer may be simple (we validate in view), but provide one to type-check
 class LoginSerializer(serializers.Serializer):
     email = serializers.EmailField()
@@ -0,0 +1,92 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .authentication import user_cache
+from .matching import skill_matcher
+from .models import Candidate, CustomUser, Job, QuestionBank, Resume, Skill
+from .near_duplicates import duplicate_questions
+from .question_pools import pool_key, question_pools
+from .question_ranking import question_ranker
+from .skill_extraction import skill_extractor
+from .skills import sync_skill_links
+
+
+def _skill_ids(instance, model, json_field, update_fields):
+    if update_fields is None or json_field in update_fields:
+        return sync_skill_links(model, [instance], json_field)[instance.pk]
+    if skill_matcher.is_loaded:
+        return list(instance.skills.values_list("id", flat=True))
+    return []
+
+
+@receiver(post_save, sender=Job)
+def sync_job_skills(sender, instance, update_fields=None, **kwargs):
+    skill_ids = _skill_ids(instance, Job, "skills_required", update_fields)
+    transaction.on_commit(lambda: skill_matcher.job_changed(instance, skill_ids))
+
+
+@receiver(post_save, sender=Resume)
+def sync_resume_skills(sender, instance, update_fields=None, **kwargs):
+    skill_ids = _skill_ids(instance, Resume, "parsed_skills", update_fields)
+    transaction.on_commit(lambda: skill_matcher.resume_changed(instance, skill_ids))
+
+
+@receiver(post_save, sender=Candidate)
+def update_candidate_matches(sender, instance, **kwargs):
+    transaction.on_commit(lambda: skill_matcher.candidate_changed(instance))
+
+
+@receiver(post_delete, sender=Job)
+def drop_job_matches(sender, instance, **kwargs):
+    job_id = instance.pk
+    transaction.on_commit(lambda: skill_matcher.job_deleted(job_id))
+
+
+@receiver(post_delete, sender=Resume)
+def drop_resume_matches(sender, instance, **kwargs):
+    resume_id, candidate_id = instance.pk, instance.candidate_id
+    transaction.on_commit(lambda: skill_matcher.resume_deleted(resume_id, candidate_id))
+
+
+@receiver(post_delete, sender=Candidate)
+def drop_candidate_matches(sender, instance, **kwargs):
+    candidate_id = instance.pk
+    transaction.on_commit(lambda: skill_matcher.candidate_deleted(candidate_id))
+
+
+@receiver([post_save, post_delete], sender=Skill)
+def rebuild_skill_extractor(sender, **kwargs):
+    transaction.on_commit(skill_extractor.invalidate)
+
+
+@receiver([post_save, post_delete], sender=QuestionBank)
+def invalidate_question_pools(sender, instance, **kwargs):
+    question_id, key = instance.pk, pool_key(instance)
+    transaction.on_commit(lambda: question_pools.question_changed(question_id, key))
+
+
+@receiver(post_save, sender=QuestionBank)
+def update_question_indexes(sender, instance, **kwargs):
+    def update():
+        question_ranker.question_changed(instance)
+        duplicate_questions.question_changed(instance)
+    transaction.on_commit(update)
+
+
+@receiver(post_delete, sender=QuestionBank)
+def drop_from_question_indexes(sender, instance, **kwargs):
+    question_id = instance.pk
+
+    def drop():
+        question_ranker.question_deleted(question_id)
+        duplicate_questions.question_deleted(question_id)
+    transaction.on_commit(drop)
+
+
+@receiver([post_save, post_delete], sender=CustomUser)
+def drop_cached_user(sender, instance, **kwargs):
+    user_id = instance.pk
+    # Dropped now and again after commit, so no request caches the old row in between
+    user_cache.user_changed(user_id)
+    transaction.on_commit(lambda: user_cache.user_changed(user_id))
@@ -0,0 +1,122 @@
+"""
+Skill extraction from free resume text.
+
+All skill names and aliases are compiled into one Aho-Corasick automaton,
+so a resume is scanned once regardless of taxonomy size instead of once
+per skill. Text is matched in the same normalized form as skill names
+(lower-cased, whitespace collapsed), and a match only counts when it is not
+glued to surrounding letters or digits, so "java" is not found in
+"javascript" while "c++" and ".net" still match.
+"""
+from collections import deque
+
+from .indexes import ProcessLocalIndex
+from .models import Skill
+from .skills import normalize_skill
+
+
+def _is_word_char(ch):
+    return ch.isalnum() or ch == "_"
+
+
+class SkillAutomaton:
+    """
+    Aho-Corasick automaton over `taxonomy`, an iterable of
+    (skill name, [aliases]) pairs. `find(text)` returns the skill names
+    present in `text`, in order of first appearance.
+    """
+
+    def __init__(self, taxonomy):
+        self._goto = [{}]
+        self._fail = [0]
+        # node -> ((pattern length, skill, needs left boundary, needs right boundary), ...)
+        self._out = [()]
+        for name, aliases in taxonomy:
+            skill = normalize_skill(name)
+            for pattern in {skill, *(normalize_skill(alias) for alias in aliases or ())}:
+                if pattern:
+                    self._add(pattern, skill)
+        self._link()
+
+    def __len__(self):
+        return len(self._goto)
+
+    def _add(self, pattern, skill):
+        node = 0
+        for ch in pattern:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+            node = nxt
+        self._out[node] += ((len(pattern), skill, _is_word_char(pattern[0]), _is_word_char(pattern[-1])),)
+
+    def _link(self):
+        goto, fail, out = self._goto, self._fail, self._out
+        queue = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in goto[node].items():
+                queue.append(child)
+                state = fail[node]
+                while state and ch not in goto[state]:
+                    state = fail[state]
+                fail[child] = goto[state].get(ch, 0)
+                out[child] += out[fail[child]]
+
+    def find(self, text):
+        if not text:
+            return []
+        text = " ".join(text.split()).lower()
+        goto, fail, out = self._goto, self._fail, self._out
+        end = len(text)
+        found = {}
+        node = 0
+        for i, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            for length, skill, left, right in out[node]:
+                start = i - length + 1
+                if left and start > 0 and _is_word_char(text[start - 1]):
+                    continue
+                if right and i + 1 < end and _is_word_char(text[i + 1]):
+                    continue
+                found.setdefault(skill, None)
+        return list(found)
+
+
+def load_taxonomy():
+    """(name, aliases) for every Skill row."""
+    return list(Skill.objects.order_by("id").values_list("name", "aliases"))
+
+
+class SkillExtractor(ProcessLocalIndex):
+    """Process-local automaton over the Skill table, rebuilt when skills change."""
+
+    def _load(self):
+        self._automaton = SkillAutomaton(load_taxonomy())
+
+    def extract(self, text):
+        self.ensure_loaded()
+        return self._automaton.find(text)
+
+
+skill_extractor = SkillExtractor()
+
+
+# Process-pool helpers: each worker compiles its own automaton once, then
+# receives batches of (resume id, text) and returns (resume id, skills).
+_worker_automaton = None
+
+
+def init_extraction_worker(taxonomy):
+    global _worker_automaton
+    _worker_automaton = SkillAutomaton(taxonomy)
+
+
+def extract_batch(batch):
+    return [(resume_id, _worker_automaton.find(text)) for resume_id, text in batch]
@@ -0,0 +1,52 @@
+from django.db import transaction
+
+from .models import Skill
+
+MAX_SKILL_LENGTH = Skill._meta.get_field("name").max_length
+
+
+def normalize_skill(name):
+    """Canonical form of a skill name: whitespace collapsed, lower-cased."""
+    return " ".join(str(name).split()).lower()[:MAX_SKILL_LENGTH]
+
+
+def normalize_skills(names):
+    """Normalized, de-duplicated skills in their original order; non-lists yield nothing."""
+    if not isinstance(names, (list, tuple)):
+        return []
+    seen = {}
+    for name in names:
+        if isinstance(name, str) and normalize_skill(name):
+            seen.setdefault(normalize_skill(name), None)
+    return list(seen)
+
+
+def get_skill_ids(names):
+    """Map each normalized name to its Skill id, creating missing skills in one INSERT."""
+    names = set(names)
+    if not names:
+        return {}
+    Skill.objects.bulk_create([Skill(name=name) for name in names], ignore_conflicts=True)
+    return dict(Skill.objects.filter(name__in=names).values_list("name", "id"))
+
+
+def sync_skill_links(model, instances, json_field):
+    """
+    Rebuild the `skills` many-to-many rows of `instances` (Jobs or Resumes)
+    from their JSON skill list: one DELETE and one INSERT however many
+    instances are passed. Returns {pk: [skill ids]}.
+    """
+    wanted = {obj.pk: normalize_skills(getattr(obj, json_field)) for obj in instances}
+    if not wanted:
+        return {}
+    skill_ids = get_skill_ids(name for names in wanted.values() for name in names)
+    through = model.skills.through
+    owner = f"{model._meta.model_name}_id"
+    with transaction.atomic():
+        through.objects.filter(**{f"{owner}__in": list(wanted)}).delete()
+        through.objects.bulk_create([
+            through(**{owner: pk, "skill_id": skill_ids[name]})
+            for pk, names in wanted.items()
+            for name in names
+        ])
+    return {pk: [skill_ids[name] for name in names] for pk, names in wanted.items()}
@@ -0,0 +1,22 @@
+from core.models import Candidate, CustomUser, GeneratedQuestion, InterviewSession, Job
+
+
+def make_candidate(email="candidate@example.com", experience_years=3):
+    user = CustomUser.objects.create_user(email=email, password="secret")
+    candidate = Candidate.objects.create(
+        candidate_user=user, full_name="Test Candidate", email=email, phone="555-0100",
+        experience_years=experience_years,
+    )
+    return user, candidate
+
+
+def make_session(candidate, job=None):
+    """An interview session with one generated question; returns (session, question)."""
+    if job is None:
+        job = Job.objects.create(
+            job_title="Developer", job_code=f"dev-{Job.objects.count()}", experience_level=2,
+            skills_required=["python"],
+        )
+    session = InterviewSession.objects.create(candidate=candidate, job=job)
+    question = GeneratedQuestion.objects.create(interview_session=session, question_text="Tell us about Django.")
+    return session, question
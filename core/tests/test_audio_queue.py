@@ -0,0 +1,186 @@
+import threading
+from datetime import timedelta
+from unittest import mock
+
+from django.db import OperationalError, connection, connections
+from django.test import TestCase, TransactionTestCase
+from django.utils import timezone
+
+from core.managers import FAIR_WINDOW_FACTOR
+from core.models import AudioProcessingTask, WorkerHeartbeat
+
+from .factories import make_candidate, make_session
+
+
+def queue_tasks(session, question, count, **fields):
+    return AudioProcessingTask.objects.bulk_create(
+        [AudioProcessingTask(interview_session=session, question=question, audio_file="a.wav", **fields)
+         for _ in range(count)]
+    )
+
+
+class ClaimLeaseTests(TestCase):
+
+    def setUp(self):
+        _, candidate = make_candidate()
+        self.session, self.question = make_session(candidate)
+
+    def test_claim_leases_each_task_to_one_worker(self):
+        queue_tasks(self.session, self.question, 3)
+
+        first = AudioProcessingTask.objects.claim("worker-1", limit=2, lease_seconds=60)
+        second = AudioProcessingTask.objects.claim("worker-2", limit=2, lease_seconds=60)
+
+        self.assertEqual((len(first), len(second)), (2, 1))
+        self.assertEqual(AudioProcessingTask.objects.claim("worker-3"), [])
+        for task in first:
+            self.assertEqual((task.task_status, task.worker_id, task.attempts), ("processing", "worker-1", 1))
+            self.assertGreater(task.lease_expires_at, timezone.now())
+
+    def test_tasks_not_yet_due_are_not_claimed(self):
+        queue_tasks(self.session, self.question, 1, available_at=timezone.now() + timedelta(minutes=5))
+
+        self.assertEqual(AudioProcessingTask.objects.claim("worker-1"), [])
+
+    def test_expired_lease_costs_an_attempt_and_backs_off(self):
+        task, = queue_tasks(self.session, self.question, 1)
+        AudioProcessingTask.objects.claim("worker-1", lease_seconds=-1)
+
+        self.assertEqual(AudioProcessingTask.objects.claim("worker-2"), [])
+        task.refresh_from_db()
+        self.assertEqual((task.task_status, task.worker_id, task.attempts), ("pending", "", 1))
+        self.assertEqual(task.last_error, "Worker lease expired")
+        self.assertGreater(task.available_at, timezone.now())
+
+    def test_task_that_keeps_losing_its_lease_is_dead_lettered(self):
+        task, = queue_tasks(self.session, self.question, 1)
+        # No backoff, so each claim() re-queues the last expired lease and takes the task again
+        with mock.patch.object(AudioProcessingTask, "retry_delay", classmethod(lambda cls, attempts: timedelta(0))):
+            for _ in range(AudioProcessingTask.MAX_ATTEMPTS):
+                self.assertEqual(len(AudioProcessingTask.objects.claim("worker-1", lease_seconds=-1)), 1)
+            self.assertEqual(AudioProcessingTask.objects.claim("worker-1"), [])
+
+        task.refresh_from_db()
+        self.assertEqual((task.task_status, task.attempts), ("dead", AudioProcessingTask.MAX_ATTEMPTS))
+
+    def test_pending_task_without_attempts_left_is_not_claimed(self):
+        queue_tasks(self.session, self.question, 1, attempts=AudioProcessingTask.MAX_ATTEMPTS)
+
+        self.assertEqual(AudioProcessingTask.objects.claim("worker-1"), [])
+
+    def test_retry_or_dead_letter_backs_off_then_dead_letters(self):
+        retry, = queue_tasks(self.session, self.question, 1, task_status="processing", attempts=2)
+        dead, = queue_tasks(
+            self.session, self.question, 1, task_status="processing", attempts=AudioProcessingTask.MAX_ATTEMPTS,
+        )
+        now = timezone.now()
+
+        counts = AudioProcessingTask.objects.filter(pk__in=[retry.pk, dead.pk]).retry_or_dead_letter("boom", now=now)
+
+        self.assertEqual(counts, (1, 1))
+        retry.refresh_from_db()
+        dead.refresh_from_db()
+        self.assertEqual((retry.task_status, retry.last_error), ("pending", "boom"))
+        self.assertEqual(retry.available_at, now + AudioProcessingTask.retry_delay(2))
+        self.assertEqual(dead.task_status, "dead")
+
+    def test_heartbeat_extends_only_the_workers_leases(self):
+        queue_tasks(self.session, self.question, 2)
+        mine = AudioProcessingTask.objects.claim("worker-1", limit=1, lease_seconds=10)[0]
+        theirs = AudioProcessingTask.objects.claim("worker-2", limit=1, lease_seconds=10)[0]
+
+        self.assertEqual(AudioProcessingTask.objects.heartbeat("worker-1", lease_seconds=600), 1)
+
+        mine.refresh_from_db()
+        theirs.refresh_from_db()
+        self.assertGreater(mine.lease_expires_at, timezone.now() + timedelta(seconds=500))
+        self.assertLess(theirs.lease_expires_at, timezone.now() + timedelta(seconds=60))
+        self.assertTrue(WorkerHeartbeat.objects.filter(worker_id="worker-1").exists())
+
+    def test_requeue_stale_releases_tasks_of_silent_workers(self):
+        queue_tasks(self.session, self.question, 1)
+        task = AudioProcessingTask.objects.claim("worker-1", lease_seconds=600)[0]
+        AudioProcessingTask.objects.heartbeat("worker-1", lease_seconds=600)
+        WorkerHeartbeat.objects.update(last_seen=timezone.now() - timedelta(minutes=10))
+
+        self.assertEqual(AudioProcessingTask.objects.requeue_stale(heartbeat_timeout=120), 1)
+
+        task.refresh_from_db()
+        self.assertEqual((task.task_status, task.worker_id), ("pending", ""))
+        self.assertFalse(WorkerHeartbeat.objects.exists())
+
+
+class FairClaimTests(TestCase):
+
+    def setUp(self):
+        _, self.candidate = make_candidate()
+
+    def test_claim_round_robins_sessions_past_a_burst(self):
+        bursty = make_session(self.candidate)
+        queue_tasks(*bursty, 3 * FAIR_WINDOW_FACTOR + 10)
+        light = [make_session(self.candidate) for _ in range(2)]
+        for session, question in light:
+            queue_tasks(session, question, 1)
+
+        tasks = AudioProcessingTask.objects.claim("worker-1", limit=3)
+
+        self.assertEqual(
+            {task.interview_session_id for task in tasks},
+            {bursty[0].id} | {session.id for session, _ in light},
+        )
+
+    def test_claim_returns_tasks_in_fair_order(self):
+        first, second = make_session(self.candidate), make_session(self.candidate)
+        queue_tasks(*first, 3)
+        queue_tasks(*second, 1)
+
+        tasks = AudioProcessingTask.objects.claim("worker-1", limit=4)
+
+        self.assertEqual(
+            [task.interview_session_id for task in tasks],
+            [first[0].id, second[0].id, first[0].id, first[0].id],
+        )
+
+    def test_higher_priority_is_claimed_first(self):
+        session, question = make_session(self.candidate)
+        queue_tasks(session, question, 2, priority=AudioProcessingTask.PRIORITY_BACKFILL)
+        live = queue_tasks(session, question, 1, priority=AudioProcessingTask.PRIORITY_LIVE)
+
+        tasks = AudioProcessingTask.objects.claim("worker-1", limit=1)
+
+        self.assertEqual([task.id for task in tasks], [live[0].id])
+
+
+class ConcurrentClaimTests(TransactionTestCase):
+    workers = 8
+    claims_per_worker = 30
+
+    def setUp(self):
+        if connection.vendor == "sqlite" and connection.is_in_memory_db():
+            self.skipTest("Concurrent claims need a database shared between connections.")
+        _, candidate = make_candidate()
+        for _ in range(10):
+            queue_tasks(*make_session(candidate), 100)
+
+    def test_concurrent_claims_never_fail_or_overlap(self):
+        claimed, errors = [], []
+
+        def work(worker_id):
+            try:
+                for _ in range(self.claims_per_worker):
+                    tasks = AudioProcessingTask.objects.claim(worker_id, limit=5)
+                    claimed.extend(task.id for task in tasks)
+            except OperationalError as exc:
+                errors.append(exc)
+            finally:
+                connections.close_all()
+
+        threads = [threading.Thread(target=work, args=(f"worker-{n}",)) for n in range(self.workers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(len(claimed), len(set(claimed)))
+        self.assertEqual(len(claimed), AudioProcessingTask.objects.count())
@@ -0,0 +1,78 @@
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework import serializers
+from rest_framework.test import APIRequestFactory
+
+from core.fast_serializers import compile_projection
+from core.models import AudioProcessingTask, Candidate, CustomUser, GeneratedQuestion, InterviewSession, Job, Resume
+from core.serializers import (
+    AudioProcessingTaskSerializer, CandidateSerializer, GeneratedQuestionSerializer, InterviewSessionSerializer,
+    JobSerializer, ResumeSerializer, UserSerializer,
+)
+
+from .factories import make_candidate, make_session
+
+
+class ProjectionMatchesSerializerTests(TestCase):
+    """compile_projection must render exactly what the DRF serializer would."""
+
+    @classmethod
+    def setUpTestData(cls):
+        user, candidate = make_candidate()
+        make_candidate(email="second@example.com", experience_years=0)
+        session, question = make_session(candidate)
+        InterviewSession.objects.filter(pk=session.pk).update(
+            started_at=timezone.now() - timedelta(minutes=5), total_score=7.5, feedback="Good",
+        )
+        GeneratedQuestion.objects.create(interview_session=session, question_text="Why?", expected_answer="Because")
+        Resume.objects.create(candidate=candidate, resume_file="resumes/cv.pdf", parsed_skills=["Python", "SQL"])
+        Resume.objects.create(candidate=candidate, resume_file="", parse_status="failed", parse_error="empty")
+        AudioProcessingTask.objects.create(
+            interview_session=session, question=question, audio_file="processing/audio/a.wav",
+            lease_expires_at=timezone.now(), attempts=2,
+        )
+
+    def assertSameOutput(self, serializer_class, queryset):
+        request = APIRequestFactory().get("/")
+        projection = compile_projection(serializer_class)
+        self.assertIsNotNone(projection, f"{serializer_class.__name__} should compile")
+        expected = serializer_class(list(queryset), many=True, context={"request": request}).data
+        rendered = projection.render(queryset.values(*projection.lookups), request)
+        self.assertTrue(rendered)
+        self.assertEqual(rendered, [dict(item) for item in expected])
+
+    def test_users(self):
+        self.assertSameOutput(UserSerializer, CustomUser.objects.order_by("id"))
+
+    def test_jobs(self):
+        self.assertSameOutput(JobSerializer, Job.objects.order_by("id"))
+
+    def test_candidates(self):
+        self.assertSameOutput(CandidateSerializer, Candidate.objects.order_by("id"))
+
+    def test_interview_sessions(self):
+        self.assertSameOutput(InterviewSessionSerializer, InterviewSession.objects.order_by("id"))
+
+    def test_generated_questions(self):
+        self.assertSameOutput(GeneratedQuestionSerializer, GeneratedQuestion.objects.order_by("id"))
+
+    def test_resumes_with_and_without_files(self):
+        self.assertSameOutput(ResumeSerializer, Resume.objects.order_by("id"))
+
+    def test_audio_tasks(self):
+        self.assertSameOutput(AudioProcessingTaskSerializer, AudioProcessingTask.objects.order_by("id"))
+
+    def test_method_fields_fall_back_to_the_serializer(self):
+        class WithMethodField(serializers.ModelSerializer):
+            label = serializers.SerializerMethodField()
+
+            class Meta:
+                model = Job
+                fields = ("id", "label")
+
+            def get_label(self, job):
+                return job.job_title.upper()
+
+        self.assertIsNone(compile_projection(WithMethodField))
@@ -0,0 +1,128 @@
+import io
+from unittest import mock
+
+from django.db import DatabaseError
+from django.test import TestCase
+
+from core.imports import JobImporter, QuestionImporter, UserImporter, read_records
+from core.models import Candidate, CustomUser, Job, QuestionBank
+
+
+def records(text, file_format):
+    return read_records(io.BytesIO(text.encode()), file_format)
+
+
+class ReadRecordsTests(TestCase):
+
+    def test_csv_reports_extra_values_and_drops_empty_cells(self):
+        rows = list(records("job_code,job_title\nA,Alpha\nB,Beta,extra\nC,\n", "csv"))
+        self.assertEqual(rows, [
+            (2, {"job_code": "A", "job_title": "Alpha"}, None),
+            (3, None, "More values than header columns."),
+            (4, {"job_code": "C"}, None),
+        ])
+
+    def test_ndjson_reports_bad_lines_and_skips_blank_ones(self):
+        rows = list(records('{"a": 1}\n\nnot json\n[1, 2]\n{"b": 2}\n', "ndjson"))
+        self.assertEqual([(line, row) for line, row, _ in rows], [(1, {"a": 1}), (3, None), (4, None), (5, {"b": 2})])
+        self.assertTrue(rows[1][2].startswith("Invalid JSON"))
+        self.assertEqual(rows[2][2], "Expected a JSON object.")
+
+
+class RecordImporterTests(TestCase):
+
+    def test_invalid_job_rows_are_reported_by_line_and_the_rest_imported(self):
+        text = (
+            "job_code,job_title,experience_level,skills_required\n"
+            "be,Backend,3,python;django\n"
+            "bad,Broken,not-a-number,\n"
+            ",No code,1,\n"
+            "fe,Frontend,2,\"[\"\"javascript\"\"]\"\n"
+        )
+        report = JobImporter(batch_size=2).run(records(text, "csv"))
+        self.assertEqual(report["created"], 2)
+        self.assertEqual(report["error_count"], 2)
+        self.assertEqual([error["line"] for error in report["errors"]], [3, 4])
+        self.assertIn("experience_level", report["errors"][0]["errors"])
+        self.assertIn("job_code", report["errors"][1]["errors"])
+        self.assertEqual(Job.objects.get(job_code="be").skills_required, ["python", "django"])
+
+    def test_jobs_upsert_on_job_code(self):
+        Job.objects.create(job_code="be", job_title="Old", experience_level=1)
+        text = '{"job_code": "be", "job_title": "Backend", "experience_level": 4}\n'
+        report = JobImporter().run(records(text, "ndjson"))
+        self.assertEqual((report["created"], report["updated"]), (0, 1))
+        self.assertEqual(Job.objects.get(job_code="be").job_title, "Backend")
+
+    def test_invalid_question_rows_do_not_stop_the_import(self):
+        text = (
+            '{"question_text": "What is a closure?", "category": "technical"}\n'
+            '{"question_text": "Why?", "category": "trivia"}\n'
+            "{oops\n"
+            '{"question_text": "Describe a conflict.", "category": "behavioral", "difficulty_level": 2}\n'
+        )
+        report = QuestionImporter().run(records(text, "ndjson"))
+        self.assertEqual(report["created"], 2)
+        self.assertEqual([error["line"] for error in report["errors"]], [2, 3])
+        self.assertEqual(QuestionBank.objects.count(), 2)
+
+    def test_failed_batch_reports_each_of_its_lines_once(self):
+        text = "".join(f'{{"question_text": "Q{i}", "category": "technical"}}\n' for i in range(3))
+        with mock.patch.object(QuestionImporter, "write", side_effect=DatabaseError("disk full")):
+            report = QuestionImporter(batch_size=2).run(records(text, "ndjson"))
+        self.assertEqual(report["created"], 0)
+        self.assertEqual([error["line"] for error in report["errors"]], [1, 2, 3])
+        self.assertEqual(report["errors"][0]["errors"], "Batch not written: disk full")
+
+
+class UserImporterTests(TestCase):
+
+    def setUp(self):
+        CustomUser.objects.create_user(email="taken@example.com", password="secret")
+
+    def test_repeated_and_existing_emails_are_reported_once_each(self):
+        text = (
+            '{"email": "new@example.com", "password": "s3cure-Passw0rd"}\n'
+            '{"email": "new@example.com", "password": "s3cure-Passw0rd"}\n'
+            '{"email": "taken@example.com"}\n'
+            '{"email": "cand@example.com", "full_name": "Cand", "phone": "1", "experience_years": 2}\n'
+        )
+        report = UserImporter().run(records(text, "ndjson"))
+        self.assertEqual(report["created"], 2)
+        self.assertEqual(report["candidates"], 1)
+        self.assertEqual(report["reset_emails"], 1)
+        self.assertEqual(report["error_count"], 2)
+        self.assertEqual(report["errors"], [
+            {"line": 2, "errors": {"email": ["Repeated earlier in the file."]}},
+            {"line": 3, "errors": {"email": ["A user with this email already exists."]}},
+        ])
+        self.assertTrue(CustomUser.objects.get(email="new@example.com").check_password("s3cure-Passw0rd"))
+        self.assertFalse(CustomUser.objects.get(email="cand@example.com").has_usable_password())
+
+    def test_invalid_rows_are_reported_by_line(self):
+        text = (
+            "email,role,full_name,phone,experience_years\n"
+            "not-an-email,candidate,,,\n"
+            "rec@example.com,recruiter,Rec,1,3\n"
+            "half@example.com,candidate,Half,,\n"
+        )
+        report = UserImporter().run(records(text, "csv"))
+        self.assertEqual(report["created"], 0)
+        self.assertEqual([error["line"] for error in report["errors"]], [2, 3, 4])
+        self.assertIn("email", report["errors"][0]["errors"])
+        self.assertIn("phone", report["errors"][2]["errors"])
+
+    def test_failed_batch_reports_rejected_lines_once(self):
+        text = (
+            '{"email": "a@example.com", "full_name": "A", "phone": "1", "experience_years": 1}\n'
+            '{"email": "taken@example.com"}\n'
+        )
+        with mock.patch.object(Candidate.objects, "bulk_create", side_effect=DatabaseError("disk full")):
+            report = UserImporter().run(records(text, "ndjson"))
+        self.assertEqual(report["created"], 0)
+        self.assertEqual(report["error_count"], 2)
+        self.assertEqual(
+            report["errors"],
+            [{"line": 1, "errors": "Batch not written: disk full"}, {"line": 2, "errors": "Batch not written: disk full"}],
+        )
+        self.assertFalse(CustomUser.objects.filter(email="a@example.com").exists())
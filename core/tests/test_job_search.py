@@ -0,0 +1,39 @@
+from django.test import TestCase
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from core.models import CustomUser, Job
+from core.skills import sync_skill_links
+from core.views import JobViewSet
+
+
+class JobSkillSearchTests(TestCase):
+
+    def setUp(self):
+        self.admin = CustomUser.objects.create_user(email="admin@example.com", password="secret", role="admin")
+        jobs = [
+            Job.objects.create(job_title="ML engineer", job_code="ml", experience_level=3,
+                               skills_required=["Machine Learning", "Python"]),
+            Job.objects.create(job_title="Frontend", job_code="fe", experience_level=2, skills_required=["JavaScript"]),
+            Job.objects.create(job_title="Backend", job_code="be", experience_level=2, skills_required=["Java"]),
+        ]
+        sync_skill_links(Job, jobs, "skills_required")
+
+    def search(self, query):
+        request = APIRequestFactory().get("/admin/jobs/", {"search": query})
+        force_authenticate(request, user=self.admin)
+        response = JobViewSet.as_view({"get": "list"})(request)
+        self.assertEqual(response.status_code, 200)
+        return sorted(job["job_code"] for job in response.data["results"])
+
+    def test_skill_terms_match_exactly(self):
+        self.assertEqual(self.search("java"), ["be"])
+
+    def test_multi_word_skill_matches_as_a_whole(self):
+        self.assertEqual(self.search("Machine  Learning"), ["ml"])
+        self.assertEqual(self.search("learning"), [])
+
+    def test_comma_separated_skills_all_match(self):
+        self.assertEqual(self.search("machine learning, python"), ["ml"])
+
+    def test_other_fields_still_match_by_substring(self):
+        self.assertEqual(self.search("front"), ["fe"])
@@ -0,0 +1,42 @@
+from django.test import TestCase
+
+from core.matching import SkillMatcher
+from core.models import IndexVersion, Job, Resume
+from core.skills import sync_skill_links
+
+from .factories import make_candidate
+
+
+class SharedVersionTests(TestCase):
+    """Two SkillMatcher instances stand in for the copies held by two processes."""
+
+    def setUp(self):
+        self.job = Job.objects.create(job_title="Developer", job_code="dev", experience_level=2, skills_required=["python"])
+        sync_skill_links(Job, [self.job], "skills_required")
+        _, self.candidate = make_candidate()
+        self.resume = Resume.objects.create(candidate=self.candidate, resume_file="resumes/cv.pdf")
+        self.web = SkillMatcher()
+        self.web.version_check_interval = 0
+
+    def bulk_parse(self, skills):
+        # What parse_resumes / extract_resume_skills do in their own process
+        self.resume.parsed_skills = skills
+        Resume.objects.bulk_update([self.resume], ["parsed_skills"])
+        sync_skill_links(Resume, [self.resume], "parsed_skills")
+        SkillMatcher().invalidate_all_processes()
+
+    def test_bulk_writes_in_another_process_reach_a_loaded_index(self):
+        self.assertEqual(self.web.candidates_for_job(self.job.id), [])
+
+        self.bulk_parse(["python"])
+
+        self.assertEqual([match["id"] for match in self.web.candidates_for_job(self.job.id)], [self.candidate.id])
+        self.assertEqual(IndexVersion.objects.get(name="skill_matcher").version, 1)
+
+    def test_index_is_not_reloaded_while_the_version_is_unchanged(self):
+        self.web.ensure_loaded()
+        loaded_at = self.web._loaded_at
+
+        self.web.ensure_loaded()
+
+        self.assertEqual(self.web._loaded_at, loaded_at)
@@ -0,0 +1,64 @@
+from unittest import mock
+
+from django.conf import settings
+from django.test import TestCase
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from core import pregeneration
+from core.models import InterviewSession
+from core.views import GeneratedQuestionListView
+
+from .factories import make_candidate, make_session
+
+
+class FailingBackend:
+    def generate(self, *args):
+        raise RuntimeError("model unavailable")
+
+
+class QuestionGenerationFailureTests(TestCase):
+
+    def setUp(self):
+        self.user, candidate = make_candidate()
+        self.session, _ = make_session(candidate)
+
+    def fail_generation(self):
+        with mock.patch.object(pregeneration, "get_question_backend", return_value=FailingBackend()), \
+                mock.patch.object(pregeneration.db.connections, "close_all"):
+            pregeneration._run(self.session.pk)
+        self.session.refresh_from_db()
+
+    def get_questions(self):
+        request = APIRequestFactory().get(f"/interview/{self.session.pk}/questions/")
+        force_authenticate(request, user=self.user)
+        with mock.patch("core.views.schedule_question_generation") as schedule:
+            response = GeneratedQuestionListView.as_view()(request, session_id=self.session.pk)
+        return response, schedule
+
+    def test_failures_are_counted_with_the_last_error(self):
+        self.fail_generation()
+        self.fail_generation()
+        self.assertEqual(self.session.questions_status, "failed")
+        self.assertEqual(self.session.questions_failures, 2)
+        self.assertEqual(self.session.questions_last_error, "RuntimeError: model unavailable")
+
+    def test_failed_session_is_retried_until_the_limit(self):
+        self.fail_generation()
+        response, schedule = self.get_questions()
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response.data["status"], "pending")
+        schedule.assert_called_once_with(self.session.pk)
+
+    def test_exhausted_session_reports_failed_and_is_not_rescheduled(self):
+        for _ in range(settings.QUESTION_GENERATION_MAX_ATTEMPTS):
+            self.fail_generation()
+        response, schedule = self.get_questions()
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.data["status"], "failed")
+        schedule.assert_not_called()
+
+    def test_ready_session_is_not_marked_failed(self):
+        InterviewSession.objects.filter(pk=self.session.pk).update(questions_status="ready")
+        self.fail_generation()
+        self.assertEqual(self.session.questions_status, "ready")
+        self.assertEqual(self.session.questions_failures, 0)
@@ -0,0 +1,70 @@
+"""
+Plain-text extraction for uploaded resumes.
+
+.txt/.md are decoded directly and .docx is read from its document.xml with
+the standard library. PDF needs the optional `pypdf` package; without it,
+PDFs fail with UnsupportedDocument like any other unknown format.
+"""
+import os
+import zipfile
+from xml.etree import ElementTree
+
+try:
+    from pypdf import PdfReader
+except ImportError:  # optional dependency
+    PdfReader = None
+
+_WORD_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+
+class UnsupportedDocument(Exception):
+    pass
+
+
+def _text_from_plain(file):
+    return file.read().decode("utf-8", errors="replace")
+
+
+def _text_from_docx(file):
+    try:
+        with zipfile.ZipFile(file) as archive, archive.open("word/document.xml") as document:
+            paragraphs, parts = [], []
+            for _, element in ElementTree.iterparse(document):
+                if element.tag == f"{_WORD_NS}t":
+                    parts.append(element.text or "")
+                elif element.tag in (f"{_WORD_NS}tab", f"{_WORD_NS}br"):
+                    parts.append(" ")
+                elif element.tag == f"{_WORD_NS}p":
+                    paragraphs.append("".join(parts))
+                    parts = []
+                    element.clear()
+            return "\n".join(paragraphs)
+    except (zipfile.BadZipFile, KeyError, ElementTree.ParseError) as exc:
+        raise UnsupportedDocument(f"Not a readable .docx file: {exc}") from exc
+
+
+def _text_from_pdf(file):
+    if PdfReader is None:
+        raise UnsupportedDocument("PDF support needs the pypdf package.")
+    try:
+        return "\n".join(page.extract_text() or "" for page in PdfReader(file).pages)
+    except Exception as exc:  # pypdf raises a variety of errors on damaged files
+        raise UnsupportedDocument(f"Not a readable PDF: {exc}") from exc
+
+
+EXTRACTORS = {
+    ".txt": _text_from_plain,
+    ".md": _text_from_plain,
+    ".docx": _text_from_docx,
+    ".pdf": _text_from_pdf,
+}
+
+
+def extract_text(file, name=None):
+    """Text content of an open binary `file`, picking the parser by the extension of `name`."""
+    extension = os.path.splitext(name or getattr(file, "name", "") or "")[1].lower()
+    extractor = EXTRACTORS.get(extension)
+    if extractor is None:
+        raise UnsupportedDocument(f"Unsupported resume format: {extension or 'no extension'}")
+    # NUL bytes can't be stored in Postgres text columns
+    return extractor(file).replace("\x00", "")
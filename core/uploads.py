@@ -0,0 +1,98 @@
+import hashlib
+import os
+import re
+
+from django.core.files import File
+from django.core.files.storage import default_storage
+from django.core.files.uploadhandler import TemporaryFileUploadHandler
+
+_EXTENSION_RE = re.compile(r"^\.[a-z0-9]{1,8}$")
+_COPY_CHUNK_SIZE = 64 * 1024
+
+
+class HashingFileUploadHandler(TemporaryFileUploadHandler):
+    """
+    TemporaryFileUploadHandler that feeds each chunk to SHA-256 on its way to
+    disk, so the content hash of a large upload is ready without reading the
+    file a second time. Listed after MemoryFileUploadHandler, which keeps
+    small uploads in memory; content_hash() hashes those when they're stored.
+    """
+
+    def new_file(self, *args, **kwargs):
+        super().new_file(*args, **kwargs)
+        self.sha256 = hashlib.sha256()
+
+    def receive_data_chunk(self, raw_data, start):
+        self.sha256.update(raw_data)
+        return super().receive_data_chunk(raw_data, start)
+
+    def file_complete(self, file_size):
+        file = super().file_complete(file_size)
+        file.sha256 = self.sha256.hexdigest()
+        return file
+
+
+def content_hash(file):
+    """SHA-256 of a file, reusing the digest computed during upload when there is one."""
+    digest = getattr(file, "sha256", None)
+    if digest:
+        return digest
+    sha256 = hashlib.sha256()
+    for chunk in file.chunks():
+        sha256.update(chunk)
+    file.seek(0)
+    file.sha256 = sha256.hexdigest()
+    return file.sha256
+
+
+def content_addressed_name(directory, digest, filename):
+    extension = os.path.splitext(filename or "")[1].lower()
+    if not _EXTENSION_RE.match(extension):
+        extension = ""
+    return f"{directory}/{digest[:2]}/{digest}{extension}"
+
+
+def store_content_addressed(file, directory):
+    """
+    Save `file` as directory/<sha256[:2]>/<sha256><ext> and return the storage
+    name. Identical content is stored once: if the blob already exists the
+    upload is simply dropped. Blobs are immutable, so any number of rows may
+    point at the same name. Temporary uploads on filesystem storage are moved
+    into place rather than copied.
+    """
+    name = content_addressed_name(directory, content_hash(file), file.name)
+    if default_storage.exists(name):
+        return name
+    saved = default_storage.save(name, file)
+    if saved != name:
+        # A concurrent upload of the same content created the blob after our
+        # exists() check and storage picked a free name; drop our copy.
+        default_storage.delete(saved)
+    return name
+
+
+class DiskFile(File):
+    """A file already on local disk; filesystem storage moves it into place instead of copying."""
+
+    def temporary_file_path(self):
+        return self.file.name
+
+
+def write_chunk(path, offset, stream, max_bytes):
+    """
+    Copy `stream` into the file at `path` starting at `offset`, 64 KiB at a
+    time. Returns the number of bytes written, or raises ValueError once the
+    stream goes past `max_bytes`.
+    """
+    written = 0
+    with open(path, "r+b") as part:
+        part.seek(offset)
+        while True:
+            data = stream.read(_COPY_CHUNK_SIZE)
+            if not data:
+                break
+            written += len(data)
+            if written > max_bytes:
+                raise ValueError(f"Chunk exceeds {max_bytes} bytes.")
+            part.write(data)
+    return written
@@ -3,10 +3,12 @@ from rest_framework.routers import DefaultRouter
 from .views import (
     JobListCreateView, CandidateListCreateView, ApplyJobView,
     ResumeUploadView, InterviewSessionCreateView,
-    GeneratedQuestionListView, SubmitAnswerView,
-    FetchPendingTasksView, UpdateTaskStatusView,
-    CandidateSignupView, AdminCreateUserView, LoginView,
-    PasswordResetAPIView, PasswordResetConfirmAPIView,JobViewSet, QuestionBankViewSet, CandidateViewSet, ResumeViewSet
+    GeneratedQuestionListView, SubmitAnswerView, SubmitAnswerBatchView,
+    AnswerUploadCreateView, AnswerUploadView, AnswerUploadFinalizeView,
+    FetchPendingTasksView, ClaimTasksView, UpdateTaskStatusView, wait_for_tasks,
+    WorkerHeartbeatView,
+    CandidateSignupView, AdminCreateUserView, AdminImportUsersView, LoginView,
+    PasswordResetAPIView, PasswordResetConfirmAPIView, ExportView, JobViewSet, QuestionBankViewSet, CandidateViewSet, ResumeViewSet
 )
 router = DefaultRouter()
 router.register(r"admin/jobs", JobViewSet, basename="admin-jobs")
@@ -36,16 +38,28 @@ urlpatterns = [
 
     # Submit answer
     path("answer/submit/", SubmitAnswerView.as_view()),
+    path("answer/submit/batch/", SubmitAnswerBatchView.as_view()),
+
+    # Resumable chunked answer upload
+    path("answer/upload/", AnswerUploadCreateView.as_view()),
+    path("answer/upload/<uuid:upload_id>/", AnswerUploadView.as_view()),
+    path("answer/upload/<uuid:upload_id>/finalize/", AnswerUploadFinalizeView.as_view()),
 
     # Worker queue
     path("tasks/pending/", FetchPendingTasksView.as_view()),
+    path("tasks/claim/", ClaimTasksView.as_view()),
+    path("tasks/wait/", wait_for_tasks),
+    path("tasks/heartbeat/", WorkerHeartbeatView.as_view()),
     path("tasks/<int:pk>/update/", UpdateTaskStatusView.as_view()),
     # Authentication
     path("auth/signup/", CandidateSignupView.as_view(), name="signup"),
     path("auth/admin-create-user/", AdminCreateUserView.as_view(), name="admin-create-user"),
+    path("auth/admin-import-users/", AdminImportUsersView.as_view(), name="admin-import-users"),
     path("auth/login/", LoginView.as_view(), name="login"),
     path("auth/password-reset/", PasswordResetAPIView.as_view(), name="password_reset"),
     path("auth/password-reset-confirm/<uidb64>/<token>/", PasswordResetConfirmAPIView.as_view(), name="password_reset_confirm"),
+    # Streaming exports
+    path("admin/exports/<str:kind>/", ExportView.as_view(), name="admin-export"),
     path("", include(router.urls)),
 
 ]
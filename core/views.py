@@ -1,4 +1,14 @@
-from django.http import HttpResponse
+import io
+import json
+import os
+from contextlib import suppress
+
+from asgiref.sync import sync_to_async
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import transaction
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
+from django.shortcuts import get_object_or_404
+from django.utils import timezone
 from rest_framework import generics, status, viewsets, mixins
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
@@ -12,6 +22,7 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status, permissions
 from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework.exceptions import AuthenticationFailed
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.filters import SearchFilter, OrderingFilter
 from rest_framework.decorators import action
@@ -23,9 +34,29 @@ from .serializers import (
     UserSerializer, LoginSerializer
 )
 from .permissions import IsAdmin
+from .authentication import CachedJWTAuthentication
+from .mail import queue_password_reset_emails
+from .notifier import long_poll, task_notifier
+from .uploads import DiskFile, content_hash, store_content_addressed, write_chunk
+from .fast_serializers import FastListMixin
+from .filters import JobFilter, JobSearchFilter, ResumeFilter, ResumeSearchFilter
+from .pregeneration import schedule_question_generation
+from .pagination import (
+    NewestFirstPagination, OldestFirstPagination, ResumePagination,
+    QuestionBankPagination, TaskQueuePagination,
+)
 
 User = get_user_model()
 
+# Upper bound for worker long-polls on the audio queue.
+MAX_LONG_POLL_SECONDS = 30
+# Storage directory for content-addressed answer audio blobs.
+ANSWER_AUDIO_DIR = "answers/audio"
+# Storage directory for content-addressed resume files.
+RESUME_DIR = "resumes"
+# Retry-After hint while a session's questions are still being prepared.
+QUESTIONS_RETRY_AFTER_SECONDS = 1
+
 def get_tokens_for_user(user):
     refresh = RefreshToken.for_user(user)
     return {"refresh": str(refresh), "access": str(refresh.access_token)}
@@ -43,32 +74,37 @@ class CandidateSignupView(APIView):
 
 class AdminCreateUserView(APIView):
     """
-    Admin creates a recruiter/admin user; the created user gets an unusable password and a password-reset email is sent.
+    Admin creates a recruiter/admin user; the created user gets an unusable password and a password-reset email is queued in the outbox.
     """
     permission_classes = [permissions.IsAuthenticated, IsAdmin]
 
     def post(self, request):
         serializer = AdminCreateUserSerializer(data=request.data)
         if serializer.is_valid():
-            user = serializer.save()
-            # create unusable password and send reset link
-            user.set_unusable_password()
-            user.save()
-
-            # send password reset email programmatically
-            form = PasswordResetForm({"email": user.email})
-            if form.is_valid():
-                # supply request to build absolute URL inside email
-                form.save(
-                    request=request,
-                    use_https=request.is_secure(),
-                    email_template_name="registration/password_reset_email.html",
-                    subject_template_name="registration/password_reset_subject.txt",
-                    from_email=None,
-                )
+            # The user and their reset email are committed together, or neither is
+            with transaction.atomic():
+                user = serializer.save()
+                # create unusable password and send reset link
+                user.set_unusable_password()
+                user.save()
+
+                # PasswordResetForm skips users without a usable password, so queue the email directly
+                queue_password_reset_emails([user], get_current_site(request).domain, request.is_secure())
             return Response(UserSerializer(user).data, status=status.HTTP_201_CREATED)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
+class AdminImportUsersView(APIView):
+    """
+    Admin bulk-provisions users (and candidate profiles) from CSV or NDJSON; users without a
+    password in the file get an unusable one and a queued password-reset email.
+    """
+    permission_classes = [permissions.IsAuthenticated, IsAdmin]
+
+    def post(self, request):
+        return _import_response(
+            request, UserImporter, domain=get_current_site(request).domain, use_https=request.is_secure(),
+        )
+
 class LoginView(APIView):
     permission_classes = [permissions.AllowAny]
 
@@ -91,13 +127,10 @@ class PasswordResetAPIView(APIView):
         email = request.data.get("email")
         form = PasswordResetForm({"email": email})
         if form.is_valid():
-            form.save(
-                request=request,
-                use_https=request.is_secure(),
-                email_template_name="registration/password_reset_email.html",
-                subject_template_name="registration/password_reset_subject.txt",
-                from_email=None,
-            )
+            # Unlike form.save(), this includes users with an unusable password, e.g. an
+            # admin-created account whose first reset email was lost or has expired
+            users = User.objects.filter(email__iexact=form.cleaned_data["email"], is_active=True)
+            queue_password_reset_emails(users, get_current_site(request).domain, request.is_secure())
             return Response({"detail": "Password reset email sent."})
         return Response({"detail": "Invalid email."}, status=status.HTTP_400_BAD_REQUEST)
 
@@ -134,28 +167,31 @@ def index(request):
 from .models import (
     Job, Candidate, CandidateJobMapping, Resume,
     InterviewSession, GeneratedQuestion, CandidateAnswer,
-    AudioProcessingTask
+    AudioProcessingTask, AnswerUpload, answer_upload_dir
 )
 
 from .serializers import (
     JobSerializer, CandidateSerializer, CandidateJobMappingSerializer,
     ResumeSerializer, InterviewSessionSerializer,
-    GeneratedQuestionSerializer, CandidateAnswerSerializer,
-    AudioProcessingTaskSerializer
+    GeneratedQuestionSerializer, CandidateAnswerSerializer, CandidateAnswerBatchItemSerializer,
+    AnswerUploadSerializer,
+    AudioProcessingTaskSerializer, TaskClaimSerializer, WorkerHeartbeatSerializer
 )
 
-class JobListCreateView(generics.ListCreateAPIView):
+class JobListCreateView(FastListMixin, generics.ListCreateAPIView):
     queryset = Job.objects.all()
     serializer_class = JobSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = NewestFirstPagination
 
 # ============================================================
 # CANDIDATE MANAGEMENT
 # ============================================================
-class CandidateListCreateView(generics.ListCreateAPIView):
+class CandidateListCreateView(FastListMixin, generics.ListCreateAPIView):
     queryset = Candidate.objects.all()
     serializer_class = CandidateSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = NewestFirstPagination
 
 # ============================================================
 # APPLY TO JOB
@@ -172,17 +208,44 @@ class ApplyJobView(generics.CreateAPIView):
 from rest_framework.views import APIView
 
 class ResumeUploadView(APIView):
+    """
+    The upload is hashed while it streams to disk. Re-uploading a file the
+    candidate already has returns that resume; a file already parsed for
+    someone else reuses its text and skills. Anything else is stored and
+    left "pending" for the parse_resumes workers, so the request never
+    waits on text extraction.
+    """
     def post(self, request):
         candidate_id = request.data.get("candidate_id")
         file = request.FILES.get("file")
 
         if not file:
             return Response({"error": "File not provided"}, status=400)
+        try:
+            if not Candidate.objects.filter(pk=candidate_id).exists():
+                raise ValueError
+        except (TypeError, ValueError):
+            return Response({"error": "Invalid candidate_id"}, status=400)
+
+        digest = content_hash(file)
+        existing = Resume.objects.filter(candidate_id=candidate_id, content_hash=digest).order_by("-upload_date", "-id").first()
+        if existing is not None:
+            return Response(ResumeSerializer(existing).data)
 
-        resume = Resume.objects.create(
+        resume = Resume(
             candidate_id=candidate_id,
-            resume_file=file
+            resume_file=store_content_addressed(file, RESUME_DIR),
+            content_hash=digest,
         )
+        parsed = (
+            Resume.objects.filter(content_hash=digest, parse_status="done")
+            .order_by("-upload_date", "-id").values("parsed_text", "parsed_skills").first()
+        )
+        if parsed is not None:
+            resume.parsed_text = parsed["parsed_text"]
+            resume.parsed_skills = parsed["parsed_skills"]
+            resume.parse_status = "done"
+        resume.save()
 
         return Response(ResumeSerializer(resume).data)
 
@@ -192,15 +255,45 @@ class ResumeUploadView(APIView):
 class InterviewSessionCreateView(generics.CreateAPIView):
     serializer_class = InterviewSessionSerializer
 
+    def perform_create(self, serializer):
+        # The question set is prepared in the background once the session exists
+        session = serializer.save()
+        transaction.on_commit(lambda: schedule_question_generation(session.pk))
+
 # ============================================================
 # GET QUESTIONS FOR SESSION
 # ============================================================
-class GeneratedQuestionListView(generics.ListAPIView):
+class GeneratedQuestionListView(FastListMixin, generics.ListAPIView):
+    """
+    While the session's questions are still being prepared this answers
+    202 {"status": "pending"} with a Retry-After header instead of a list,
+    and 503 {"status": "failed"} once generation has failed too often to be
+    retried.
+    """
     serializer_class = GeneratedQuestionSerializer
+    pagination_class = OldestFirstPagination
 
     def get_queryset(self):
         session_id = self.kwargs["session_id"]
         return GeneratedQuestion.objects.filter(interview_session=session_id)
+
+    def list(self, request, *args, **kwargs):
+        session = get_object_or_404(
+            InterviewSession.objects.only("questions_status", "questions_failures"), pk=self.kwargs["session_id"],
+        )
+        if session.questions_exhausted:
+            return Response(
+                {"status": "failed", "detail": "Questions could not be prepared."},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+            )
+        if session.questions_status != "ready":
+            schedule_question_generation(session.pk)
+            return Response(
+                {"status": "pending", "detail": "Questions are being prepared."},
+                status=status.HTTP_202_ACCEPTED,
+                headers={"Retry-After": str(QUESTIONS_RETRY_AFTER_SECONDS)},
+            )
+        return super().list(request, *args, **kwargs)
     
 # ============================================================
 # SUBMIT CANDIDATE ANSWER (Audio)
@@ -209,32 +302,321 @@ class SubmitAnswerView(APIView):
     def post(self, request):
         serializer = CandidateAnswerSerializer(data=request.data)
         if serializer.is_valid():
-            answer = serializer.save()
-
-            # Add to processing queue
-            AudioProcessingTask.objects.create(
-                interview_session=answer.interview_session,
-                question=answer.question,
-                audio_file=answer.audio_file
-            )
+            audio = serializer.validated_data.get("audio_file")
+            # One content-addressed blob, shared by the answer and its queue task
+            stored = {"audio_file": store_content_addressed(audio, ANSWER_AUDIO_DIR)} if audio else {}
+            with transaction.atomic():
+                answer = serializer.save(**stored)
+                # Add to processing queue (workers are woken on commit)
+                AudioProcessingTask.objects.enqueue_answers([answer])
 
             return Response({"message": "Answer submitted"}, status=201)
         return Response(serializer.errors, status=400)
 # ============================================================
+# SUBMIT MANY ANSWERS AT ONCE
+# ============================================================
+class SubmitAnswerBatchView(APIView):
+    """
+    POST answer/submit/batch/ with {"answers": [{"interview_session": .., "question": ..}, ...]}.
+    Multipart clients send "answers" as a JSON string and name each item's
+    upload part in "audio_field". Valid items are stored with one bulk INSERT
+    for answers and one for queue tasks; invalid items are reported by index
+    and don't abort the rest of the batch.
+    """
+    max_batch_size = 100
+
+    def post(self, request):
+        items = request.data.get("answers")
+        if isinstance(items, str):
+            try:
+                items = json.loads(items)
+            except ValueError:
+                items = None
+        if not isinstance(items, list) or not items:
+            return Response({"answers": ["Expected a non-empty list."]}, status=400)
+        if len(items) > self.max_batch_size:
+            return Response({"answers": [f"At most {self.max_batch_size} answers per batch."]}, status=400)
+
+        valid, errors = [], []
+        for index, item in enumerate(items):
+            if not isinstance(item, dict):
+                errors.append({"index": index, "errors": {"non_field_errors": ["Expected an object."]}})
+                continue
+            data = {key: value for key, value in item.items() if key != "audio_field"}
+            if item.get("audio_field"):
+                data["audio_file"] = request.FILES.get(item["audio_field"])
+            serializer = CandidateAnswerBatchItemSerializer(data=data)
+            if serializer.is_valid():
+                valid.append((index, serializer.validated_data))
+            else:
+                errors.append({"index": index, "errors": serializer.errors})
+
+        # Check every referenced session/question with two queries for the whole batch.
+        sessions = set(InterviewSession.objects.filter(
+            id__in={data["interview_session"] for _, data in valid}
+        ).values_list("id", flat=True))
+        question_sessions = dict(GeneratedQuestion.objects.filter(
+            id__in={data["question"] for _, data in valid}
+        ).values_list("id", "interview_session_id"))
+
+        answers, indexes = [], []
+        for index, data in valid:
+            session_id, question_id = data["interview_session"], data["question"]
+            if session_id not in sessions:
+                errors.append({"index": index, "errors": {"interview_session": [f'Invalid pk "{session_id}" - object does not exist.']}})
+            elif question_id not in question_sessions:
+                errors.append({"index": index, "errors": {"question": [f'Invalid pk "{question_id}" - object does not exist.']}})
+            elif question_sessions[question_id] != session_id:
+                errors.append({"index": index, "errors": {"question": ["Question does not belong to this interview session."]}})
+            else:
+                audio = data.get("audio_file")
+                answers.append(CandidateAnswer(
+                    interview_session_id=session_id, question_id=question_id,
+                    audio_file=store_content_addressed(audio, ANSWER_AUDIO_DIR) if audio else None,
+                ))
+                indexes.append(index)
+
+        with transaction.atomic():
+            answers = CandidateAnswer.objects.bulk_create(answers)
+            AudioProcessingTask.objects.enqueue_answers(answers)
+
+        errors.sort(key=lambda error: error["index"])
+        created = [{"index": index, "id": answer.id} for index, answer in zip(indexes, answers)]
+        if not errors:
+            response_status = status.HTTP_201_CREATED
+        elif created:
+            response_status = status.HTTP_207_MULTI_STATUS
+        else:
+            response_status = status.HTTP_400_BAD_REQUEST
+        return Response({"created": created, "errors": errors}, status=response_status)
+# ============================================================
+# RESUMABLE CHUNKED ANSWER UPLOAD
+# ============================================================
+class AnswerUploadCreateView(generics.CreateAPIView):
+    """
+    POST answer/upload/ starts a resumable upload. The client then PATCHes
+    raw chunks to answer/upload/<id>/ with an Upload-Offset header, can GET
+    the same URL to learn where to resume, and POSTs .../finalize/ at the end.
+    Uploads idle for ANSWER_UPLOAD_TTL seconds expire (410).
+    """
+    serializer_class = AnswerUploadSerializer
+
+    def perform_create(self, serializer):
+        upload = serializer.save()
+        os.makedirs(answer_upload_dir(), exist_ok=True)
+        open(upload.part_path, "wb").close()
+
+
+def _expired_response():
+    return Response({"detail": "Upload expired."}, status=status.HTTP_410_GONE)
+
+
+class AnswerUploadView(APIView):
+    max_chunk_bytes = 8 * 1024 * 1024
+
+    def get(self, request, upload_id):
+        upload = get_object_or_404(AnswerUpload.objects.for_user(request.user), pk=upload_id)
+        return Response(AnswerUploadSerializer(upload).data, headers={"Upload-Offset": str(upload.received_bytes)})
+
+    def patch(self, request, upload_id):
+        upload = get_object_or_404(AnswerUpload.objects.for_user(request.user), pk=upload_id)
+        if upload.answer_id:
+            return Response({"detail": "Upload already finalized."}, status=status.HTTP_409_CONFLICT)
+        if upload.is_expired:
+            return _expired_response()
+        try:
+            offset = int(request.headers["Upload-Offset"])
+        except (KeyError, ValueError):
+            return Response({"detail": "Upload-Offset header is required."}, status=400)
+        if offset != upload.received_bytes:
+            return Response(
+                {"detail": "Offset mismatch; resume from received_bytes.", "received_bytes": upload.received_bytes},
+                status=status.HTTP_409_CONFLICT,
+                headers={"Upload-Offset": str(upload.received_bytes)},
+            )
+        max_bytes = self.max_chunk_bytes
+        if upload.total_size is not None:
+            max_bytes = min(max_bytes, upload.total_size - offset)
+        try:
+            # Stream the raw body to disk; it is never held in memory as a whole.
+            written = write_chunk(upload.part_path, offset, request.stream or io.BytesIO(), max_bytes)
+        except FileNotFoundError:
+            # Finalized or cleaned up since we read the row
+            upload.refresh_from_db()
+            if upload.answer_id:
+                return Response({"detail": "Upload already finalized."}, status=status.HTTP_409_CONFLICT)
+            return _expired_response()
+        except ValueError as exc:
+            return Response({"detail": str(exc)}, status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+
+        # Only advance if nobody else did in the meantime; a retried chunk
+        # simply overwrites the same byte range.
+        advanced = AnswerUpload.objects.filter(pk=upload.pk, received_bytes=offset).update(
+            received_bytes=offset + written, updated_at=timezone.now(),
+        )
+        upload.refresh_from_db()
+        if not advanced:
+            return Response(
+                {"detail": "Concurrent chunk upload.", "received_bytes": upload.received_bytes},
+                status=status.HTTP_409_CONFLICT,
+            )
+        return Response(AnswerUploadSerializer(upload).data, headers={"Upload-Offset": str(upload.received_bytes)})
+
+
+class AnswerUploadFinalizeView(APIView):
+    """Turn a completed upload into a CandidateAnswer and queue it, atomically and idempotently."""
+
+    def post(self, request, upload_id):
+        upload = get_object_or_404(AnswerUpload.objects.for_user(request.user), pk=upload_id)
+        if upload.answer_id:
+            return Response({"message": "Answer submitted", "answer": upload.answer_id})
+        if upload.is_expired:
+            return _expired_response()
+        if upload.total_size is not None and upload.received_bytes != upload.total_size:
+            return Response(
+                {"detail": "Upload incomplete.", "received_bytes": upload.received_bytes}, status=400,
+            )
+
+        try:
+            # Drop anything past the acknowledged offset (e.g. a rejected chunk).
+            os.truncate(upload.part_path, upload.received_bytes)
+            part = DiskFile(open(upload.part_path, "rb"), name=upload.filename or "audio")
+        except FileNotFoundError:
+            # A concurrent finalize already stored and removed it, or cleanup did.
+            upload.refresh_from_db()
+            if upload.answer_id:
+                return Response({"message": "Answer submitted", "answer": upload.answer_id})
+            return _expired_response()
+        with part:
+            audio_name = store_content_addressed(part, ANSWER_AUDIO_DIR)
+
+        with transaction.atomic():
+            answer = CandidateAnswer.objects.create(
+                interview_session_id=upload.interview_session_id,
+                question_id=upload.question_id,
+                audio_file=audio_name,
+            )
+            claimed = AnswerUpload.objects.filter(pk=upload.pk, answer__isnull=True).update(answer=answer)
+            if claimed:
+                AudioProcessingTask.objects.enqueue_answers([answer])
+            else:
+                # A concurrent finalize won the race; keep its answer.
+                transaction.set_rollback(True)
+        if claimed:
+            with suppress(FileNotFoundError):
+                os.remove(upload.part_path)
+        upload.refresh_from_db()
+        return Response({"message": "Answer submitted", "answer": upload.answer_id}, status=201 if claimed else 200)
+# ============================================================
 # AI WORKER — FETCH PENDING AUDIO TASKS
 # ============================================================
+def _long_poll_seconds(value):
+    try:
+        return min(max(float(value or 0), 0), MAX_LONG_POLL_SECONDS)
+    except (TypeError, ValueError):
+        return 0
+
+
 class FetchPendingTasksView(generics.ListAPIView):
+    """
+    GET tasks/pending/?wait=25 holds the request until a task is pending
+    or the wait runs out, instead of returning an empty list straight away.
+    """
     serializer_class = AudioProcessingTaskSerializer
+    pagination_class = TaskQueuePagination
 
     def get_queryset(self):
-        return AudioProcessingTask.objects.filter(task_status="pending")
+        return AudioProcessingTask.objects.filter(task_status="pending", available_at__lte=timezone.now())
+
+    def list(self, request, *args, **kwargs):
+        wait = _long_poll_seconds(request.query_params.get("wait"))
+        page = long_poll(lambda: self.paginate_queryset(self.get_queryset()), wait)
+        return self.get_paginated_response(self.get_serializer(page, many=True).data)
+
+
+async def wait_for_tasks(request):
+    """
+    GET tasks/wait/?timeout=25 — ASGI-native long-poll.
+    Parks on the in-process notifier without holding a worker thread and
+    answers {"available": bool}; the worker then claims via tasks/claim/.
+    """
+    try:
+        auth = await sync_to_async(CachedJWTAuthentication().authenticate)(request)
+    except AuthenticationFailed as exc:
+        return JsonResponse({"detail": str(exc.detail)}, status=401)
+    if auth is None:
+        return JsonResponse({"detail": "Authentication credentials were not provided."}, status=401)
+
+    timeout = _long_poll_seconds(request.GET.get("timeout"))
+    since = task_notifier.version
+    available = await AudioProcessingTask.objects.claimable().aexists()
+    if not available and timeout:
+        await task_notifier.async_wait(since, timeout)
+        available = await AudioProcessingTask.objects.claimable().aexists()
+    return JsonResponse({"available": available})
+# ============================================================
+# AI WORKER — CLAIM A BATCH OF AUDIO TASKS
+# ============================================================
+class ClaimTasksView(APIView):
+    """
+    Atomically lease up to `limit` pending tasks to one worker so that
+    parallel workers never process the same audio twice. With `wait` set the
+    request long-polls until something is claimable.
+    """
+    def post(self, request):
+        serializer = TaskClaimSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        params = dict(serializer.validated_data)
+        wait = params.pop("wait")
+        tasks = long_poll(lambda: AudioProcessingTask.objects.claim(**params), wait)
+        return Response(AudioProcessingTaskSerializer(tasks, many=True).data)
+# ============================================================
+# AI WORKER — HEARTBEAT
+# ============================================================
+class WorkerHeartbeatView(APIView):
+    """
+    Workers call this periodically while processing; it extends the leases
+    on all their tasks. Tasks of a worker that stops calling are re-queued
+    by the `reap_audio_tasks` command.
+    """
+    def post(self, request):
+        serializer = WorkerHeartbeatSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        extended = AudioProcessingTask.objects.heartbeat(**serializer.validated_data)
+        return Response({"leases_extended": extended})
 # ============================================================
 # UPDATE AUDIO TASK STATUS
 # ============================================================
 class UpdateTaskStatusView(generics.UpdateAPIView):
+    """
+    Workers report the outcome of a task here. Reporting "failed" (with an
+    optional `last_error`) schedules a retry with backoff, or dead-letters
+    the task once it has used up its attempts. "done"/"failed" must come with
+    the reporting `worker_id` and are refused with 409 unless that worker
+    still holds the task's lease.
+    """
     queryset = AudioProcessingTask.objects.all()
     serializer_class = AudioProcessingTaskSerializer
 
+    def update(self, request, *args, **kwargs):
+        if request.data.get("task_status") not in ("done", "failed"):
+            return super().update(request, *args, **kwargs)
+        with transaction.atomic():
+            task = get_object_or_404(AudioProcessingTask.objects.select_for_update(), pk=kwargs["pk"])
+            if task.task_status != "processing" or not task.worker_id or task.worker_id != request.data.get("worker_id"):
+                return Response(
+                    {"detail": "Task is not leased to this worker; it may have been re-queued."},
+                    status=status.HTTP_409_CONFLICT,
+                )
+            return super().update(request, *args, **kwargs)
+
+    def perform_update(self, serializer):
+        released = {"worker_id": "", "lease_expires_at": None} if serializer.validated_data.get("task_status") == "done" else {}
+        task = serializer.save(**released)
+        if task.task_status == "failed":
+            AudioProcessingTask.objects.filter(pk=task.pk).retry_or_dead_letter(task.last_error)
+            task.refresh_from_db()
+
 from .models import Job, QuestionBank, Candidate, Resume, CandidateJobMapping
 from .serializers import (
     JobSerializer,
@@ -243,24 +625,99 @@ from .serializers import (
     ResumeSerializer,
     CandidateJobMappingSerializer,
 )
-from .permissions import IsAdmin
+from .permissions import IsAdmin, IsRecruiter
+from .matching import skill_matcher
+from .question_ranking import question_ranker
+from .near_duplicates import DUPLICATE_THRESHOLD, duplicate_questions
+from .exports import EXPORTS, FORMATS as EXPORT_FORMATS, stream as export_stream
+from .imports import FORMATS as IMPORT_FORMATS, JobImporter, QuestionImporter, UserImporter, guess_format, read_records
+
+# Default and maximum number of results from the `matches` actions.
+DEFAULT_MATCH_LIMIT = 20
+MAX_MATCH_LIMIT = 100
+
+
+def _match_limit(value):
+    try:
+        return min(max(int(value), 1), MAX_MATCH_LIMIT)
+    except (TypeError, ValueError):
+        return DEFAULT_MATCH_LIMIT
+
+
+def _match_response(matches, queryset, serializer_class, key):
+    objects = queryset.in_bulk([match["id"] for match in matches])
+    results = []
+    for match in matches:
+        obj = objects.get(match.pop("id"))
+        if obj is not None:
+            results.append({key: serializer_class(obj).data, **match})
+    return Response(results)
+
+
+def _import_response(request, importer_class, **importer_options):
+    """
+    Shared body of the bulk `import` actions: the file comes either as the
+    multipart field "file" or as the raw request body, in CSV or NDJSON
+    (from ?file_format=, the file name or the content type).
+    """
+    if request.content_type.startswith("multipart/"):
+        stream = request.FILES.get("file")
+        if stream is None:
+            return Response({"detail": "File not provided."}, status=400)
+        name = stream.name
+    else:
+        stream, name = request.stream, ""
+    file_format = request.query_params.get("file_format") or guess_format(name, request.content_type)
+    if file_format not in IMPORT_FORMATS or stream is None:
+        return Response({"detail": "Send a CSV or NDJSON body, or set ?file_format=csv|ndjson."}, status=400)
+
+    report = importer_class(user=request.user, **importer_options).run(read_records(stream, file_format))
+    if not report["error_count"]:
+        response_status = status.HTTP_200_OK
+    elif report["created"] or report["updated"]:
+        response_status = status.HTTP_207_MULTI_STATUS
+    else:
+        response_status = status.HTTP_400_BAD_REQUEST
+    return Response(report, status=response_status)
 
 
 # -------------------------
 # Job CRUD for Admin
 # -------------------------
-class JobViewSet(viewsets.ModelViewSet):
+class JobViewSet(FastListMixin, viewsets.ModelViewSet):
     queryset = Job.objects.all().order_by("-created_at")
     serializer_class = JobSerializer
     permission_classes = [IsAuthenticated, IsAdmin]
-    filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
-    filterset_fields = ["experience_level"]
-    search_fields = ["job_title", "job_code", "description", "skills_required"]
+    pagination_class = NewestFirstPagination
+    filter_backends = [DjangoFilterBackend, JobSearchFilter, OrderingFilter]
+    filterset_class = JobFilter
+    # Skills match exactly on the normalized skill table ("java" != "javascript");
+    # JobSearchFilter also matches whole multi-word skill names
+    search_fields = ["job_title", "job_code", "description", "=skills__name"]
     ordering_fields = ["created_at", "experience_level"]
+    ordering = ("-created_at", "-id")
 
     def perform_create(self, serializer):
         serializer.save(created_by=self.request.user)
 
+    @action(detail=True, methods=["get"])
+    def matches(self, request, pk=None):
+        """
+        GET /api/admin/jobs/{pk}/matches/?limit=20
+        best candidates for this job, highest score first
+        """
+        job = self.get_object()
+        matches = skill_matcher.candidates_for_job(job.pk, _match_limit(request.query_params.get("limit")))
+        return _match_response(matches, Candidate.objects.all(), CandidateSerializer, "candidate")
+
+    @action(detail=False, methods=["post"], url_path="import")
+    def import_records(self, request):
+        """
+        POST /api/admin/jobs/import/
+        bulk create/update jobs from CSV or NDJSON, upserting on job_code
+        """
+        return _import_response(request, JobImporter)
+
 
 # -------------------------
 # Question Bank CRUD for Admin
@@ -269,15 +726,104 @@ class QuestionBankViewSet(viewsets.ModelViewSet):
     queryset = QuestionBank.objects.all().order_by("-id")
     serializer_class = QuestionBankSerializer
     permission_classes = [IsAuthenticated, IsAdmin]
+    pagination_class = QuestionBankPagination
     filter_backends = [DjangoFilterBackend, SearchFilter]
     filterset_fields = ["job", "category", "difficulty_level"]
     search_fields = ["question_text"]
 
+    def create(self, request, *args, **kwargs):
+        response = super().create(request, *args, **kwargs)
+        self._flag_near_duplicates(response)
+        return response
+
+    def update(self, request, *args, **kwargs):
+        response = super().update(request, *args, **kwargs)
+        self._flag_near_duplicates(response)
+        return response
+
+    @action(detail=False, methods=["post"], url_path="import")
+    def import_records(self, request):
+        """
+        POST /api/admin/questions/import/
+        bulk create questions from CSV or NDJSON
+        """
+        return _import_response(request, QuestionImporter)
+
+    def _flag_near_duplicates(self, response):
+        """Saving is never blocked; similar existing questions are listed in `near_duplicates`."""
+        matches = duplicate_questions.find(response.data["question_text"], exclude=response.data["id"])
+        texts = dict(QuestionBank.objects.filter(id__in=[m[0] for m in matches]).values_list("id", "question_text"))
+        response.data["near_duplicates"] = [
+            {"id": question_id, "question_text": texts[question_id], "similarity": round(score, 3)}
+            for question_id, score in matches
+            if question_id in texts
+        ]
+
+    @action(detail=False, methods=["get"])
+    def duplicates(self, request):
+        """
+        GET /api/admin/questions/duplicates/?threshold=0.7&limit=20
+        groups of near-duplicate questions across the whole bank, largest first;
+        `count` is the total number of groups, manage.py report_duplicate_questions
+        lists them all
+        """
+        try:
+            threshold = min(max(float(request.query_params.get("threshold", DUPLICATE_THRESHOLD)), 0.1), 1.0)
+        except ValueError:
+            return Response({"detail": "threshold must be a number."}, status=400)
+        clusters = duplicate_questions.clusters(threshold)
+        shown = clusters[:_match_limit(request.query_params.get("limit"))]
+        texts = dict(
+            QuestionBank.objects.filter(id__in=[i for group in shown for i in group])
+            .values_list("id", "question_text")
+        )
+        return Response({
+            "threshold": threshold,
+            "count": len(clusters),
+            "clusters": [
+                [{"id": question_id, "question_text": texts[question_id]} for question_id in group if question_id in texts]
+                for group in shown
+            ],
+        })
+
+    @action(detail=False, methods=["get"])
+    def ranked(self, request):
+        """
+        GET /api/admin/questions/ranked/?resume=<id> (or candidate=<id>, q=<text>)
+        bank questions ranked by BM25 relevance to the resume's skills and text;
+        job, category, difficulty_level and limit narrow the result
+        """
+        params = request.query_params
+        resume = None
+        try:
+            if params.get("resume"):
+                resume = get_object_or_404(Resume, pk=int(params["resume"]))
+            elif params.get("candidate"):
+                resume = (
+                    Resume.objects.filter(candidate_id=int(params["candidate"]))
+                    .order_by("-upload_date", "-id").first()
+                )
+                if resume is None:
+                    return Response({"detail": "Candidate has no resume."}, status=404)
+            filters = {
+                "job": int(params["job"]) if params.get("job") else None,
+                "category": params.get("category") or None,
+                "difficulty": int(params["difficulty_level"]) if params.get("difficulty_level") else None,
+            }
+        except ValueError:
+            return Response({"detail": "resume, candidate, job and difficulty_level must be integers."}, status=400)
+        if resume is None and not params.get("q"):
+            return Response({"detail": "Pass resume, candidate or q."}, status=400)
+
+        query = question_ranker.query_for_resume(resume, params.get("q", ""))
+        ranked = question_ranker.rank(query, _match_limit(params.get("limit")), **filters)
+        return _match_response(ranked, QuestionBank.objects.all(), QuestionBankSerializer, "question")
+
 
 # -------------------------
 # Candidate list / details for Admin
 # -------------------------
-class CandidateViewSet(viewsets.ReadOnlyModelViewSet):
+class CandidateViewSet(FastListMixin, viewsets.ReadOnlyModelViewSet):
     """
     Admin can list and view candidate profiles.
     For POC we allow ReadOnly. If admins should edit, change to ModelViewSet.
@@ -285,9 +831,11 @@ class CandidateViewSet(viewsets.ReadOnlyModelViewSet):
     queryset = Candidate.objects.select_related("candidate_user").all().order_by("-created_at")
     serializer_class = CandidateSerializer
     permission_classes = [IsAuthenticated, IsAdmin]
+    pagination_class = NewestFirstPagination
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
     search_fields = ["full_name", "email", "phone"]
     filterset_fields = ["status", "experience_years"]
+    ordering = ("-created_at", "-id")
 
     @action(detail=True, methods=["get"])
     def applications(self, request, pk=None):
@@ -300,16 +848,55 @@ class CandidateViewSet(viewsets.ReadOnlyModelViewSet):
         serializer = CandidateJobMappingSerializer(apps, many=True)
         return Response(serializer.data)
 
+    @action(detail=True, methods=["get"])
+    def matches(self, request, pk=None):
+        """
+        GET /api/admin/candidates/{pk}/matches/?limit=20
+        best jobs for this candidate, highest score first
+        """
+        candidate = self.get_object()
+        matches = skill_matcher.jobs_for_candidate(candidate.pk, _match_limit(request.query_params.get("limit")))
+        return _match_response(matches, Job.objects.all(), JobSerializer, "job")
+
+
+# -------------------------
+# Streaming exports for Admin/Recruiter
+# -------------------------
+class ExportView(APIView):
+    """
+    GET /api/admin/exports/{candidates|applications|sessions}/?file_format=csv|ndjson
+    streams every matching row; optional exact filters such as ?status=, ?job=, ?candidate=
+    """
+    permission_classes = [IsAuthenticated, IsAdmin | IsRecruiter]
+
+    def get(self, request, kind):
+        export = EXPORTS.get(kind)
+        if export is None:
+            return Response({"detail": f"Unknown export; expected one of {', '.join(EXPORTS)}."}, status=404)
+        file_format = request.query_params.get("file_format", "csv")
+        if file_format not in EXPORT_FORMATS:
+            return Response({"detail": "Set ?file_format=csv|ndjson."}, status=400)
+        try:
+            chunks = export_stream(export, file_format, request.query_params)
+        except (ValueError, DjangoValidationError) as exc:
+            return Response({"detail": f"Invalid filter: {exc}"}, status=400)
+        response = StreamingHttpResponse(chunks, content_type=EXPORT_FORMATS[file_format])
+        response["Content-Disposition"] = f'attachment; filename="{kind}.{file_format}"'
+        return response
+
 
 # -------------------------
 # Resume upload / list for Admin
 # -------------------------
-class ResumeViewSet(viewsets.ModelViewSet):
+class ResumeViewSet(FastListMixin, viewsets.ModelViewSet):
     queryset = Resume.objects.all().order_by("-upload_date")
     serializer_class = ResumeSerializer
     permission_classes = [IsAuthenticated, IsAdmin]
-    filter_backends = [DjangoFilterBackend, SearchFilter]
-    search_fields = ["candidate__full_name", "candidate__email", "parsed_text"]
+    pagination_class = ResumePagination
+    # parsed_text is searched through the full-text index, see ResumeSearchFilter
+    filter_backends = [DjangoFilterBackend, ResumeSearchFilter]
+    filterset_class = ResumeFilter
+    search_fields = ["candidate__full_name", "candidate__email"]
 
     def perform_create(self, serializer):
         # make sure file upload is associated to a valid candidate